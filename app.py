@@ -15,6 +15,7 @@ import schedule
 import time
 
 from detik_crawler import DetikCrawler
+from driver_pool import create_driver_pool
 from data_processor import DataProcessor
 from config import ConfigManager
 from logger import get_logger
@@ -26,6 +27,22 @@ app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-change-in-product
 logging.basicConfig(level=logging.INFO)
 logger = get_logger()
 
+def prewarm_driver_pool():
+    """在后台预热WebDriver池，第一个爬取任务（包括定时任务）也不必等待Chrome冷启动
+    
+    由进程启动入口调用（python app.py或gunicorn.conf.py的post_worker_init），导入模块时不启动浏览器
+    """
+    if not driver_pool:
+        return
+    try:
+        if DetikCrawler(ConfigManager(), driver_pool=driver_pool).prewarm_driver_pool():
+            logger.info("已开始在后台预热WebDriver池")
+    except Exception as e:
+        logger.warning(f"WebDriver池预热失败: {e}")
+
+# 常驻WebDriver池，爬取任务复用已启动的浏览器
+driver_pool = create_driver_pool(ConfigManager())
+
 def add_task_log(message, level='info'):
     """添加日志到任务状态"""
     from datetime import datetime
@@ -175,7 +192,7 @@ def run_crawler(target_date):
         try:
             task_status['message'] = '🚀 正在初始化智能爬虫...'
             add_task_log("🌐 初始化DetikCrawler（支持Chrome和requests双模式）")
-            crawler = DetikCrawler(config)
+            crawler = DetikCrawler(config, driver_pool=driver_pool)
             task_status['progress'] = 20
             add_task_log("✅ DetikCrawler初始化成功")
         except Exception as e:
@@ -332,7 +349,7 @@ def daily_auto_crawl():
         logger.info(f"开始执行每日自动爬取任务，目标日期: {yesterday}")
         
         config = ConfigManager()
-        crawler = DetikCrawler(config)
+        crawler = DetikCrawler(config, driver_pool=driver_pool)
         processor = DataProcessor(config)
         
         # 爬取新闻
@@ -390,6 +407,8 @@ if __name__ == '__main__':
     else:
         logger.info("本地环境：跳过定时任务设置")
     
+    prewarm_driver_pool()
+    
     # 运行应用
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+asyncio爬取引擎模块
+使用aiohttp非阻塞HTTP完成索引分页和文章下载，
+所有请求共享同一个连接池，单进程即可保持大量并发请求
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import List, Dict, Optional
+from http_cache import ResponseCache
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp为可选依赖
+    aiohttp = None
+
+
+class AsyncCrawlEngine:
+    """基于asyncio的爬取引擎
+    
+    复用DetikCrawler的解析逻辑，只替换网络层，
+    返回与requests模式相同结构的新闻数据列表。
+    """
+    
+    def __init__(self, crawler):
+        """初始化async引擎
+        
+        Args:
+            crawler: DetikCrawler实例（提供配置、日志、解析方法）
+        """
+        self.crawler = crawler
+        self.logger = crawler.logger
+        self.base_url = crawler.base_url
+        self.request_timeout = crawler.request_timeout
+        self.rate_limiter = crawler.rate_limiter
+        self.retry_policy = crawler.retry_policy
+        self.index_retry_policy = crawler.index_retry_policy
+        self.concurrency = crawler.concurrency
+        self.max_concurrency = max(1, crawler.config.get_async_max_concurrency())
+    
+    @staticmethod
+    def is_available() -> bool:
+        """aiohttp是否可用"""
+        return aiohttp is not None
+    
+    def crawl(self, target_date: str) -> List[Dict]:
+        """爬取指定日期的新闻数据
+        
+        Args:
+            target_date: 目标日期，格式：YYYY-MM-DD
+        
+        Returns:
+            新闻数据列表
+        """
+        return asyncio.run(self._crawl(target_date))
+    
+    async def _crawl(self, target_date: str) -> List[Dict]:
+        """async爬取主流程"""
+        keep_alive = self.crawler.config.get_http_keep_alive()
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.max_concurrency,
+            ttl_dns_cache=300,
+            force_close=not keep_alive,
+            keepalive_timeout=30 if keep_alive else None
+        )
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        headers = dict(self.crawler.session.headers)
+        
+        url_queue = asyncio.Queue(maxsize=max(1, self.crawler.config.get_pipeline_queue_size()))
+        
+        # 统计新建连接数，与requests模式共用传输统计
+        stats = self.crawler.transport.stats
+        trace_config = aiohttp.TraceConfig()
+        
+        async def on_connection_create_end(session, context, params):
+            stats.record_connection()
+        
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers,
+                                         trace_configs=[trace_config]) as session:
+            # 发现与抓取流水线：翻页协程产出URL的同时worker协程开始下载文章
+            fetch_task = asyncio.create_task(self._fetch_articles(session, url_queue))
+            try:
+                discovered = await self._get_news_urls(session, target_date, url_queue)
+                await url_queue.put(None)
+                news_data = await fetch_task
+            finally:
+                # 翻页出错或被取消时停止抓取协程，会话关闭前不留仍在运行的请求；
+                # 未完成的URL仍在crawl_state中，由备用引擎继续抓取
+                if not fetch_task.done():
+                    fetch_task.cancel()
+                    await asyncio.gather(fetch_task, return_exceptions=True)
+        
+        if not discovered:
+            self.logger.warning(f"未找到 {target_date} 的新闻链接")
+            return []
+        
+        self.logger.info(f"async模式爬取完成，共获取 {len(news_data)} 篇新闻")
+        return news_data
+    
+    async def _get(self, session, url: str, allow_cached: bool = False, use_cache: bool = True) -> str:
+        """发起一次GET请求并返回按响应头解码的HTML（与同步模式共用磁盘响应缓存，索引页传入use_cache=False）"""
+        cache = self.crawler.response_cache if use_cache else None
+        cached = cache.get(url) if cache else None
+        if cached and allow_cached:
+            cache.record('hit')
+            return self._decode_cached(cached)
+        
+        headers = ResponseCache.conditional_headers(cached[0]) if cached else None
+        
+        await self.rate_limiter.acquire_async(url)
+        await self.concurrency.acquire_async()
+        start = time.monotonic()
+        try:
+            async with session.get(url, headers=headers) as response:
+                content = await response.read()
+                # aiohttp已自动解压，压缩后的大小取自Content-Length（分块传输时没有该头）
+                wire_bytes = response.content_length if response.headers.get('Content-Encoding') else None
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            self.concurrency.release(timed_out=True)
+            raise
+        except BaseException:
+            # 包括请求中途被取消（CancelledError），名额必须归还
+            self.concurrency.release()
+            raise
+        
+        self.concurrency.release(latency=time.monotonic() - start, status_code=response.status)
+        self.crawler.transport.stats.record(wire_bytes or len(content), len(content))
+        
+        if cache:
+            if cached and response.status == 304:
+                cache.record('revalidated')
+                cache.touch(url)
+                return self._decode_cached(cached)
+            cache.record('miss')
+            cache.put(url, response.status, response.headers, content)
+        
+        response.raise_for_status()
+        return self.crawler.html_parser.decode(content, response.headers.get('Content-Type'))
+    
+    def _decode_cached(self, cached) -> str:
+        """解码缓存的响应内容（使用缓存的Content-Type头）"""
+        meta, body = cached
+        return self.crawler.html_parser.decode(body, meta.get('headers', {}).get('Content-Type'))
+    
+    async def _parse(self, func, *args):
+        """在线程池中执行HTML解析，避免阻塞事件循环"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+    
+    async def _get_news_urls(self, session, target_date: str, url_queue: asyncio.Queue) -> int:
+        """分页发现指定日期的新闻URL并放入队列（与requests模式的终止规则一致）
+        
+        Returns:
+            发现的新闻URL数量（包括之前的模式已发现的）
+        """
+        state = self.crawler.crawl_state
+        # 先抓取之前的模式已发现但未抓取的URL
+        for news_url in state.pending_urls():
+            await url_queue.put(news_url)
+        if state.discovery_done:
+            return len(state.urls)
+        
+        target_date_obj = datetime.strptime(target_date, '%Y-%m-%d')
+        # 历史日期的起始页定位使用同步探测，放到线程池中执行
+        loop = asyncio.get_running_loop()
+        page = await loop.run_in_executor(
+            None, state.resume_page, 'async',
+            lambda: self.crawler._locate_start_page(target_date_obj, self.crawler._probe_index_page_with_requests)
+        )
+        
+        self.logger.info(f"开始使用async模式爬取 {target_date} 的新闻，从第{page}页开始")
+        
+        while True:
+            url = f"{self.base_url}/indeks?page={page}"
+            self.logger.info(f"正在爬取第 {page} 页: {url}")
+            
+            try:
+                # 定位阶段已探测过的页面直接复用
+                content = self.crawler._probed_pages.pop(page, None)
+                if content is None:
+                    content = await self.index_retry_policy.call_async(
+                        lambda attempt: self._get(session, url, use_cache=False), f"爬取第 {page} 页",
+                        wait=self.crawler._retry_wait(url)
+                    )
+                    soup = await self._parse(self.crawler._parse_index_html, content)
+                    await self._parse(self.crawler._observe_index_page, page, soup)
+                else:
+                    soup = await self._parse(self.crawler._parse_index_html, content)
+                page_urls = await self._parse(self.crawler._extract_news_urls_with_requests, soup, target_date_obj)
+                state.page_done(page)
+            except Exception as e:
+                # 重试策略已处理临时错误，到这里说明该页无法获取，跳过该页继续翻页
+                if not self.crawler._skip_failed_index_page(page, e):
+                    break
+            else:
+                if not page_urls:
+                    state.consecutive_empty_pages += 1
+                    self.logger.info(f"第 {page} 页没有找到目标日期的新闻")
+                    
+                    if state.found_target_news:
+                        self.logger.info("已找到目标日期新闻后出现空页，说明已过目标日期，停止爬取")
+                        break
+                    
+                    if state.consecutive_empty_pages >= 20:
+                        self.logger.info(f"连续{state.consecutive_empty_pages}页没有找到目标日期的新闻，停止爬取")
+                        break
+                else:
+                    state.consecutive_empty_pages = 0
+                    state.found_target_news = True
+                    new_urls = state.add_urls(page_urls)
+                    for news_url in new_urls:
+                        await url_queue.put(news_url)
+                    self.logger.info(f"第 {page} 页找到 {len(new_urls)} 个目标日期的新闻链接")
+            
+            page += 1
+            
+            # 安全限制：最多爬取50页
+            if page - state.start_page >= 50:
+                self.logger.info("已达到最大页面数限制（50页），停止爬取")
+                break
+        
+        state.discovery_done = True
+        self.logger.info(f"async模式共找到 {len(state.urls)} 个新闻链接")
+        self.crawler.page_offset_model.save()
+        return len(state.urls)
+    
+    async def _fetch_articles(self, session, url_queue: asyncio.Queue) -> List[Dict]:
+        """固定数量的worker协程从队列消费URL并下载文章，结果保持发现顺序
+        
+        队列中的None表示发现阶段结束。
+        """
+        crawl_state = self.crawler.crawl_state
+        state = {'next_index': 0, 'done': False}
+        
+        async def worker():
+            while not state['done']:
+                url = await url_queue.get()
+                if url is None:
+                    # 结束标记放回队列，通知其他worker
+                    state['done'] = True
+                    url_queue.put_nowait(None)
+                    return
+                if not crawl_state.claim(url):
+                    continue
+                
+                index = state['next_index']
+                state['next_index'] += 1
+                try:
+                    article_data = await self._crawl_article(session, url)
+                except asyncio.CancelledError:
+                    # 被取消的抓取交还给备用引擎重新尝试
+                    crawl_state.unclaim(url)
+                    raise
+                crawl_state.record_article(url, article_data)
+                if article_data:
+                    self.logger.info(f"已完成第 {index + 1} 篇新闻 (并发上限 {self.concurrency.current_limit}): {url}")
+                else:
+                    self.logger.warning(f"爬取新闻失败: {url}")
+        
+        self.logger.info(f"启动 {self.max_concurrency} 个抓取协程，当前并发上限: {self.concurrency.current_limit}")
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+        self.logger.info(f"文章抓取结束，最终并发上限: {self.concurrency.current_limit}")
+        
+        return crawl_state.results()
+    
+    async def _crawl_article(self, session, url: str) -> Optional[Dict]:
+        """下载并解析单篇新闻文章"""
+        if not url.startswith('https://news.detik.com/berita'):
+            self.logger.info(f"跳过不符合条件的链接: {url}")
+            return None
+        
+        # 只有下载失败才重试，解析失败是确定性的，不重新下载
+        try:
+            content = await self.retry_policy.call_async(
+                lambda attempt: self._get(session, url, allow_cached=self.crawler.use_cached_articles),
+                f"下载文章 {url}", wait=self.crawler._retry_wait(url)
+            )
+        except Exception:
+            return None
+        return await self._parse(self.crawler._parse_article_with_requests, url, content)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Chrome网络层优化模块
+通过DevTools协议在网络层拦截索引页不需要的资源（图片、字体、媒体、广告和跟踪脚本），
+并统计每页的传输字节数、被拦截的请求数、加载时间和等待就绪的时间；
+有不拦截资源加载的基准样本时，同时统计每页相对基准节省的字节数和加载时间
+"""
+
+import json
+import threading
+from typing import Iterable, List, Optional, Tuple
+from logger import get_logger
+
+# 资源类型对应的文件扩展名（Network.setBlockedURLs只支持URL通配符，按扩展名区分类型）
+RESOURCE_TYPE_EXTENSIONS = {
+    'image': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'],
+    'font': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'media': ['mp4', 'webm', 'mp3', 'm3u8', 'ts', 'ogg', 'wav'],
+    'stylesheet': ['css'],
+}
+
+# 读取主文档和同源资源的传输字节数（跨域资源没有Timing-Allow-Origin时transferSize为0，
+# 只在没有performance日志时作为传输字节数的估计）
+TRANSFER_SIZE_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let total = nav ? nav.transferSize : 0;
+for (const entry of resources) { total += entry.transferSize || 0; }
+return [total, resources.length];
+"""
+
+
+def build_block_patterns(resource_types: Iterable[str], domains: Iterable[str]) -> List[str]:
+    """生成Network.setBlockedURLs使用的URL通配符
+    
+    Args:
+        resource_types: 要拦截的资源类型（image/font/media/stylesheet）
+        domains: 要拦截的域名
+    
+    Returns:
+        URL通配符列表
+    """
+    patterns = []
+    for resource_type in resource_types:
+        for extension in RESOURCE_TYPE_EXTENSIONS.get(resource_type, []):
+            patterns.append(f"*.{extension}")
+            patterns.append(f"*.{extension}?*")
+    for domain in domains:
+        patterns.append(f"*://{domain}/*")
+        patterns.append(f"*://*.{domain}/*")
+    return patterns
+
+
+def apply_resource_blocking(driver, patterns: List[str]) -> bool:
+    """在浏览器当前标签页上启用网络拦截
+    
+    Returns:
+        是否设置成功
+    """
+    if not patterns:
+        return False
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        return True
+    except Exception as e:
+        get_logger().warning(f"设置资源拦截失败: {e}")
+        return False
+
+
+def read_network_log(driver) -> Tuple[Optional[int], int]:
+    """从performance日志统计传输字节数和被拦截的请求数（同时清空已读取的日志）
+    
+    传输字节数为各请求Network.loadingFinished的encodedDataLength之和，包括跨域资源。
+    多个标签页同时加载时日志不区分标签页，单页的数值是近似值，汇总值准确。
+    
+    Returns:
+        (传输字节数, 被拦截的请求数)，没有可用的网络日志时传输字节数为None
+    """
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return None, 0
+    
+    transferred = None
+    blocked = 0
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        method = message.get('method')
+        params = message.get('params', {})
+        if method == 'Network.loadingFinished':
+            transferred = (transferred or 0) + int(params.get('encodedDataLength') or 0)
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            blocked += 1
+    return transferred, blocked
+
+
+class PageLoadStats:
+    """Chrome页面加载统计（每页记录并汇总）
+    
+    节省量为基准样本减去本页的数值；多个标签页并行加载时单页加载时间包含排队时间，节省的时间只有参考意义。
+    """
+    
+    def __init__(self):
+        self.logger = get_logger()
+        self.lock = threading.Lock()
+        self.pages = 0
+        self.transferred_bytes = 0
+        self.blocked_requests = 0
+        self.load_seconds = 0.0
+        self.wait_seconds = 0.0
+        # 不拦截资源的基准样本（传输字节数、加载时间），没有样本时不统计节省量
+        self.baseline_bytes: Optional[int] = None
+        self.baseline_seconds: Optional[float] = None
+        self.saved_bytes = 0
+        self.saved_seconds = 0.0
+    
+    def record_baseline(self, driver, url: str, load_seconds: float):
+        """记录刚加载完成的不拦截资源的基准页面
+        
+        Args:
+            driver: WebDriver实例
+            url: 页面URL
+            load_seconds: 从开始加载到可解析的耗时（秒）
+        """
+        transferred, _, _ = self._measure(driver)
+        with self.lock:
+            self.baseline_bytes = transferred
+            self.baseline_seconds = load_seconds
+        self.logger.info(f"未拦截资源的基准页面: 加载 {load_seconds:.2f}s，传输 {transferred / 1024:.0f}KB: {url}")
+    
+    def record_page(self, driver, url: str, load_seconds: float, wait_seconds: float = 0.0):
+        """读取刚加载完成的页面的网络统计并记录
+        
+        Args:
+            driver: WebDriver实例
+            url: 页面URL
+            load_seconds: 从开始加载到可解析的耗时（秒）
+            wait_seconds: 其中等待页面就绪的耗时（秒）
+        """
+        transferred, resource_count, blocked = self._measure(driver)
+        
+        saving = ''
+        with self.lock:
+            self.pages += 1
+            self.transferred_bytes += transferred
+            self.blocked_requests += blocked
+            self.load_seconds += load_seconds
+            self.wait_seconds += wait_seconds
+            if self.baseline_bytes is not None:
+                saved_bytes = self.baseline_bytes - transferred
+                saved_seconds = self.baseline_seconds - load_seconds
+                self.saved_bytes += saved_bytes
+                self.saved_seconds += saved_seconds
+                saving = f"，比未拦截时节省 {saved_bytes / 1024:.0f}KB、{saved_seconds:.2f}s"
+        
+        self.logger.info(f"页面加载 {load_seconds:.2f}s (等待就绪 {wait_seconds:.2f}s)，传输 {transferred / 1024:.0f}KB "
+                         f"({resource_count} 个资源)，拦截 {blocked} 个请求{saving}: {url}")
+    
+    @staticmethod
+    def _measure(driver) -> Tuple[int, int, int]:
+        """读取刚加载完成的页面的(传输字节数, 资源数, 被拦截的请求数)"""
+        try:
+            script_bytes, resource_count = driver.execute_script(TRANSFER_SIZE_SCRIPT)
+        except Exception:
+            script_bytes, resource_count = 0, 0
+        transferred, blocked = read_network_log(driver)
+        return (script_bytes if transferred is None else transferred), resource_count, blocked
+    
+    def summary(self) -> str:
+        """加载统计摘要"""
+        with self.lock:
+            if not self.pages:
+                return "没有加载页面"
+            return (f"共 {self.pages} 页，平均加载 {self.load_seconds / self.pages:.2f}s "
+                    f"(等待就绪 {self.wait_seconds / self.pages:.2f}s)，"
+                    f"平均传输 {self.transferred_bytes / self.pages / 1024:.0f}KB，"
+                    f"共拦截 {self.blocked_requests} 个请求" + self._saving_summary())
+    
+    def _saving_summary(self) -> str:
+        """相对基准样本的平均节省量（调用方需持有锁）"""
+        if self.baseline_bytes is None:
+            return ''
+        return (f"，平均每页比未拦截时节省 {self.saved_bytes / self.pages / 1024:.0f}KB、"
+                f"{self.saved_seconds / self.pages:.2f}s")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+熔断器模块
+记录Chrome启动失败并持久化到磁盘，熔断期间直接跳过Chrome模式，
+同时在后台定期做健康检查，恢复后提前关闭熔断
+"""
+
+import threading
+import time
+from typing import Callable, Dict
+from json_store import load_json, save_json
+from logger import get_logger
+
+
+class CircuitBreaker:
+    """持久化熔断器
+    
+    - 关闭：正常尝试
+    - 打开：连续失败达到阈值后进入，冷却期内allow()返回False
+    - 冷却期结束后放行一次尝试（半开），成功则关闭，失败则以加倍的冷却期重新打开
+    """
+    
+    def __init__(self, name: str, store_path: str, failure_threshold: int = 1,
+                 cooldown: float = 1800, max_cooldown: float = 6 * 3600, probe_interval: float = 600):
+        """初始化熔断器
+        
+        Args:
+            name: 熔断器名称（用于日志）
+            store_path: 状态文件路径（JSON）
+            failure_threshold: 连续失败多少次后打开
+            cooldown: 首次打开的冷却时长（秒）
+            max_cooldown: 冷却时长上限（秒）
+            probe_interval: 两次后台健康检查的最短间隔（秒）
+        """
+        self.logger = get_logger()
+        self.name = name
+        self.store_path = store_path
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_interval = probe_interval
+        self.lock = threading.Lock()
+        self.probe_thread = None
+        self.state = self._load()
+    
+    def _load(self) -> Dict:
+        """从磁盘加载熔断状态"""
+        state = {'failures': 0, 'opened_at': None, 'cooldown': 0, 'last_error': '', 'last_probe_at': 0}
+        try:
+            state.update(load_json(self.store_path, {}))
+        except Exception as e:
+            self.logger.warning(f"加载{self.name}熔断状态失败: {e}")
+        return state
+    
+    def _save(self):
+        """将熔断状态写回磁盘（调用方需持有锁）"""
+        try:
+            save_json(self.store_path, self.state)
+        except Exception as e:
+            self.logger.warning(f"保存{self.name}熔断状态失败: {e}")
+    
+    def remaining(self) -> float:
+        """熔断剩余的冷却时长（秒），未熔断时为0"""
+        with self.lock:
+            opened_at = self.state['opened_at']
+            if opened_at is None:
+                return 0.0
+            return max(0.0, opened_at + self.state['cooldown'] - time.time())
+    
+    def allow(self) -> bool:
+        """是否允许尝试（关闭状态或冷却期已过）"""
+        remaining = self.remaining()
+        if remaining > 0:
+            self.logger.info(f"{self.name}熔断中，剩余 {remaining / 60:.0f} 分钟 (最近错误: {self.state['last_error']})")
+            return False
+        return True
+    
+    def record_success(self):
+        """记录一次成功，关闭熔断"""
+        with self.lock:
+            was_open = self.state['opened_at'] is not None
+            self.state.update({'failures': 0, 'opened_at': None, 'cooldown': 0, 'last_error': ''})
+            self._save()
+        if was_open:
+            self.logger.info(f"✅ {self.name}已恢复，熔断关闭")
+    
+    def record_failure(self, error: Exception):
+        """记录一次失败，达到阈值时打开熔断（再次打开时冷却时长加倍）"""
+        with self.lock:
+            self.state['failures'] += 1
+            self.state['last_error'] = str(error)[:200]
+            if self.state['failures'] >= self.failure_threshold:
+                reopen = self.state['opened_at'] is not None
+                cooldown = self.state['cooldown'] * 2 if reopen else self.base_cooldown
+                self.state['cooldown'] = min(self.max_cooldown, cooldown)
+                self.state['opened_at'] = time.time()
+                self.logger.warning(f"⚡ {self.name}连续失败 {self.state['failures']} 次，"
+                                    f"熔断 {self.state['cooldown'] / 60:.0f} 分钟")
+            self._save()
+    
+    def start_health_probe(self, probe: Callable[[], bool]):
+        """熔断期间在后台执行一次健康检查（同一时间只运行一个，且受probe_interval限制）
+        
+        Args:
+            probe: 健康检查函数，返回True表示已恢复
+        """
+        with self.lock:
+            if self.state['opened_at'] is None:
+                return
+            if self.probe_thread and self.probe_thread.is_alive():
+                return
+            if time.time() - self.state['last_probe_at'] < self.probe_interval:
+                return
+            self.state['last_probe_at'] = time.time()
+            self._save()
+            self.probe_thread = threading.Thread(
+                target=self._run_probe, args=(probe,), name=f'{self.name}-health-probe', daemon=True
+            )
+            self.probe_thread.start()
+    
+    def _run_probe(self, probe: Callable[[], bool]):
+        """后台健康检查线程"""
+        self.logger.info(f"后台检查{self.name}是否恢复...")
+        try:
+            healthy = probe()
+        except Exception as e:
+            self.logger.debug(f"{self.name}健康检查出错: {e}")
+            healthy = False
+        
+        if healthy:
+            self.record_success()
+        else:
+            self.logger.info(f"{self.name}健康检查未通过，保持熔断")
@@ -32,6 +32,9 @@ class DetikCrawlerCLI:
                           default='txt', help='输出格式 (默认: txt)')
         parser.add_argument('--output-dir', '-o', type=str,
                           help='输出目录 (默认: output)')
+        parser.add_argument('--mode', '-m', type=str, choices=['auto', 'chrome', 'requests', 'async'],
+                          help='爬取模式 (默认: auto，探测静态索引页选择引擎（决策有效期内直接复用）：'
+                               '静态HTML已包含全部新闻时使用requests/async，否则使用Chrome，Chrome失败时回退到requests)')
         parser.add_argument('--list-formats', action='store_true',
                           help='显示支持的输出格式')
         
@@ -83,7 +86,7 @@ class DetikCrawlerCLI:
             print("无效选择，使用昨天")
             return yesterday.strftime('%Y-%m-%d')
     
-    def crawl_news(self, target_date, output_format, output_dir):
+    def crawl_news(self, target_date, output_format, output_dir, crawl_mode=None):
         """爬取新闻"""
         try:
             print(f"\n=== 开始爬取 {target_date} 的新闻 ===")
@@ -92,6 +95,8 @@ class DetikCrawlerCLI:
             if output_dir:
                 self.config.config['OUTPUT_DIR'] = output_dir
             self.config.config['OUTPUT_FORMAT'] = output_format
+            if crawl_mode:
+                self.config.config['CRAWL_MODE'] = crawl_mode
             
             # 初始化爬虫和处理器
             print("初始化爬虫...")
@@ -154,6 +159,7 @@ class DetikCrawlerCLI:
         print(f"\n目标日期: {target_date}")
         print(f"输出格式: {args.format}")
         print(f"输出目录: {args.output_dir or self.config.get_output_dir()}")
+        print(f"爬取模式: {args.mode or self.config.get_crawl_mode()}")
         
         # 确认开始
         confirm = input("\n是否开始爬取? (y/n): ").strip().lower()
@@ -162,7 +168,7 @@ class DetikCrawlerCLI:
             return
         
         # 开始爬取
-        success = self.crawl_news(target_date, args.format, args.output_dir)
+        success = self.crawl_news(target_date, args.format, args.output_dir, args.mode)
         
         if success:
             print("\n🎉 爬取完成！")
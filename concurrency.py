@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+自适应并发控制模块
+按AIMD（加性增、乘性减）策略根据响应延迟和限流信号调整在途请求上限
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Optional
+from logger import get_logger
+
+
+class AdaptiveConcurrencyController:
+    """AIMD并发控制器
+    
+    - 每完成约一个“上限”数量的正常请求，上限加1
+    - 遇到429/5xx、超时或窗口p95延迟明显高于基线时，上限乘以decrease_factor
+    - 基线为未拥塞窗口p95的指数移动平均，可随正常的延迟变化缓慢上升；
+      与基线比较时不低于latency_floor，延迟接近0时的正常抖动不会被视为拥塞
+    """
+    
+    # 视为拥塞信号的HTTP状态码
+    CONGESTION_STATUS_CODES = {429, 500, 502, 503, 504}
+    
+    def __init__(self, initial_limit: int, min_limit: int, max_limit: int,
+                 latency_tolerance: float = 2.0, latency_floor: float = 0.05,
+                 window_size: int = 20, baseline_smoothing: float = 0.05,
+                 decrease_factor: float = 0.5, decrease_cooldown: float = 1.0,
+                 enabled: bool = True):
+        """初始化并发控制器
+        
+        Args:
+            initial_limit: 初始在途请求上限
+            min_limit: 上限的最小值
+            max_limit: 上限的最大值
+            latency_tolerance: p95延迟超过基线的倍数时视为拥塞
+            latency_floor: 判断拥塞时基线的下限（秒）
+            window_size: 计算p95使用的最近请求数
+            baseline_smoothing: 基线指数移动平均的平滑系数（每个请求更新一次）
+            decrease_factor: 拥塞时上限的缩减系数
+            decrease_cooldown: 两次缩减之间的最短间隔（秒），避免同一批拥塞信号重复缩减
+            enabled: 为False时上限固定为max_limit
+        """
+        self.logger = get_logger()
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.enabled = enabled
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit)) if enabled else float(self.max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.latency_floor = latency_floor
+        self.baseline_smoothing = baseline_smoothing
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        
+        self.latencies = deque(maxlen=window_size)
+        self.baseline_p95: Optional[float] = None
+        self.successes = 0
+        self.last_decrease = 0.0
+        self.in_flight = 0
+        self.condition = threading.Condition()
+        # 等待名额的协程: (事件循环, future)，release时唤醒
+        self.async_waiters = []
+    
+    @property
+    def current_limit(self) -> int:
+        """当前在途请求上限"""
+        return int(self.limit)
+    
+    def acquire(self):
+        """阻塞直到占用一个请求名额"""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+    
+    async def acquire_async(self):
+        """acquire的协程版本（等待release唤醒，不轮询；等待中被取消时不占用名额）"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self.condition:
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                # 检查和登记在同一把锁内，不会错过release的唤醒
+                waiter = loop.create_future()
+                self.async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            finally:
+                with self.condition:
+                    if (loop, waiter) in self.async_waiters:
+                        self.async_waiters.remove((loop, waiter))
+    
+    def release(self, latency: Optional[float] = None, status_code: Optional[int] = None,
+                timed_out: bool = False):
+        """释放请求名额并记录本次请求的结果
+        
+        Args:
+            latency: 请求耗时（秒），请求失败时可为None
+            status_code: HTTP状态码，未收到响应时为None
+            timed_out: 是否超时或连接失败
+        """
+        with self.condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            
+            if self.enabled:
+                if timed_out or status_code in self.CONGESTION_STATUS_CODES:
+                    reason = '超时' if timed_out else f'HTTP {status_code}'
+                    self._decrease(reason)
+                elif latency is not None:
+                    self._record_success(latency)
+            
+            self.condition.notify_all()
+            for loop, waiter in self.async_waiters:
+                loop.call_soon_threadsafe(self._wake, waiter)
+            self.async_waiters.clear()
+    
+    @staticmethod
+    def _wake(waiter: asyncio.Future):
+        """唤醒等待名额的协程（已取消的跳过）"""
+        if not waiter.done():
+            waiter.set_result(None)
+    
+    def _p95(self) -> float:
+        """计算窗口内延迟的p95"""
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    
+    def _record_success(self, latency: float):
+        """记录正常响应并按需加性增长（调用方需持有锁）"""
+        self.latencies.append(latency)
+        
+        if len(self.latencies) == self.latencies.maxlen:
+            p95 = self._p95()
+            if self.baseline_p95 is None:
+                self.baseline_p95 = p95
+            elif p95 > max(self.baseline_p95, self.latency_floor) * self.latency_tolerance:
+                self._decrease(f'p95延迟上升 {p95:.2f}s (基线 {self.baseline_p95:.2f}s)')
+                self.latencies.clear()
+                return
+            else:
+                self.baseline_p95 += (p95 - self.baseline_p95) * self.baseline_smoothing
+        
+        self.successes += 1
+        if self.successes >= int(self.limit) and self.limit < self.max_limit:
+            self.successes = 0
+            self.limit = min(self.max_limit, self.limit + 1)
+            self.logger.debug(f"响应正常，并发上限提升至 {self.current_limit}")
+    
+    def _decrease(self, reason: str):
+        """乘性缩减上限（调用方需持有锁）"""
+        now = time.monotonic()
+        if now - self.last_decrease < self.decrease_cooldown:
+            return
+        
+        self.last_decrease = now
+        self.successes = 0
+        old_limit = self.current_limit
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        self.logger.warning(f"检测到拥塞({reason})，并发上限 {old_limit} -> {self.current_limit}")
@@ -19,17 +19,70 @@ class ConfigManager:
         return {
             'DETIK_BASE_URL': 'https://news.detik.com',
             'OUTPUT_DIR': 'output',
+            'CACHE_DIR': None,  # 缓存目录，None表示使用输出目录下的.cache
             'LOG_LEVEL': 'INFO',
             'REQUEST_DELAY': 1,
+            'RATE_LIMIT_RPS': None,  # 每个主机每秒请求数，None表示按1/REQUEST_DELAY计算
+            'RATE_LIMIT_BURST': 3,  # 每个主机允许的突发请求数
             'MAX_RETRIES': 3,
+            'RETRY_BASE_DELAY': 1.0,  # 重试退避基准时长（秒），实际等待为指数退避加全抖动
+            'RETRY_MAX_DELAY': 30,  # 单次重试退避的最大时长（秒）
+            'RETRY_BUDGET': 30,  # 每次爬取允许的重试总次数（文章下载）
+            'INDEX_RETRY_BUDGET': 20,  # 每次爬取索引页（翻页和定位探测）单独的重试预算，不受文章失败影响
+            'INDEX_MAX_PAGE_FAILURES': 5,  # 索引页连续获取失败（重试后）达到该页数时停止翻页
             'REQUEST_TIMEOUT': 30,
+            'MAX_WORKERS': 4,  # 文章并发抓取线程数
+            'PIPELINE_QUEUE_SIZE': 50,  # 发现-抓取流水线中待抓取URL队列的容量
+            'HTTP_POOL_SIZE': None,  # 每个主机的连接池大小，None表示按MAX_WORKERS+1计算
+            'HTTP_KEEP_ALIVE': True,  # 是否保持长连接
+            'HTTP_COMPRESSION': True,  # 是否协商gzip/brotli压缩
+            'ADAPTIVE_CONCURRENCY': True,  # 是否根据延迟和限流信号自动调整并发上限
+            'CONCURRENCY_INITIAL': 2,  # 初始在途请求上限
+            'CONCURRENCY_MIN': 1,  # 在途请求上限的最小值
+            'CONCURRENCY_LATENCY_TOLERANCE': 2.0,  # p95延迟超过基线的倍数时视为拥塞
+            'CONCURRENCY_LATENCY_FLOOR': 0.05,  # 判断延迟拥塞时基线的下限（秒），避免极低延迟下的抖动触发缩减
+            'INDEX_LOCATOR_ENABLED': True,  # 历史日期是否二分定位起始索引页
+            'INDEX_LOCATOR_MIN_DAYS_BACK': 2,  # 目标日期距今至少多少天才启用定位
+            'CRAWL_MODE': 'auto',  # 爬取模式: auto/chrome/requests/async
+            'ASYNC_MAX_CONCURRENCY': 100,  # async模式最大并发请求数
+            'ENGINE_SELECTION_ENABLED': True,  # auto模式是否先探测静态HTML再选择引擎
+            'ENGINE_DECISION_TTL': 21600,  # 引擎选择结果的有效期（秒）
+            'ENGINE_STATIC_COVERAGE': 0.9,  # 静态HTML新闻项达到Chrome基线的比例时不启动Chrome
+            'AUTO_HTTP_ENGINE': 'requests',  # auto模式不需要Chrome时使用的引擎: requests/async
+            'HTML_PARSER': 'auto',  # HTML解析后端: auto(lxml优先)/lxml/html.parser
+            'INDEX_PARTIAL_PARSE': True,  # 索引页是否只解析新闻项目容器（跳过页头、页脚、脚本和广告位）
+            'ARTICLE_METADATA_FIRST': True,  # 文章页先读JSON-LD和meta标签，缺失的字段才使用DOM选择器
+            'DATE_PARSE_CACHE_SIZE': 4096,  # 索引页时间文本解析缓存的条目数，0表示不缓存
             'OUTPUT_FORMAT': 'txt',
             'INCLUDE_TIMESTAMP': True,
+            'HTTP_CACHE_ENABLED': True,  # 是否启用磁盘响应缓存
+            'HTTP_CACHE_MAX_MB': 500,  # 响应缓存大小上限（MB）
             # WebDriver相关配置
             'WEBDRIVER_PAGE_LOAD_TIMEOUT': 120,
-            'WEBDRIVER_IMPLICIT_WAIT': 15,
+            'WEBDRIVER_IMPLICIT_WAIT': 0,  # 隐式等待（秒），页面就绪改用显式条件等待，建议保持0
             'WEBDRIVER_EXPLICIT_WAIT': 45,
             'WEBDRIVER_MAX_RETRIES': 3,
+            'INDEX_WAIT_MIN_ITEMS': 10,  # 索引页出现多少个新闻项即开始解析
+            'INDEX_WAIT_TIMEOUT': 10,  # 等待索引项出现或DOM稳定的时间预算（秒），超时后直接解析已加载内容
+            'CHROME_INDEX_TABS': 3,  # Chrome模式同时加载索引页的标签页数量，1表示逐页加载
+            'WEBDRIVER_PAGE_LOAD_STRATEGY': 'eager',  # 页面加载策略: normal(等待load事件)/eager(DOM就绪即返回)
+            'CHROME_BLOCK_RESOURCES': True,  # 是否通过DevTools协议拦截索引页不需要的资源
+            'CHROME_BLOCKED_RESOURCE_TYPES': ['image', 'font', 'media'],  # 拦截的资源类型: image/font/media/stylesheet
+            'CHROME_BLOCKED_DOMAINS': [  # 拦截的广告和跟踪域名
+                'doubleclick.net', 'googlesyndication.com', 'googletagservices.com', 'googletagmanager.com',
+                'google-analytics.com', 'adservice.google.com', 'facebook.net', 'scorecardresearch.com',
+                'criteo.com', 'criteo.net', 'taboola.com', 'outbrain.com', 'amazon-adsystem.com',
+                'chartbeat.com', 'hotjar.com', 'onesignal.com'
+            ],
+            'CHROME_BLOCKING_BASELINE_SAMPLE': True,  # 每次爬取先不拦截加载一次索引首页，作为统计每页节省字节数和加载时间的基准
+            'CHROME_BREAKER_ENABLED': True,  # Chrome启动失败后是否熔断，直接使用requests模式
+            'CHROME_BREAKER_COOLDOWN': 1800,  # 首次熔断的冷却时长（秒），再次失败时加倍
+            'CHROME_BREAKER_MAX_COOLDOWN': 21600,  # 熔断冷却时长上限（秒）
+            'CHROME_HEALTH_PROBE_INTERVAL': 600,  # 熔断期间后台检查Chrome是否恢复的最短间隔（秒）
+            'DRIVER_POOL_SIZE': 1,  # 常驻进程（Web应用、GUI）中的浏览器数量，0表示不使用WebDriver池
+            'DRIVER_POOL_MAX_PAGES': 200,  # 单个浏览器加载多少页后回收
+            'DRIVER_POOL_MAX_HEAP_MB': 512,  # JS堆比启动时增长超过多少MB后回收
+            'DRIVER_POOL_LEASE_TIMEOUT': 300,  # 等待空闲浏览器的最长时间（秒）
         }
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -44,18 +97,145 @@ class ConfigManager:
         """获取输出目录"""
         return self.get('OUTPUT_DIR')
     
+    def get_cache_dir(self) -> str:
+        """获取缓存目录"""
+        return self.get('CACHE_DIR') or os.path.join(self.get_output_dir(), '.cache')
+    
     def get_request_delay(self) -> int:
         """获取请求延迟时间（秒）"""
         return self.get('REQUEST_DELAY')
     
+    def get_rate_limit_rps(self) -> float:
+        """获取每个主机每秒允许的请求数（0表示不限速）"""
+        rps = self.get('RATE_LIMIT_RPS')
+        if rps is None:
+            delay = self.get_request_delay()
+            return 1.0 / delay if delay else 0.0
+        return rps
+    
+    def get_rate_limit_burst(self) -> int:
+        """获取每个主机允许的突发请求数"""
+        return self.get('RATE_LIMIT_BURST')
+    
     def get_max_retries(self) -> int:
         """获取最大重试次数"""
         return self.get('MAX_RETRIES')
     
+    def get_retry_base_delay(self) -> float:
+        """获取重试退避基准时长"""
+        return self.get('RETRY_BASE_DELAY')
+    
+    def get_retry_max_delay(self) -> float:
+        """获取单次重试退避的最大时长"""
+        return self.get('RETRY_MAX_DELAY')
+    
+    def get_retry_budget(self) -> int:
+        """获取每次爬取的重试预算"""
+        return self.get('RETRY_BUDGET')
+    
+    def get_index_retry_budget(self) -> int:
+        """获取每次爬取索引页的重试预算"""
+        return self.get('INDEX_RETRY_BUDGET')
+    
+    def get_index_max_page_failures(self) -> int:
+        """获取停止翻页前允许的索引页连续失败数"""
+        return self.get('INDEX_MAX_PAGE_FAILURES')
+    
     def get_request_timeout(self) -> int:
         """获取请求超时时间（秒）"""
         return self.get('REQUEST_TIMEOUT')
     
+    def get_max_workers(self) -> int:
+        """获取文章并发抓取线程数"""
+        return self.get('MAX_WORKERS')
+    
+    def get_pipeline_queue_size(self) -> int:
+        """获取发现-抓取流水线队列容量"""
+        return self.get('PIPELINE_QUEUE_SIZE')
+    
+    def get_http_pool_size(self) -> int:
+        """获取每个主机的连接池大小（文章worker加上翻页线程）"""
+        pool_size = self.get('HTTP_POOL_SIZE')
+        if pool_size is None:
+            return self.get_max_workers() + 1
+        return pool_size
+    
+    def get_http_keep_alive(self) -> bool:
+        """是否保持长连接"""
+        return self.get('HTTP_KEEP_ALIVE')
+    
+    def get_http_compression(self) -> bool:
+        """是否协商压缩"""
+        return self.get('HTTP_COMPRESSION')
+    
+    def get_adaptive_concurrency(self) -> bool:
+        """是否启用自适应并发控制"""
+        return self.get('ADAPTIVE_CONCURRENCY')
+    
+    def get_concurrency_initial(self) -> int:
+        """获取初始在途请求上限"""
+        return self.get('CONCURRENCY_INITIAL')
+    
+    def get_concurrency_min(self) -> int:
+        """获取在途请求上限的最小值"""
+        return self.get('CONCURRENCY_MIN')
+    
+    def get_concurrency_latency_tolerance(self) -> float:
+        """获取p95延迟容忍倍数"""
+        return self.get('CONCURRENCY_LATENCY_TOLERANCE')
+    
+    def get_concurrency_latency_floor(self) -> float:
+        """获取判断延迟拥塞时基线的下限（秒）"""
+        return self.get('CONCURRENCY_LATENCY_FLOOR')
+    
+    def get_index_locator_enabled(self) -> bool:
+        """是否启用历史日期起始索引页定位"""
+        return self.get('INDEX_LOCATOR_ENABLED')
+    
+    def get_index_locator_min_days_back(self) -> int:
+        """获取启用起始页定位的最小距今天数"""
+        return self.get('INDEX_LOCATOR_MIN_DAYS_BACK')
+    
+    def get_crawl_mode(self) -> str:
+        """获取爬取模式（auto/chrome/requests/async）"""
+        return self.get('CRAWL_MODE')
+    
+    def get_async_max_concurrency(self) -> int:
+        """获取async模式最大并发请求数"""
+        return self.get('ASYNC_MAX_CONCURRENCY')
+    
+    def get_engine_selection_enabled(self) -> bool:
+        """auto模式是否探测后选择引擎"""
+        return self.get('ENGINE_SELECTION_ENABLED')
+    
+    def get_engine_decision_ttl(self) -> int:
+        """获取引擎选择结果的有效期（秒）"""
+        return self.get('ENGINE_DECISION_TTL')
+    
+    def get_engine_static_coverage(self) -> float:
+        """获取使用HTTP引擎所需的静态新闻项覆盖比例"""
+        return self.get('ENGINE_STATIC_COVERAGE')
+    
+    def get_auto_http_engine(self) -> str:
+        """获取auto模式下的HTTP引擎"""
+        return self.get('AUTO_HTTP_ENGINE')
+    
+    def get_html_parser(self) -> str:
+        """获取HTML解析后端"""
+        return self.get('HTML_PARSER')
+    
+    def get_index_partial_parse(self) -> bool:
+        """索引页是否只解析新闻项目容器"""
+        return self.get('INDEX_PARTIAL_PARSE')
+    
+    def get_article_metadata_first(self) -> bool:
+        """文章页是否优先使用结构化元数据"""
+        return self.get('ARTICLE_METADATA_FIRST')
+    
+    def get_date_parse_cache_size(self) -> int:
+        """获取时间解析缓存的条目数"""
+        return self.get('DATE_PARSE_CACHE_SIZE')
+    
     def get_output_format(self) -> str:
         """获取输出格式"""
         return self.get('OUTPUT_FORMAT')
@@ -64,6 +244,14 @@ class ConfigManager:
         """是否包含时间戳"""
         return self.get('INCLUDE_TIMESTAMP')
     
+    def get_http_cache_enabled(self) -> bool:
+        """是否启用磁盘响应缓存"""
+        return self.get('HTTP_CACHE_ENABLED')
+    
+    def get_http_cache_max_mb(self) -> int:
+        """获取响应缓存大小上限（MB）"""
+        return self.get('HTTP_CACHE_MAX_MB')
+    
     def get_log_level(self) -> str:
         """获取日志级别"""
         return self.get('LOG_LEVEL')
@@ -83,3 +271,67 @@ class ConfigManager:
     def get_webdriver_max_retries(self) -> int:
         """获取WebDriver最大重试次数"""
         return self.get('WEBDRIVER_MAX_RETRIES')
+    
+    def get_index_wait_min_items(self) -> int:
+        """获取索引页开始解析所需的最少新闻项数"""
+        return self.get('INDEX_WAIT_MIN_ITEMS')
+    
+    def get_index_wait_timeout(self) -> int:
+        """获取等待索引项出现或DOM稳定的时间预算（秒）"""
+        return self.get('INDEX_WAIT_TIMEOUT')
+    
+    def get_chrome_index_tabs(self) -> int:
+        """获取Chrome模式并行加载索引页的标签页数量"""
+        return self.get('CHROME_INDEX_TABS')
+    
+    def get_webdriver_page_load_strategy(self) -> str:
+        """获取WebDriver页面加载策略"""
+        return self.get('WEBDRIVER_PAGE_LOAD_STRATEGY')
+    
+    def get_chrome_block_resources(self) -> bool:
+        """是否拦截索引页不需要的资源"""
+        return self.get('CHROME_BLOCK_RESOURCES')
+    
+    def get_chrome_blocked_resource_types(self) -> list:
+        """获取拦截的资源类型"""
+        return self.get('CHROME_BLOCKED_RESOURCE_TYPES')
+    
+    def get_chrome_blocked_domains(self) -> list:
+        """获取拦截的域名列表"""
+        return self.get('CHROME_BLOCKED_DOMAINS')
+    
+    def get_chrome_blocking_baseline_sample(self) -> bool:
+        """是否加载一次不拦截资源的基准页面用于统计节省量"""
+        return self.get('CHROME_BLOCKING_BASELINE_SAMPLE')
+    
+    def get_chrome_breaker_enabled(self) -> bool:
+        """是否启用Chrome启动熔断"""
+        return self.get('CHROME_BREAKER_ENABLED')
+    
+    def get_chrome_breaker_cooldown(self) -> int:
+        """获取Chrome熔断的首次冷却时长（秒）"""
+        return self.get('CHROME_BREAKER_COOLDOWN')
+    
+    def get_chrome_breaker_max_cooldown(self) -> int:
+        """获取Chrome熔断冷却时长上限（秒）"""
+        return self.get('CHROME_BREAKER_MAX_COOLDOWN')
+    
+    def get_chrome_health_probe_interval(self) -> int:
+        """获取Chrome后台健康检查间隔（秒）"""
+        return self.get('CHROME_HEALTH_PROBE_INTERVAL')
+    
+    def get_driver_pool_size(self) -> int:
+        """获取常驻浏览器数量"""
+        return self.get('DRIVER_POOL_SIZE')
+    
+    def get_driver_pool_max_pages(self) -> int:
+        """获取单个浏览器回收前可加载的页数"""
+        return self.get('DRIVER_POOL_MAX_PAGES')
+    
+    def get_driver_pool_max_heap_mb(self) -> int:
+        """获取触发浏览器回收的JS堆增长（MB）"""
+        return self.get('DRIVER_POOL_MAX_HEAP_MB')
+    
+    def get_driver_pool_lease_timeout(self) -> int:
+        """获取等待空闲浏览器的最长时间（秒）"""
+        return self.get('DRIVER_POOL_LEASE_TIMEOUT')
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+爬取进度模块
+记录一次爬取中已访问的索引页、已发现的新闻URL和已抓取的文章，
+在模式切换（如Chrome中途失败后改用requests）时保留，备用引擎从中断处继续
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Set
+
+
+class CrawlState:
+    """一次爬取的共享进度（各引擎的翻页和抓取流程都读写同一个实例）"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        # 翻页进度
+        self.start_page: Optional[int] = None
+        self.next_page: Optional[int] = None
+        self.pages_visited = 0
+        self.consecutive_empty_pages = 0
+        self.consecutive_page_failures = 0
+        self.failed_pages: List[int] = []
+        self.found_target_news = False
+        self.discovery_done = False
+        self.discovery_error: Optional[Exception] = None
+        # 发现和抓取进度
+        self.urls: List[str] = []
+        self.seen: Set[str] = set()
+        self.attempted: Set[str] = set()
+        self.articles: Dict[str, Dict] = {}
+        self.engines: List[str] = []
+    
+    def resume_page(self, engine: str, locate: Callable[[], int]) -> int:
+        """返回本引擎开始翻页的页码，第一次翻页时调用locate确定起始页
+        
+        Args:
+            engine: 引擎名称（用于统计）
+            locate: 确定起始页的函数
+        
+        Returns:
+            起始页码
+        """
+        self.engines.append(engine)
+        self.discovery_error = None
+        if self.next_page is None:
+            self.start_page = self.next_page = locate()
+        return self.next_page
+    
+    def add_urls(self, urls: List[str]) -> List[str]:
+        """记录一页发现的URL，返回此前未发现过的URL（保持顺序）"""
+        with self.lock:
+            new_urls = [url for url in urls if url not in self.seen]
+            self.seen.update(new_urls)
+            self.urls.extend(new_urls)
+            return new_urls
+    
+    def page_done(self, page: int):
+        """记录索引页已处理完成"""
+        with self.lock:
+            self.pages_visited += 1
+            self.consecutive_page_failures = 0
+            self.next_page = page + 1
+    
+    def page_failed(self, page: int) -> int:
+        """记录索引页获取失败并跳过该页，返回连续失败的页数"""
+        with self.lock:
+            self.failed_pages.append(page)
+            self.consecutive_page_failures += 1
+            self.next_page = page + 1
+            return self.consecutive_page_failures
+    
+    def pending_urls(self) -> List[str]:
+        """已发现但还没有尝试抓取的URL"""
+        with self.lock:
+            return [url for url in self.urls if url not in self.attempted]
+    
+    def claim(self, url: str) -> bool:
+        """占用一个URL的抓取，已被尝试过时返回False"""
+        with self.lock:
+            if url in self.attempted:
+                return False
+            self.attempted.add(url)
+            return True
+    
+    def unclaim(self, url: str):
+        """撤销未完成的抓取占用（如抓取被取消），之后的引擎可以重新抓取"""
+        with self.lock:
+            self.attempted.discard(url)
+    
+    def record_article(self, url: str, article_data: Optional[Dict]):
+        """记录文章抓取结果（失败时为None）"""
+        if article_data:
+            with self.lock:
+                self.articles[url] = article_data
+    
+    def results(self) -> List[Dict]:
+        """已抓取的文章，按URL的发现顺序"""
+        with self.lock:
+            return [self.articles[url] for url in self.urls if url in self.articles]
+    
+    def summary(self) -> str:
+        """进度摘要"""
+        with self.lock:
+            failed = f"（跳过失败页 {', '.join(map(str, self.failed_pages))}）" if self.failed_pages else ''
+            return (f"引擎 {' -> '.join(self.engines) or '无'}，访问 {self.pages_visited} 个索引页{failed}，"
+                    f"发现 {len(self.urls)} 个链接，抓取成功 {len(self.articles)} 篇")
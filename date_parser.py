@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+印尼语时间解析模块
+将索引页上的时间文本（绝对时间、"x jam yang lalu"等相对时间、hari ini/kemarin、数字日期）
+解析为雅加达时间，正则和映射表只编译一次，支持整页批量解析，
+重复出现的时间文本通过LRU缓存直接返回
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+import pytz
+from logger import get_logger
+
+JAKARTA_TZ = pytz.timezone('Asia/Jakarta')
+
+# 印尼语（及英语）月份缩写和全称
+MONTHS = {
+    'Jan': 1, 'Januari': 1,
+    'Feb': 2, 'Februari': 2,
+    'Mar': 3, 'Maret': 3,
+    'Apr': 4, 'April': 4,
+    'Mei': 5, 'May': 5,
+    'Jun': 6, 'Juni': 6,
+    'Jul': 7, 'Juli': 7,
+    'Agu': 8, 'Agustus': 8,
+    'Sep': 9, 'September': 9,
+    'Okt': 10, 'Oktober': 10,
+    'Nov': 11, 'November': 11,
+    'Des': 12, 'Desember': 12
+}
+
+# 网站显示时间使用的星期和月份缩写，以及UTC偏移（小时）对应的印尼时区缩写
+DAY_NAMES = ('Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu')
+MONTH_ABBRS = ('Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des')
+ZONE_NAMES = {7: 'WIB', 8: 'WITA', 9: 'WIT'}
+
+# 绝对时间: "Minggu, 03 Agu 2025 13:54 WIB" / "03 Agustus 2025, 13:54 WIB"
+_ABSOLUTE_PATTERNS = (
+    re.compile(r'\w+,\s*(\d{1,2})\s+(\w+)\s+(\d{4})\s+(\d{1,2}):(\d{2})\s+WI[BTA]'),
+    re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4}),\s*(\d{1,2}):(\d{2})\s+WI[BTA]'),
+)
+_ISO_DATETIME = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{2}):\d{2}')
+_TIMEZONE_MARK = re.compile(r'WI[BTA]')
+
+# 元数据时间: "2025-08-03T13:54:29+07:00" / "2025/08/03 13:54:29"
+_METADATA_DATETIME = re.compile(
+    r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})[T ](\d{1,2}):(\d{2})(?::\d{2}(?:\.\d+)?)?\s*(Z|[+-]\d{2}:?\d{2})?$'
+)
+
+# 相对时间: "5 menit yang lalu" / "2 jam lalu"
+_RELATIVE = re.compile(r'(\d+)\s*(menit|jam|hari|minggu|bulan)\s+(?:yang\s+)?lalu', re.I)
+_RELATIVE_UNITS = {
+    'menit': timedelta(minutes=1),
+    'jam': timedelta(hours=1),
+    'hari': timedelta(days=1),
+    'minggu': timedelta(weeks=1),
+    'bulan': timedelta(days=30),  # 近似按30天计算
+}
+
+# 特殊词汇及距今天数（较长的词在前，避免"kemarin dulu"被"kemarin"抢先匹配）
+_SPECIAL_WORDS = (
+    ('kemarin dulu', 2),
+    ('hari ini', 0),
+    ('today', 0),
+    ('kemarin', 1),
+    ('yesterday', 1),
+    ('lusa', -1),
+)
+
+# 数字日期: (正则, 年份是否在前)
+_NUMERIC_DATES = (
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), False),  # DD/MM/YYYY
+    (re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})'), False),  # DD-MM-YYYY
+    (re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2})'), True),   # YYYY/MM/DD
+    (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'), True),   # YYYY-MM-DD
+)
+
+
+@lru_cache(maxsize=64)
+def date_window(target_date: date) -> Tuple[float, float]:
+    """目标日期在雅加达时间的 [开始, 结束) 时间戳区间"""
+    start = JAKARTA_TZ.localize(datetime.combine(target_date, datetime.min.time()))
+    end = JAKARTA_TZ.localize(datetime.combine(target_date + timedelta(days=1), datetime.min.time()))
+    return start.timestamp(), end.timestamp()
+
+
+def in_date_window(news_time: Optional[datetime], target_date: date) -> bool:
+    """新闻时间是否落在目标日期（雅加达时间）内"""
+    if news_time is None:
+        return False
+    start, end = date_window(target_date)
+    return start <= news_time.timestamp() < end
+
+
+def format_display_time(value: str) -> Optional[str]:
+    """将元数据中的时间转换为网站显示的格式，如"Minggu, 03 Agu 2025 13:54 WIB"
+    
+    Args:
+        value: ISO 8601时间或"YYYY/MM/DD HH:MM:SS"（无时区时按雅加达时间）
+    
+    Returns:
+        显示格式的时间，无法解析时返回None
+    """
+    match = _METADATA_DATETIME.match(value.strip())
+    if not match:
+        return None
+    year, month, day, hour, minute, offset = match.groups()
+    try:
+        local = datetime(int(year), int(month), int(day), int(hour), int(minute))
+    except ValueError:
+        return None
+    
+    if offset is None:
+        offset_minutes = 7 * 60
+    elif offset == 'Z':
+        offset_minutes = 0
+    else:
+        digits = offset[1:].replace(':', '')
+        offset_minutes = (int(digits[:2]) * 60 + int(digits[2:])) * (-1 if offset[0] == '-' else 1)
+    
+    # 印尼三个时区保留原时区，其他偏移换算为雅加达时间
+    hours, rest = divmod(offset_minutes, 60)
+    zone = ZONE_NAMES.get(hours) if not rest else None
+    if zone is None:
+        local = local - timedelta(minutes=offset_minutes) + timedelta(hours=7)
+        zone = ZONE_NAMES[7]
+    return f"{DAY_NAMES[local.weekday()]}, {local.day:02d} {MONTH_ABBRS[local.month - 1]} {local.year} {local:%H:%M} {zone}"
+
+
+class IndonesianDateParser:
+    """索引页时间文本解析器
+    
+    解析结果按 (时间文本, 标题文本, 基准分钟) 缓存；不依赖当前时间的结果（绝对时间、数字日期、
+    无法解析）以基准分钟为None缓存，跨分钟复用，相对时间只在同一分钟内复用。
+    """
+    
+    def __init__(self, cache_size: int = 4096):
+        """初始化解析器
+        
+        Args:
+            cache_size: LRU缓存的条目数，0表示不缓存
+        """
+        self.logger = get_logger()
+        self.cache_size = cache_size
+        self.cache: 'OrderedDict[Tuple[str, str, Optional[datetime]], Optional[datetime]]' = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def parse(self, time_text: str, title_text: str = '', now: Optional[datetime] = None) -> Optional[datetime]:
+        """将时间信息解析为雅加达时间
+        
+        Args:
+            time_text: 显示的时间文本
+            title_text: 完整时间信息（time_text为空时用于绝对时间解析）
+            now: 计算相对时间的基准（雅加达时间），默认为当前时间
+        
+        Returns:
+            带雅加达时区的datetime，无法解析时返回None
+        """
+        time_text = time_text or ''
+        title_text = title_text or ''
+        # 相对时间精确到分钟，同一分钟内的相同文本得到相同结果
+        minute = (now or datetime.now(JAKARTA_TZ)).replace(second=0, microsecond=0)
+        if not self.cache_size:
+            return self._parse(time_text, title_text, minute)[0]
+        
+        with self.lock:
+            for key in ((time_text, title_text, None), (time_text, title_text, minute)):
+                if key in self.cache:
+                    self.cache.move_to_end(key)
+                    self.hits += 1
+                    return self.cache[key]
+            self.misses += 1
+        
+        news_time, relative = self._parse(time_text, title_text, minute)
+        with self.lock:
+            self.cache[(time_text, title_text, minute if relative else None)] = news_time
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return news_time
+    
+    def _parse(self, time_text: str, title_text: str, now: datetime) -> Tuple[Optional[datetime], bool]:
+        """解析时间信息
+        
+        Returns:
+            (雅加达时间或None, 结果是否依赖基准时间)
+        """
+        text = time_text or title_text
+        if text and _TIMEZONE_MARK.search(text):
+            news_time = self._parse_absolute(text)
+            if news_time:
+                return news_time, False
+        
+        if 'lalu' in time_text:
+            match = _RELATIVE.search(time_text)
+            if match:
+                return now - int(match.group(1)) * _RELATIVE_UNITS[match.group(2).lower()], True
+        
+        lowered = time_text.lower()
+        for word, days_ago in _SPECIAL_WORDS:
+            if word in lowered:
+                news_date = now.date() - timedelta(days=days_ago)
+                return JAKARTA_TZ.localize(datetime.combine(news_date, datetime.min.time())), True
+        
+        combined_text = f"{time_text} {title_text}"
+        for pattern, year_first in _NUMERIC_DATES:
+            match = pattern.search(combined_text)
+            if not match:
+                continue
+            first, month, last = match.groups()
+            year, day = (first, last) if year_first else (last, first)
+            try:
+                return JAKARTA_TZ.localize(datetime(int(year), int(month), int(day))), False
+            except ValueError as e:
+                self.logger.debug(f"解析数字日期失败: {match.group(0)} - {e}")
+        
+        self.logger.debug(f"无法解析时间信息: time_text='{time_text}', title_text='{title_text}'")
+        return None, False
+    
+    def parse_many(self, texts: Iterable[Tuple[str, str]]) -> List[Optional[datetime]]:
+        """批量解析一整页的时间信息（相对时间共用同一个基准时间）
+        
+        Args:
+            texts: (时间文本, 标题文本) 序列
+        
+        Returns:
+            与输入顺序一致的解析结果
+        """
+        now = datetime.now(JAKARTA_TZ)
+        return [self.parse(time_text, title_text, now) for time_text, title_text in texts]
+    
+    def _parse_absolute(self, text: str) -> Optional[datetime]:
+        """解析带WIB/WITA/WIT的绝对时间"""
+        for pattern in _ABSOLUTE_PATTERNS:
+            match = pattern.search(text)
+            if not match:
+                continue
+            day, month_name, year, hour, minute = match.groups()
+            month = MONTHS.get(month_name)
+            if month is None:
+                continue
+            try:
+                return JAKARTA_TZ.localize(datetime(int(year), month, int(day), int(hour), int(minute)))
+            except ValueError as e:
+                self.logger.debug(f"解析日期失败: {text} - {e}")
+        
+        match = _ISO_DATETIME.search(text)
+        if match:
+            year, month, day, hour, minute = match.groups()
+            try:
+                return JAKARTA_TZ.localize(datetime(int(year), int(month), int(day), int(hour), int(minute)))
+            except ValueError as e:
+                self.logger.debug(f"解析日期失败: {text} - {e}")
+        
+        self.logger.debug(f"未匹配任何绝对时间格式: {text}")
+        return None
+    
+    def summary(self) -> str:
+        """缓存命中统计摘要"""
+        with self.lock:
+            total = self.hits + self.misses
+            if not total:
+                return "没有解析时间"
+            return (f"解析 {total} 次，缓存命中 {self.hits} 次 ({self.hits / total:.0%})，"
+                    f"缓存条目 {len(self.cache)}/{self.cache_size}")
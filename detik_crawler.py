@@ -7,45 +7,189 @@ Detik网站爬虫模块
 
 import time
 import os
+import threading
+import queue
+from collections import deque
 import requests
 from datetime import datetime, timedelta
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, parse_qs
 from bs4 import BeautifulSoup
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
 import pytz
 import re
 from logger import get_logger
+from async_crawler import AsyncCrawlEngine
+from rate_limiter import HostRateLimiter
+from concurrency import AdaptiveConcurrencyController
+from index_locator import locate_first_page
+from page_offset_model import PageOffsetModel
+from http_cache import ResponseCache
+from transport import HttpTransport
+from retry_policy import RetryPolicy, PermanentError
+from circuit_breaker import CircuitBreaker
+from driver_pool import DriverPool
+from driver_resolver import ChromeDriverResolver
+from chrome_network import build_block_patterns, apply_resource_blocking, read_network_log, PageLoadStats
+from page_wait import IndexPageWait, NAVIGATE_SCRIPT
+from engine_selector import EngineSelector
+from crawl_state import CrawlState
+from html_parser import HtmlParser, element_strainer
+from date_parser import IndonesianDateParser, in_date_window
+from metadata_extractor import MetadataExtractor
 
 class DetikCrawler:
     """Detik网站爬虫"""
     
-    def __init__(self, config):
+    # 索引页新闻项目容器的CSS选择器，及部分解析时对应的标签和class
+    INDEX_ITEM_SELECTOR = "article, .media, .list-content__item, .media-artikel"
+    INDEX_ITEM_TAGS = ('article',)
+    INDEX_ITEM_CLASSES = ('media', 'list-content__item', 'media-artikel')
+    
+    # 说明本机没有可用Chrome浏览器的启动错误（换Chrome选项重试也不会成功）
+    CHROME_MISSING_ERRORS = ('cannot find chrome binary', 'no chrome binary', 'chrome binary not found')
+    
+    # 文章数据质量要求：标题长度范围、正文最小长度、错误页面的特征文本
+    TITLE_LENGTH_RANGE = (5, 200)
+    MIN_CONTENT_LENGTH = 50
+    ERROR_INDICATORS = (
+        '404', 'not found', 'error', 'halaman tidak ditemukan',
+        'access denied', 'forbidden', 'server error'
+    )
+    
+    def __init__(self, config, driver_pool: Optional[DriverPool] = None):
         """初始化爬虫
         
         Args:
             config: 配置管理器实例
+            driver_pool: 常驻WebDriver池（Web应用中共享），为None时每次爬取新建浏览器
         """
         self.config = config
+        self.driver_pool = driver_pool
         self.logger = get_logger()
         self.base_url = config.get_detik_base_url()
         self.request_delay = config.get_request_delay()
         self.max_retries = config.get_max_retries()
         self.request_timeout = config.get_request_timeout()
+        self.max_workers = max(1, config.get_max_workers())
+        self.crawl_mode = config.get_crawl_mode()
+        
+        # 按主机的令牌桶限速器（所有抓取路径共享）
+        self.rate_limiter = HostRateLimiter(config.get_rate_limit_rps(), config.get_rate_limit_burst())
+        
+        # 统一重试策略（指数退避加全抖动，每次爬取共享重试预算）
+        self.retry_policy = RetryPolicy(
+            max_attempts=self.max_retries,
+            base_delay=config.get_retry_base_delay(),
+            max_delay=config.get_retry_max_delay(),
+            budget=config.get_retry_budget()
+        )
+        # 索引页使用单独的重试预算，文章下载大量失败时不会耗尽翻页的重试
+        self.index_retry_policy = RetryPolicy(
+            max_attempts=self.max_retries,
+            base_delay=config.get_retry_base_delay(),
+            max_delay=config.get_retry_max_delay(),
+            budget=config.get_index_retry_budget()
+        )
+        self.index_max_page_failures = max(1, config.get_index_max_page_failures())
+        # 解析失败按原因计数（每次爬取重置）
+        self.parse_failures: Dict[str, int] = {}
+        self._parse_failures_lock = threading.Lock()
+        
+        # 设置请求会话（连接池大小与并发线程数匹配，保持长连接并协商压缩）
+        self.transport = HttpTransport(
+            pool_size=config.get_http_pool_size(),
+            keep_alive=config.get_http_keep_alive(),
+            compression=config.get_http_compression(),
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            }
+        )
+        self.session = self.transport.session
+        
+        # 磁盘响应缓存（按规范化URL，支持条件请求重新验证）
+        self.response_cache = None
+        if config.get_http_cache_enabled():
+            self.response_cache = ResponseCache(
+                os.path.join(config.get_cache_dir(), 'http'),
+                config.get_http_cache_max_mb() * 1024 * 1024
+            )
+        # 历史日期的文章页直接使用缓存，由crawl_news按目标日期设置
+        self.use_cached_articles = False
+        
+        # 索引页时间解析器（正则只编译一次，重复的时间文本走LRU缓存）
+        self.date_parser = IndonesianDateParser(config.get_date_parse_cache_size())
+        
+        # HTML解析后端（lxml可用时优先）
+        self.html_parser = HtmlParser(config.get_html_parser())
+        # 索引页只构建新闻项目子树，跳过页头、页脚、脚本和广告位
+        self.index_strainer = None
+        if config.get_index_partial_parse():
+            self.index_strainer = element_strainer(self.INDEX_ITEM_TAGS, self.INDEX_ITEM_CLASSES)
+        # 文章页结构化元数据（JSON-LD/meta标签）优先，缺失的字段再走DOM选择器
+        self.metadata_first = config.get_article_metadata_first()
+        self.metadata_extractor = MetadataExtractor()
+        
+        # 索引页偏移模型（预测目标日期的起始页）及定位阶段已下载的索引页
+        self.page_offset_model = PageOffsetModel(os.path.join(config.get_cache_dir(), 'index_page_offsets.json'))
+        self._probed_pages: Dict[int, str] = {}
+        self.crawl_state = CrawlState()
+        
+        # ChromeDriver路径缓存（Chrome版本不变时不再调用webdriver-manager）
+        self.driver_resolver = ChromeDriverResolver(os.path.join(config.get_cache_dir(), 'chromedriver.json'))
+        
+        # Chrome索引页的资源拦截规则及页面加载统计
+        self.block_patterns = []
+        if config.get_chrome_block_resources():
+            self.block_patterns = build_block_patterns(
+                config.get_chrome_blocked_resource_types(), config.get_chrome_blocked_domains()
+            )
+        self.page_load_stats = PageLoadStats()
+        
+        # 索引页显式等待：新闻项数量达标或DOM稳定即开始解析，不使用固定延时
+        self.index_page_wait = IndexPageWait(
+            self.INDEX_ITEM_SELECTOR,
+            ready_timeout=config.get_webdriver_explicit_wait(),
+            items_timeout=config.get_index_wait_timeout(),
+            min_items=config.get_index_wait_min_items()
+        )
         
-        # 设置请求会话
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        # Chrome启动熔断器（状态持久化，跨进程生效）
+        self.chrome_breaker = None
+        if config.get_chrome_breaker_enabled():
+            self.chrome_breaker = CircuitBreaker(
+                'Chrome',
+                os.path.join(config.get_cache_dir(), 'chrome_breaker.json'),
+                cooldown=config.get_chrome_breaker_cooldown(),
+                max_cooldown=config.get_chrome_breaker_max_cooldown(),
+                probe_interval=config.get_chrome_health_probe_interval()
+            )
+        
+        # auto模式的引擎选择（静态HTML足够时不启动Chrome）
+        self.engine_selector = None
+        if self.crawl_mode == 'auto' and config.get_engine_selection_enabled():
+            self.engine_selector = EngineSelector(
+                os.path.join(config.get_cache_dir(), 'engine_selection.json'),
+                ttl=config.get_engine_decision_ttl(),
+                coverage=config.get_engine_static_coverage()
+            )
+        
+        # 自适应并发控制（AIMD），与session配合限制在途请求数
+        uses_async = self.crawl_mode == 'async' or (self.engine_selector is not None and config.get_auto_http_engine() == 'async')
+        max_concurrency = config.get_async_max_concurrency() if uses_async else self.max_workers
+        self.concurrency = AdaptiveConcurrencyController(
+            initial_limit=config.get_concurrency_initial(),
+            min_limit=config.get_concurrency_min(),
+            max_limit=max_concurrency,
+            latency_tolerance=config.get_concurrency_latency_tolerance(),
+            latency_floor=config.get_concurrency_latency_floor(),
+            enabled=config.get_adaptive_concurrency()
+        )
     
     def _is_cloud_environment(self) -> bool:
         """检测是否在云端环境中"""
@@ -84,7 +228,7 @@ class DetikCrawler:
             chrome_options.add_argument('--disable-features=TranslateUI')
             chrome_options.add_argument('--disable-extensions')
             chrome_options.add_argument('--disable-plugins')
-            chrome_options.add_argument('--disable-images')
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
             chrome_options.add_argument('--virtual-time-budget=5000')
             chrome_options.add_argument('--run-all-compositor-stages-before-draw')
             chrome_options.add_argument('--disable-web-security')
@@ -99,7 +243,7 @@ class DetikCrawler:
             chrome_options.add_argument('--disable-gpu')
             chrome_options.add_argument('--disable-extensions')
             chrome_options.add_argument('--disable-plugins')
-            chrome_options.add_argument('--disable-images')
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
             chrome_options.add_argument('--disable-features=VizDisplayCompositor')
             chrome_options.add_argument('--disable-ipc-flooding-protection')
             self.logger.info("使用本地macOS环境配置")
@@ -126,56 +270,20 @@ class DetikCrawler:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
-        max_retries = 3
-        for attempt in range(max_retries):
+        max_attempts = 3
+        last_error = ''
+        
+        def start_driver(attempt: int) -> webdriver.Chrome:
+            nonlocal chrome_options, last_error
             try:
-                self.logger.info(f"尝试初始化ChromeDriver (第{attempt + 1}/{max_retries}次)")
-                
-                # 清理旧的ChromeDriver缓存
-                if attempt > 0:
-                    self.logger.info("清理ChromeDriver缓存...")
-                    import shutil
-                    cache_dir = os.path.expanduser("~/.wdm")
-                    if os.path.exists(cache_dir):
-                        try:
-                            shutil.rmtree(cache_dir)
-                        except Exception as e:
-                            self.logger.warning(f"清理缓存失败: {e}")
-                
-                # 杀死可能存在的Chrome进程
-                try:
-                    import subprocess
-                    subprocess.run(['pkill', '-f', 'chromedriver'], capture_output=True, check=False)
-                    subprocess.run(['pkill', '-f', 'Google Chrome'], capture_output=True, check=False)
-                    time.sleep(2)  # 等待进程完全退出
-                except Exception as e:
-                    self.logger.debug(f"清理进程时出错: {e}")
+                self.logger.info(f"尝试初始化ChromeDriver (第{attempt + 1}/{max_attempts}次)")
                 
-                # 使用webdriver-manager自动管理ChromeDriver
-                driver_path = ChromeDriverManager().install()
-                
-                # 修复webdriver-manager路径问题
-                if 'THIRD_PARTY_NOTICES.chromedriver' in driver_path:
-                    driver_dir = os.path.dirname(driver_path)
-                    actual_driver_path = os.path.join(driver_dir, 'chromedriver')
-                    if os.path.exists(actual_driver_path):
-                        driver_path = actual_driver_path
-                
-                # 设置ChromeDriver权限
-                self.logger.info(f"设置ChromeDriver权限: {driver_path}")
-                os.chmod(driver_path, 0o755)
-                
-                # 移除macOS安全属性
-                try:
-                    import subprocess
-                    subprocess.run(['xattr', '-d', 'com.apple.quarantine', driver_path], 
-                                 capture_output=True, check=False)
-                    subprocess.run(['xattr', '-d', 'com.apple.provenance', driver_path], 
-                                 capture_output=True, check=False)
-                    subprocess.run(['xattr', '-c', driver_path], 
-                                 capture_output=True, check=False)
-                except Exception as e:
-                    self.logger.warning(f"移除安全属性失败: {e}")
+                # 解析ChromeDriver路径（Chrome版本不变时直接使用缓存）；
+                # 上一次失败是驱动与浏览器版本不匹配时丢弃缓存，重新获取驱动
+                if attempt > 0 and 'version' in last_error.lower():
+                    self.logger.info("ChromeDriver与Chrome版本不匹配，重新获取驱动")
+                    self.driver_resolver.invalidate()
+                driver_path = self.driver_resolver.resolve()
                 
                 # 创建Service对象
                 service = Service(driver_path)
@@ -183,7 +291,8 @@ class DetikCrawler:
                 # 尝试不同的Chrome选项组合
                 if attempt == 1:
                     # 第二次尝试：降级到旧的无头模式
-                    chrome_options.arguments = [arg.replace('--headless=new', '--headless') for arg in chrome_options.arguments]
+                    # Options.arguments没有setter，原地替换参数列表
+                    chrome_options.arguments[:] = [arg.replace('--headless=new', '--headless') for arg in chrome_options.arguments]
                     self.logger.info("第二次尝试：使用传统无头模式")
                 elif attempt == 2:
                     # 第三次尝试：最小化选项
@@ -196,41 +305,62 @@ class DetikCrawler:
                     chrome_options.add_argument('--disable-features=VizDisplayCompositor')
                     self.logger.info("第三次尝试：使用最小化Chrome选项")
                 
+                # 页面加载策略；启用资源拦截时打开performance日志用于统计被拦截的请求
+                chrome_options.page_load_strategy = self.config.get_webdriver_page_load_strategy()
+                if self.block_patterns:
+                    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+                
                 driver = webdriver.Chrome(service=service, options=chrome_options)
                 
+                # 在网络层拦截图片、字体、媒体以及广告和跟踪域名
+                if apply_resource_blocking(driver, self.block_patterns):
+                    self.logger.info(f"已启用资源拦截: {len(self.block_patterns)} 条规则")
+                
                 # 从配置文件获取超时设置
                 page_load_timeout = self.config.get_webdriver_page_load_timeout()
                 implicit_wait = self.config.get_webdriver_implicit_wait()
                 
                 driver.set_page_load_timeout(page_load_timeout)
+                # 元素查找不使用隐式等待（默认0），页面就绪由IndexPageWait显式判断
                 driver.implicitly_wait(implicit_wait)
                 
-                self.logger.info(f"WebDriver配置: 页面加载超时={page_load_timeout}秒, 隐式等待={implicit_wait}秒")
+                self.logger.info(f"WebDriver配置: 页面加载超时={page_load_timeout}秒, 隐式等待={implicit_wait}秒, "
+                                 f"加载策略={chrome_options.page_load_strategy}")
                 self.logger.info("ChromeDriver初始化成功")
                 return driver
                 
             except Exception as e:
-                self.logger.error(f"Chrome WebDriver初始化失败 (第{attempt + 1}/{max_retries}次): {e}")
-                
-                # 清理可能残留的进程
-                try:
-                    import subprocess
-                    subprocess.run(['pkill', '-f', 'chromedriver'], capture_output=True, check=False)
-                    subprocess.run(['pkill', '-f', 'Google Chrome'], capture_output=True, check=False)
-                except:
-                    pass
-                
-                if attempt < max_retries - 1:
-                    retry_delay = 5 + (attempt * 2)  # 递增延迟
-                    self.logger.info(f"等待{retry_delay}秒后重试...")
-                    time.sleep(retry_delay)
-                else:
-                    self.logger.error("ChromeDriver初始化失败，已达到最大重试次数")
-                    self.logger.error("可能的解决方案：")
-                    self.logger.error("1. 检查Chrome浏览器是否已安装")
-                    self.logger.error("2. 重启Terminal和程序")
-                    self.logger.error("3. 在系统偏好设置->安全性与隐私中允许ChromeDriver运行")
-                    raise
+                self.logger.error(f"Chrome WebDriver初始化失败 (第{attempt + 1}/{max_attempts}次): {e}")
+                last_error = str(e)
+                if any(marker in last_error.lower() for marker in self.CHROME_MISSING_ERRORS):
+                    raise PermanentError(f"未找到Chrome浏览器: {e}") from e
+                raise
+        
+        # 浏览器启动使用单独的重试策略，启动失败不消耗文章下载和索引页的重试预算；
+        # 多次启动之间的连续失败由Chrome熔断器处理
+        startup_policy = RetryPolicy(
+            max_attempts=max_attempts,
+            base_delay=5,
+            max_delay=self.config.get_retry_max_delay(),
+            budget=max_attempts - 1
+        )
+        try:
+            # 每次尝试都换一组Chrome选项，因此除了找不到Chrome以外的错误都重试
+            return startup_policy.call(
+                start_driver, "Chrome WebDriver初始化",
+                transient=lambda e: not isinstance(e, PermanentError)
+            )
+        except PermanentError:
+            self.logger.error("ChromeDriver初始化失败：本机没有可用的Chrome浏览器，不再重试")
+            self.logger.error("请安装Chrome浏览器，或设置CHROME_BIN环境变量指向Chrome可执行文件")
+            raise
+        except Exception:
+            self.logger.error("ChromeDriver初始化失败，已达到最大重试次数")
+            self.logger.error("可能的解决方案：")
+            self.logger.error("1. 检查Chrome浏览器是否已安装")
+            self.logger.error("2. 重启Terminal和程序")
+            self.logger.error("3. 在系统偏好设置->安全性与隐私中允许ChromeDriver运行")
+            raise
     
     def crawl_news(self, target_date: str) -> List[Dict]:
         """爬取指定日期的新闻数据
@@ -241,7 +371,52 @@ class DetikCrawler:
         Returns:
             新闻数据列表
         """
-        self.logger.info(f"开始爬取 {target_date} 的新闻数据")
+        self.logger.info(f"开始爬取 {target_date} 的新闻数据，爬取模式: {self.crawl_mode}")
+        
+        # 目标日期已经过去时，已缓存的文章页不再访问网络
+        today = datetime.now(pytz.timezone('Asia/Jakarta')).date()
+        self.use_cached_articles = datetime.strptime(target_date, '%Y-%m-%d').date() < today
+        
+        self.retry_policy.reset()
+        self.index_retry_policy.reset()
+        self.parse_failures = {}
+        # 爬取进度在模式切换时保留，备用引擎从中断处继续
+        self.crawl_state = CrawlState()
+        
+        try:
+            return self._crawl_by_mode(target_date)
+        finally:
+            self.logger.info(f"爬取进度: {self.crawl_state.summary()}")
+            if self.response_cache:
+                self.logger.info(f"响应缓存统计: {self.response_cache.summary()}")
+            self.logger.info(f"传输统计: {self.transport.stats.summary()}")
+            self.logger.info(f"重试统计: 文章 {self.retry_policy.summary()}，索引页 {self.index_retry_policy.summary()}")
+            if self.crawl_state.failed_pages:
+                self.logger.warning(f"索引页获取失败已跳过: 第 {', '.join(map(str, self.crawl_state.failed_pages))} 页，"
+                                    f"这些页面上的新闻可能缺失")
+            self.logger.info(f"时间解析统计: {self.date_parser.summary()}")
+            self.logger.info(f"文章字段来源统计: {self.metadata_extractor.stats.summary()}")
+            if self.parse_failures:
+                details = '，'.join(f"{reason} {count} 篇" for reason, count in self.parse_failures.items())
+                self.logger.info(f"解析失败统计（未重新下载）: {details}")
+    
+    def _crawl_by_mode(self, target_date: str) -> List[Dict]:
+        """按配置的爬取模式执行爬取"""
+        mode = self.crawl_mode
+        if self.engine_selector:
+            mode = self._select_engine()
+        
+        if mode == 'requests':
+            return self._crawl_with_requests(target_date)
+        
+        if mode == 'async':
+            return self._crawl_with_async(target_date)
+        
+        # Chrome近期启动失败时直接使用requests模式，并在后台检查Chrome是否恢复
+        if self.chrome_breaker and not self.chrome_breaker.allow():
+            self.chrome_breaker.start_health_probe(self._probe_chrome_health)
+            self.logger.info("跳过Chrome模式，直接使用requests模式")
+            return self._crawl_with_requests(target_date)
         
         # 首先尝试Chrome模式
         try:
@@ -249,474 +424,665 @@ class DetikCrawler:
             return self._crawl_with_chrome(target_date)
         except Exception as e:
             self.logger.warning(f"Chrome模式失败: {e}")
-            self.logger.info("切换到requests模式（保持日期筛选功能）")
+            self.logger.info(f"切换到requests模式（保持日期筛选功能），保留已完成的进度: {self.crawl_state.summary()}")
             return self._crawl_with_requests(target_date)
     
+    def _select_engine(self) -> str:
+        """auto模式下选择本次使用的引擎：用requests探测索引页首页，与Chrome基线比较新闻项数量
+        
+        Returns:
+            chrome/requests/async
+        """
+        cached = self.engine_selector.cached_decision()
+        if cached:
+            self.logger.info(f"使用缓存的引擎选择: {cached}")
+            return cached
+        
+        url = f"{self.base_url}/indeks"
+        try:
+            content = self.index_retry_policy.call(
+                lambda attempt: self._fetch_index_page(url), "引擎选择探测", wait=self._retry_wait(url)
+            )
+        except Exception as e:
+            self.logger.warning(f"引擎选择探测失败，使用Chrome模式: {e}")
+            return 'chrome'
+        
+        static_items = self._count_index_items(self._parse_index_html(content))
+        return self.engine_selector.decide(static_items, self.config.get_auto_http_engine())
+    
     def _crawl_with_chrome(self, target_date: str) -> List[Dict]:
         """使用Chrome WebDriver爬取（原有逻辑）"""
-        driver = None
+        self.page_load_stats = PageLoadStats()
         try:
-            # 设置WebDriver
-            driver = self._setup_driver()
-            
-            # 获取新闻列表页面的URL列表
-            news_urls = self._get_news_urls(driver, target_date)
-            
-            if not news_urls:
-                self.logger.warning(f"未找到 {target_date} 的新闻链接")
-                return []
-            
-            self.logger.info(f"找到 {len(news_urls)} 个新闻链接")
-            
-            # 爬取每篇新闻的详细内容
-            news_data = []
-            for i, url in enumerate(news_urls, 1):
-                self.logger.info(f"正在爬取第 {i}/{len(news_urls)} 篇新闻: {url}")
+            with self._chrome_driver() as driver:
+                if self.block_patterns and self.config.get_chrome_blocking_baseline_sample():
+                    self._sample_unblocked_load(driver)
                 
-                article_data = self._crawl_article(url)
-                if article_data:
-                    news_data.append(article_data)
-                    self.logger.debug(f"成功爬取新闻: {article_data['title'][:50]}...")
-                else:
-                    self.logger.warning(f"爬取新闻失败: {url}")
-                
-                # 请求延迟
-                time.sleep(self.request_delay)
+                # 边翻页发现新闻链接边并发爬取详细内容
+                news_data = self._run_fetch_pipeline(
+                    self._iter_news_urls(driver, target_date), self._crawl_article, target_date
+                )
+            
+            # 翻页中断时已抓取的文章和翻页进度保留在crawl_state中，由requests模式继续
+            if self.crawl_state.discovery_error:
+                raise RuntimeError(f"Chrome翻页中断: {self.crawl_state.discovery_error}")
             
             self.logger.info(f"Chrome模式爬取完成，共获取 {len(news_data)} 篇新闻")
+            self.logger.info(f"索引页加载统计: {self.page_load_stats.summary()}")
             return news_data
             
         except Exception as e:
             self.logger.error(f"Chrome模式爬取时出错: {e}", exc_info=True)
             raise  # 重新抛出异常，让主方法切换到requests模式
+    
+    @contextmanager
+    def _chrome_driver(self) -> Iterator[webdriver.Chrome]:
+        """获取WebDriver：有WebDriver池时租用常驻浏览器，否则新建并在用完后关闭"""
+        if self.driver_pool:
+            with self.driver_pool.lease(self._start_chrome, timeout=self.config.get_driver_pool_lease_timeout()) as driver:
+                yield driver
+            return
+        
+        driver = self._start_chrome()
+        try:
+            yield driver
+        finally:
+            driver.quit()
+    
+    def _start_chrome(self) -> webdriver.Chrome:
+        """启动Chrome WebDriver，并将启动结果记录到熔断器"""
+        try:
+            driver = self._setup_driver()
+        except Exception as e:
+            if self.chrome_breaker:
+                self.chrome_breaker.record_failure(e)
+            raise
+        if self.chrome_breaker:
+            self.chrome_breaker.record_success()
+        return driver
+    
+    def prewarm_driver_pool(self) -> bool:
+        """常驻进程启动时在后台预热WebDriver池中的浏览器（本配置可能使用Chrome时）
+        
+        Returns:
+            是否开始预热
+        """
+        if not self.driver_pool or not self._may_use_chrome():
+            return False
+        return self.driver_pool.prewarm(self._start_chrome) is not None
+    
+    def _may_use_chrome(self) -> bool:
+        """按爬取模式、缓存的引擎决策和熔断状态判断下一次爬取是否可能使用Chrome"""
+        if self.crawl_mode not in ('auto', 'chrome'):
+            return False
+        if self.chrome_breaker and self.chrome_breaker.remaining() > 0:
+            return False
+        if self.engine_selector:
+            # 没有有效决策时下一次爬取会重新探测，仍可能选择Chrome
+            return self.engine_selector.cached_decision() in (None, 'chrome')
+        return True
+    
+    def _probe_chrome_health(self) -> bool:
+        """Chrome健康检查：用最小化选项启动一次无头Chrome（不重试）"""
+        options = Options()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        
+        driver = webdriver.Chrome(service=Service(self.driver_resolver.resolve()), options=options)
+        try:
+            driver.get('about:blank')
+            return True
         finally:
-            if driver:
-                driver.quit()
+            driver.quit()
     
     def _crawl_with_requests(self, target_date: str) -> List[Dict]:
         """使用requests爬取（保持日期筛选逻辑）"""
         try:
-            # 获取新闻列表页面的URL列表
-            news_urls = self._get_news_urls_with_requests(target_date)
-            
-            if not news_urls:
-                self.logger.warning(f"未找到 {target_date} 的新闻链接")
-                return []
-            
-            self.logger.info(f"找到 {len(news_urls)} 个新闻链接")
-            
-            # 爬取每篇新闻的详细内容
-            news_data = []
-            for i, url in enumerate(news_urls, 1):
-                self.logger.info(f"正在爬取第 {i}/{len(news_urls)} 篇新闻: {url}")
-                
-                article_data = self._crawl_article_with_requests(url)
-                if article_data:
-                    news_data.append(article_data)
-                    self.logger.debug(f"成功爬取新闻: {article_data['title'][:50]}...")
-                else:
-                    self.logger.warning(f"爬取新闻失败: {url}")
-                
-                # 请求延迟
-                time.sleep(self.request_delay)
+            # 边翻页发现新闻链接边并发爬取详细内容
+            news_data = self._run_fetch_pipeline(
+                self._iter_news_urls_with_requests(target_date), self._crawl_article_with_requests, target_date
+            )
             
             self.logger.info(f"requests模式爬取完成，共获取 {len(news_data)} 篇新闻")
             return news_data
             
         except Exception as e:
             self.logger.error(f"requests模式爬取失败: {e}")
-            return []
+            return self.crawl_state.results()
     
-    def _get_news_urls(self, driver: webdriver.Chrome, target_date: str) -> List[str]:
-        """获取指定日期的新闻URL列表
+    def _http_get(self, url: str, allow_cached: bool = False, use_cache: bool = True) -> requests.Response:
+        """经过缓存、限速和并发控制的GET请求（所有session.get的统一入口）
         
         Args:
-            driver: WebDriver实例
-            target_date: 目标日期，格式：YYYY-MM-DD
+            url: 请求URL
+            allow_cached: 是否允许不经网络直接使用缓存（用于历史日期的文章页）
+            use_cache: 是否读写响应缓存（索引页内容随时变化，不缓存）
             
         Returns:
-            新闻URL列表
+            响应对象（未调用raise_for_status）
         """
+        response_cache = self.response_cache if use_cache else None
+        cached = response_cache.get(url) if response_cache else None
+        if cached and allow_cached:
+            response_cache.record('hit')
+            self.logger.debug(f"使用缓存: {url}")
+            return ResponseCache.build_response(*cached)
+        
+        headers = ResponseCache.conditional_headers(cached[0]) if cached else None
+        
+        self.rate_limiter.acquire(url)
+        self.concurrency.acquire()
+        start = time.monotonic()
         try:
-            # 将目标日期转换为datetime对象
-            target_date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-            
-            all_urls = []
-            page = 1  # 从第1页开始
-            consecutive_empty_pages = 0
-            found_target_news = False  # 标记是否已经找到过目标日期的新闻
-            
-            self.logger.info(f"开始爬取 {target_date} 的新闻，使用通用索引页面策略，从第{page}页开始")
+            response = self.transport.get(url, timeout=self.request_timeout, headers=headers)
+        except (requests.Timeout, requests.ConnectionError):
+            self.concurrency.release(timed_out=True)
+            raise
+        except Exception:
+            self.concurrency.release()
+            raise
+        
+        self.concurrency.release(latency=time.monotonic() - start, status_code=response.status_code)
+        
+        if response_cache:
+            if cached and response.status_code == 304:
+                response_cache.record('revalidated')
+                response_cache.touch(url)
+                return ResponseCache.build_response(*cached)
+            response_cache.record('miss')
+            response_cache.put(url, response.status_code, response.headers, response.content)
+        
+        return response
+    
+    def _retry_wait(self, url: str):
+        """重试退避的等待方式：启用限速时推迟该主机的令牌桶，否则由重试策略直接等待"""
+        if self.rate_limiter.rate > 0:
+            return lambda delay: self.rate_limiter.backoff(url, delay)
+        return None
+    
+    def _run_fetch_pipeline(self, url_pages: Iterable[List[str]], fetch_func, target_date: str) -> List[Dict]:
+        """发现与抓取流水线：生产者线程翻页发现URL，worker线程同时消费并抓取文章
+        
+        Args:
+            url_pages: 逐页产出新闻URL列表的迭代器
+            fetch_func: 单篇文章爬取函数（_crawl_article或_crawl_article_with_requests）
+            target_date: 目标日期（用于日志）
             
+        Returns:
+            本次爬取（包括切换模式前）已抓取的新闻数据列表，顺序与URL的发现顺序一致
+        """
+        url_queue = queue.Queue(maxsize=max(1, self.config.get_pipeline_queue_size()))
+        crawl_state = self.crawl_state
+        state = {'discovered': 0, 'completed': 0}
+        state_lock = threading.Lock()
+        workers = self.max_workers
+        
+        def enqueue(urls: List[str]):
+            for url in urls:
+                with state_lock:
+                    state['discovered'] += 1
+                url_queue.put(url)
+        
+        def produce():
+            try:
+                # 先抓取上一个模式已发现但未抓取的URL
+                pending = crawl_state.pending_urls()
+                if pending:
+                    self.logger.info(f"继续抓取之前已发现的 {len(pending)} 个新闻链接")
+                    enqueue(pending)
+                for page_urls in url_pages:
+                    enqueue(page_urls)
+            except Exception as e:
+                crawl_state.discovery_error = e
+                self.logger.error(f"发现新闻链接时出错: {e}", exc_info=True)
+            finally:
+                # 每个worker一个结束标记
+                for _ in range(workers):
+                    url_queue.put(None)
+        
+        def consume():
             while True:
-                # 构建索引页面URL
-                url = f"{self.base_url}/indeks?page={page}"
-                
-                self.logger.info(f"正在爬取第 {page} 页: {url}")
-                
-                # 重试机制加载页面
-                page_loaded = False
-                max_retries = self.config.get_webdriver_max_retries()
-                explicit_wait = self.config.get_webdriver_explicit_wait()
-                
-                for attempt in range(max_retries):
-                    try:
-                        self.logger.debug(f"尝试加载页面 (第{attempt+1}/{max_retries}次): {url}")
-                        driver.get(url)
-                        
-                        # 等待页面加载完成
-                        WebDriverWait(driver, explicit_wait).until(
-                            EC.presence_of_element_located((By.TAG_NAME, "body"))
-                        )
-                        
-                        # 额外等待确保内容加载
-                        time.sleep(2)
-                        page_loaded = True
-                        self.logger.debug(f"页面加载成功: {url}")
-                        break
-                        
-                    except TimeoutException as e:
-                        self.logger.warning(f"页面加载超时 (第{attempt+1}/{max_retries}次尝试): {url} - {e}")
-                        if attempt < max_retries - 1:  # 不是最后一次尝试
-                            retry_delay = min(5 * (attempt + 1), 15)  # 递增延迟，最多15秒
-                            self.logger.info(f"等待{retry_delay}秒后重试...")
-                            time.sleep(retry_delay)
-                        continue
-                    except Exception as e:
-                        self.logger.error(f"页面加载出错 (第{attempt+1}/{max_retries}次尝试): {url} - {e}")
-                        if attempt < max_retries - 1:
-                            retry_delay = min(3 * (attempt + 1), 10)
-                            time.sleep(retry_delay)
-                        continue
-                
-                if not page_loaded:
-                    self.logger.error(f"页面加载失败，跳过第 {page} 页: {url}")
-                    page += 1
+                url = url_queue.get()
+                if url is None:
+                    return
+                if not crawl_state.claim(url):
                     continue
                 
-                # 获取当前页面的新闻项目（包含链接和时间信息）
-                page_urls = self._extract_news_urls_with_time_filter(driver, target_date_obj)
-                
-                if not page_urls:
-                    consecutive_empty_pages += 1
-                    self.logger.info(f"第 {page} 页没有找到目标日期的新闻")
-                    
-                    # 如果已经找到过目标日期的新闻，现在又没有了，说明已经过了目标日期，直接停止
-                    if found_target_news:
-                        self.logger.info(f"已找到目标日期新闻后出现空页，说明已过目标日期，停止爬取")
-                        break
-                    
-                    # 如果从开始就连续20页都没有找到目标日期的新闻，停止爬取
-                    if consecutive_empty_pages >= 20:
-                        self.logger.info(f"连续{consecutive_empty_pages}页没有找到目标日期的新闻，停止爬取")
-                        break
-                else:
-                    consecutive_empty_pages = 0
-                    found_target_news = True  # 标记已经找到过目标日期的新闻
-                    # 添加到总列表，去重
-                    new_urls = [url for url in page_urls if url not in all_urls]
-                    all_urls.extend(new_urls)
-                    
-                    self.logger.info(f"第 {page} 页找到 {len(new_urls)} 个目标日期的新闻链接")
+                try:
+                    article_data = fetch_func(url)
+                except Exception as e:
+                    self.logger.warning(f"爬取新闻出错: {url}, 错误: {e}")
+                    article_data = None
                 
-                page += 1
+                crawl_state.record_article(url, article_data)
+                with state_lock:
+                    state['completed'] += 1
+                    completed, discovered = state['completed'], state['discovered']
                 
-                # 安全限制：最多爬取50页
-                if page > 50:
-                    self.logger.warning("已达到最大页数限制(50页)")
-                    break
-            
-            self.logger.info(f"总共找到 {len(all_urls)} 个目标日期的新闻链接")
-            return all_urls
-            
-        except Exception as e:
-            self.logger.error(f"获取新闻URL列表时出错: {e}", exc_info=True)
+                if article_data:
+                    self.logger.info(f"已完成 {completed}/{discovered} 篇新闻 (并发上限 {self.concurrency.current_limit}): {url}")
+                    self.logger.debug(f"成功爬取新闻: {article_data['title'][:50]}...")
+                else:
+                    self.logger.warning(f"爬取新闻失败 ({completed}/{discovered}): {url}")
+        
+        self.logger.info(f"启动发现-抓取流水线：{workers} 个抓取线程，当前并发上限: {self.concurrency.current_limit}")
+        
+        producer = threading.Thread(target=produce, name='url-discovery', daemon=True)
+        producer.start()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in range(workers):
+                executor.submit(consume)
+        producer.join()
+        
+        if not crawl_state.urls:
+            self.logger.warning(f"未找到 {target_date} 的新闻链接")
             return []
+        
+        self.logger.info(f"共发现 {state['discovered']} 个新闻链接，文章抓取结束，最终并发上限: {self.concurrency.current_limit}")
+        return crawl_state.results()
+    
+    def _crawl_with_async(self, target_date: str) -> List[Dict]:
+        """使用asyncio非阻塞HTTP爬取（返回与requests模式相同的数据结构）"""
+        if not AsyncCrawlEngine.is_available():
+            self.logger.warning("未安装aiohttp，async模式不可用，切换到requests模式")
+            return self._crawl_with_requests(target_date)
+        
+        try:
+            return AsyncCrawlEngine(self).crawl(target_date)
+        except Exception as e:
+            self.logger.error(f"async模式爬取失败: {e}", exc_info=True)
+            self.logger.info(f"切换到requests模式，保留已完成的进度: {self.crawl_state.summary()}")
+            return self._crawl_with_requests(target_date)
     
-    def _parse_time_info(self, time_text: str, title_text: str, target_date: datetime) -> bool:
-        """解析时间信息，判断是否为目标日期的新闻
+    def _iter_news_urls(self, driver: webdriver.Chrome, target_date: str) -> Iterator[List[str]]:
+        """逐页发现指定日期的新闻URL（从crawl_state记录的进度继续）
         
         Args:
-            time_text: 显示的时间文本
-            title_text: title属性中的完整时间信息
-            target_date: 目标日期
+            driver: WebDriver实例
+            target_date: 目标日期，格式：YYYY-MM-DD
             
-        Returns:
-            bool: 是否为目标日期的新闻
+        Yields:
+            每个索引页新发现的新闻URL列表
+            
+        Raises:
+            RuntimeError: 连续多页加载失败（浏览器可能已失效），由调用方切换到requests模式继续
         """
+        state = self.crawl_state
+        if state.discovery_done:
+            return
+        
         try:
-            # 设置雅加达时区
-            jakarta_tz = pytz.timezone('Asia/Jakarta')
-            now_jakarta = datetime.now(jakarta_tz)
+            # 将目标日期转换为datetime对象
+            target_date_obj = datetime.strptime(target_date, '%Y-%m-%d')
             
-            # 印尼语月份映射（支持更多格式）
-            month_map = {
-                'Jan': 1, 'Januari': 1,
-                'Feb': 2, 'Februari': 2,
-                'Mar': 3, 'Maret': 3,
-                'Apr': 4, 'April': 4,
-                'Mei': 5, 'May': 5,
-                'Jun': 6, 'Juni': 6,
-                'Jul': 7, 'Juli': 7,
-                'Agu': 8, 'Agustus': 8,
-                'Sep': 9, 'September': 9,
-                'Okt': 10, 'Oktober': 10,
-                'Nov': 11, 'November': 11,
-                'Des': 12, 'Desember': 12
-            }
+            # 历史日期先二分定位起始页，否则从第1页开始
+            first_page = state.resume_page(
+                'chrome', lambda: self._locate_start_page(target_date_obj, lambda p: self._probe_index_page(driver, p))
+            )
+            load_failures = 0
             
-            # 印尼语星期映射
-            day_map = {
-                'Minggu': 'Sunday', 'Senin': 'Monday', 'Selasa': 'Tuesday',
-                'Rabu': 'Wednesday', 'Kamis': 'Thursday', 'Jumat': 'Friday',
-                'Sabtu': 'Saturday'
-            }
+            self.logger.info(f"开始爬取 {target_date} 的新闻，使用通用索引页面策略，从第{first_page}页开始")
             
-            # 检查绝对时间格式 - 同时检查time_text和title_text
-            text_to_check = time_text if time_text else title_text
-            if text_to_check and ('WIB' in text_to_check or 'WITA' in text_to_check or 'WIT' in text_to_check):
-                self.logger.info(f"🔍 解析绝对时间格式: {text_to_check}")
-                
-                # 格式1: Minggu, 03 Agu 2025 13:54 WIB
-                pattern1 = r'\w+,\s*(\d{1,2})\s+(\w+)\s+(\d{4})\s+\d{1,2}:\d{2}\s+WI[BTA]'
-                match1 = re.search(pattern1, text_to_check)
-                if match1:
-                    day, month_str, year = match1.groups()
-                    if month_str in month_map:
-                        try:
-                            news_date = datetime(int(year), month_map[month_str], int(day))
-                            is_match = news_date.date() == target_date.date()
-                            if is_match:
-                                self.logger.info(f"✅ 找到匹配日期(格式1): {text_to_check}")
-                            else:
-                                self.logger.info(f"❌ 日期不匹配(格式1): {news_date.date()} vs {target_date.date()}")
-                            return is_match
-                        except ValueError as e:
-                            self.logger.info(f"⚠️ 解析日期失败: {e}")
-                
-                # 格式2: 03 Agustus 2025, 13:54 WIB
-                pattern2 = r'(\d{1,2})\s+(\w+)\s+(\d{4}),\s*\d{1,2}:\d{2}\s+WI[BTA]'
-                match2 = re.search(pattern2, text_to_check)
-                if match2:
-                    day, month_str, year = match2.groups()
-                    if month_str in month_map:
-                        try:
-                            news_date = datetime(int(year), month_map[month_str], int(day))
-                            is_match = news_date.date() == target_date.date()
-                            if is_match:
-                                self.logger.info(f"✅ 找到匹配日期(格式2): {text_to_check}")
-                            else:
-                                self.logger.info(f"❌ 日期不匹配(格式2): {news_date.date()} vs {target_date.date()}")
-                            return is_match
-                        except ValueError as e:
-                            self.logger.info(f"⚠️ 解析日期失败: {e}")
-                
-                # 格式3: 2025-08-03 13:54:00
-                pattern3 = r'(\d{4})-(\d{1,2})-(\d{1,2})\s+\d{1,2}:\d{2}:\d{2}'
-                match3 = re.search(pattern3, text_to_check)
-                if match3:
-                    year, month, day = match3.groups()
-                    try:
-                        news_date = datetime(int(year), int(month), int(day))
-                        is_match = news_date.date() == target_date.date()
-                        if is_match:
-                            self.logger.info(f"✅ 找到匹配日期(格式3): {text_to_check}")
-                        else:
-                            self.logger.info(f"❌ 日期不匹配(格式3): {news_date.date()} vs {target_date.date()}")
-                        return is_match
-                    except ValueError as e:
-                        self.logger.info(f"⚠️ 解析日期失败: {e}")
-                
-                self.logger.info(f"⚠️ 未匹配任何绝对时间格式: {text_to_check}")
+            # 定位阶段已探测并记录过的页面不再重复记录到偏移模型
+            probed_pages = set(self._probed_pages)
             
-            # 处理相对时间格式（增强版）
-            if 'yang lalu' in time_text or 'lalu' in time_text:
-                self.logger.debug(f"处理相对时间: {time_text}")
-                
-                # 提取数字和时间单位
-                time_patterns = [
-                    (r'(\d+)\s*menit\s+yang\s+lalu', 'minutes'),
-                    (r'(\d+)\s*jam\s+yang\s+lalu', 'hours'),
-                    (r'(\d+)\s*hari\s+yang\s+lalu', 'days'),
-                    (r'(\d+)\s*minggu\s+yang\s+lalu', 'weeks'),
-                    (r'(\d+)\s*bulan\s+yang\s+lalu', 'months'),
-                    (r'(\d+)\s*menit\s+lalu', 'minutes'),
-                    (r'(\d+)\s*jam\s+lalu', 'hours'),
-                    (r'(\d+)\s*hari\s+lalu', 'days')
-                ]
-                
-                for pattern, unit in time_patterns:
-                    match = re.search(pattern, time_text, re.IGNORECASE)
-                    if match:
-                        time_value = int(match.group(1))
+            # 多个标签页并行加载后续页面，结果仍按页码顺序处理，终止条件不变
+            with closing(self._iter_index_page_sources(driver, first_page)) as page_sources:
+                for page, page_source in page_sources:
+                    if page_source is None:
+                        load_failures += 1
+                        self.logger.error(f"页面加载失败，跳过第 {page} 页")
+                        if load_failures >= 3:
+                            raise RuntimeError(f"连续 {load_failures} 页加载失败")
+                    else:
+                        load_failures = 0
+                        # 只读取一次页面源码，链接和时间在本地解析，避免逐个元素的WebDriver往返
+                        soup = self._parse_index_html(page_source)
+                        if page not in probed_pages:
+                            self._observe_index_page(page, soup)
+                        if self.engine_selector and page == first_page:
+                            self.engine_selector.record_chrome_baseline(self._count_index_items(soup))
+                        page_urls = self._extract_news_urls_with_requests(soup, target_date_obj)
+                        state.page_done(page)
                         
-                        if unit == 'minutes':
-                            news_time = now_jakarta - timedelta(minutes=time_value)
-                        elif unit == 'hours':
-                            news_time = now_jakarta - timedelta(hours=time_value)
-                        elif unit == 'days':
-                            news_time = now_jakarta - timedelta(days=time_value)
-                        elif unit == 'weeks':
-                            news_time = now_jakarta - timedelta(weeks=time_value)
-                        elif unit == 'months':
-                            # 近似计算月份（30天）
-                            news_time = now_jakarta - timedelta(days=time_value * 30)
+                        if not page_urls:
+                            state.consecutive_empty_pages += 1
+                            self.logger.info(f"第 {page} 页没有找到目标日期的新闻")
+                            
+                            # 如果已经找到过目标日期的新闻，现在又没有了，说明已经过了目标日期，直接停止
+                            if state.found_target_news:
+                                self.logger.info(f"已找到目标日期新闻后出现空页，说明已过目标日期，停止爬取")
+                                break
+                            
+                            # 如果从开始就连续20页都没有找到目标日期的新闻，停止爬取
+                            if state.consecutive_empty_pages >= 20:
+                                self.logger.info(f"连续{state.consecutive_empty_pages}页没有找到目标日期的新闻，停止爬取")
+                                break
                         else:
-                            continue
-                        
-                        self.logger.debug(f"计算时间: {time_value} {unit} 前 = {news_time}")
-                        
-                        # 检查日期是否匹配
-                        is_match = news_time.date() == target_date.date()
-                        self.logger.debug(f"日期匹配检查: {news_time.date()} vs {target_date.date()} = {is_match}")
-                        if is_match:
-                            self.logger.info(f"找到匹配日期(相对时间): {time_text} -> {news_time}")
-                        return is_match
-            
-            # 处理"今天"、"昨天"等特殊词汇
-            special_time_map = {
-                'hari ini': 0,
-                'today': 0,
-                'kemarin': 1,
-                'yesterday': 1,
-                'kemarin dulu': 2,
-                'lusa': -1  # 明天（通常不会出现在新闻中）
-            }
-            
-            time_text_lower = time_text.lower()
-            for special_word, days_offset in special_time_map.items():
-                if special_word in time_text_lower:
-                    news_date = now_jakarta.date() - timedelta(days=days_offset)
-                    is_match = news_date == target_date.date()
-                    if is_match:
-                        self.logger.info(f"找到匹配日期(特殊词汇): {time_text} -> {news_date}")
-                    return is_match
+                            state.consecutive_empty_pages = 0
+                            state.found_target_news = True  # 标记已经找到过目标日期的新闻
+                            # 添加到总列表，去重
+                            new_urls = state.add_urls(page_urls)
+                            yield new_urls
+                            
+                            self.logger.info(f"第 {page} 页找到 {len(new_urls)} 个目标日期的新闻链接")
+                    
+                    # 安全限制：最多爬取50页
+                    if page + 1 - state.start_page >= 50:
+                        self.logger.warning("已达到最大页数限制(50页)")
+                        break
             
-            # 尝试解析其他可能的日期格式
-            date_patterns = [
-                r'(\d{1,2})/(\d{1,2})/(\d{4})',  # DD/MM/YYYY
-                r'(\d{1,2})-(\d{1,2})-(\d{4})',  # DD-MM-YYYY
-                r'(\d{4})/(\d{1,2})/(\d{1,2})',  # YYYY/MM/DD
-                r'(\d{4})-(\d{1,2})-(\d{1,2})'   # YYYY-MM-DD
-            ]
+            state.discovery_done = True
+            self.logger.info(f"总共找到 {len(state.urls)} 个目标日期的新闻链接")
+            self.page_offset_model.save()
             
-            combined_text = f"{time_text} {title_text}"
-            for pattern in date_patterns:
-                match = re.search(pattern, combined_text)
-                if match:
-                    try:
-                        if pattern.startswith(r'(\d{4})'):
-                            # YYYY format
-                            year, month, day = match.groups()
-                            news_date = datetime(int(year), int(month), int(day))
-                        else:
-                            # DD format (assume DD/MM/YYYY)
-                            day, month, year = match.groups()
-                            news_date = datetime(int(year), int(month), int(day))
-                        
-                        is_match = news_date.date() == target_date.date()
-                        if is_match:
-                            self.logger.info(f"找到匹配日期(数字格式): {match.group(0)} -> {news_date}")
-                        return is_match
-                    except ValueError as e:
-                        self.logger.debug(f"解析数字日期失败: {match.group(0)} - {e}")
-                        continue
+        except Exception as e:
+            # 翻页进度保留在crawl_state中，交给调用方切换模式后继续
+            self.logger.error(f"获取新闻URL列表时出错: {e}", exc_info=True)
+            raise
+    
+    def _sample_unblocked_load(self, driver: webdriver.Chrome):
+        """不拦截资源加载一次索引首页，作为统计每页节省的字节数和加载时间的基准（失败时不统计节省量）"""
+        url = f"{self.base_url}/indeks"
+        try:
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+            read_network_log(driver)  # 丢弃之前积累的网络日志
+            self.rate_limiter.acquire(url)
+            start = time.monotonic()
+            driver.get(url)
+            if self.driver_pool:
+                self.driver_pool.record_page(driver)
+            self.index_page_wait.wait(driver)
+            self.page_load_stats.record_baseline(driver, url, time.monotonic() - start)
+        except Exception as e:
+            self.logger.warning(f"未拦截资源的基准页面加载失败，不统计节省量: {e}")
+        finally:
+            apply_resource_blocking(driver, self.block_patterns)
+    
+    def _load_index_page(self, driver: webdriver.Chrome, url: str) -> bool:
+        """使用WebDriver加载索引页（带重试）
+        
+        Args:
+            driver: WebDriver实例
+            url: 索引页URL
             
-            # 如果所有解析都失败，记录调试信息
-            self.logger.debug(f"无法解析时间信息: time_text='{time_text}', title_text='{title_text}'")
-            return False
+        Returns:
+            bool: 是否加载成功
+        """
+        def load(attempt: int) -> Tuple[float, float]:
+            self.logger.debug(f"尝试加载页面 (第{attempt + 1}次): {url}")
+            self.rate_limiter.acquire(url)
+            start = time.monotonic()
+            driver.get(url)
+            if self.driver_pool:
+                self.driver_pool.record_page(driver)
             
+            # 等待新闻项出现或DOM稳定
+            wait_seconds, reason = self.index_page_wait.wait(driver)
+            self.logger.debug(f"页面就绪: {reason}，等待 {wait_seconds:.2f}s")
+            return time.monotonic() - start, wait_seconds
+        
+        try:
+            load_seconds, wait_seconds = self.index_retry_policy.call(
+                load, f"页面加载 {url}", max_attempts=self.config.get_webdriver_max_retries(),
+                wait=self._retry_wait(url)
+            )
         except Exception as e:
-            self.logger.error(f"解析时间信息时出错: {time_text}, {title_text} - {e}")
+            self.logger.error(f"页面加载出错: {url} - {e}")
             return False
-
-    def _extract_news_urls_with_time_filter(self, driver: webdriver.Chrome, target_date: datetime) -> List[str]:
-        """从页面中提取新闻URL并按时间筛选
+        
+        self.page_load_stats.record_page(driver, url, load_seconds, wait_seconds)
+        return True
+    
+    def _iter_index_page_sources(self, driver: webdriver.Chrome, start_page: int) -> Iterator[Tuple[int, Optional[str]]]:
+        """从start_page开始按页码顺序产出索引页源码
+        
+        CHROME_INDEX_TABS大于1时在同一个浏览器中打开多个标签页，
+        每个标签页的页面被取走后立即开始加载后续页面，使多个页面的网络加载重叠。
         
         Args:
             driver: WebDriver实例
-            target_date: 目标日期
+            start_page: 起始页码
+            
+        Yields:
+            (页码, 页面源码)，加载失败时源码为None
+        """
+        tabs = max(1, self.config.get_chrome_index_tabs())
+        page = start_page
+        
+        # 定位时探测过、位于起始页之前的页面不会再用到
+        for probed_page in [p for p in self._probed_pages if p < start_page]:
+            del self._probed_pages[probed_page]
+        
+        # 定位阶段已探测过的页面直接复用，不再加载
+        while page in self._probed_pages:
+            self.logger.info(f"第 {page} 页已在定位时加载，直接使用")
+            yield page, self._probed_pages.pop(page)
+            page += 1
+        
+        if tabs == 1:
+            sources = self._iter_single_tab_sources(driver, page)
+        else:
+            sources = self._iter_multi_tab_sources(driver, page, tabs)
+        # 两种加载方式都不会自行结束，由调用方在发现完成后关闭生成器
+        yield from sources
+    
+    def _iter_single_tab_sources(self, driver: webdriver.Chrome, page: int) -> Iterator[Tuple[int, Optional[str]]]:
+        """在当前标签页逐页加载索引页（定位时探测过的页面直接复用）"""
+        while True:
+            url = f"{self.base_url}/indeks?page={page}"
+            self.logger.info(f"正在爬取第 {page} 页: {url}")
+            page_source = self._probed_pages.pop(page, None)
+            if page_source is None and self._load_index_page(driver, url):
+                page_source = driver.page_source
+            yield page, page_source
+            page += 1
+    
+    def _iter_multi_tab_sources(self, driver: webdriver.Chrome, page: int, tabs: int) -> Iterator[Tuple[int, Optional[str]]]:
+        """在多个标签页中轮流加载索引页，按页码顺序产出（定位时探测过的页面直接复用，生成器关闭时关闭额外的标签页）"""
+        with self._index_tabs(driver, tabs) as handles:
+            pending = deque()
+            for handle in handles:
+                pending.append(self._assign_tab_page(driver, handle, page))
+                page += 1
             
+            while True:
+                current_page, handle, started, page_source = pending.popleft()
+                if page_source is None:
+                    page_source = self._finish_tab_load(driver, handle, current_page, started)
+                else:
+                    self.logger.info(f"第 {current_page} 页已在定位时加载，直接使用")
+                yield current_page, page_source
+                pending.append(self._assign_tab_page(driver, handle, page))
+                page += 1
+    
+    def _assign_tab_page(self, driver: webdriver.Chrome, handle: str,
+                         page: int) -> Tuple[int, str, Optional[float], Optional[str]]:
+        """为标签页分配下一页：定位时探测过的页面直接取已有源码，否则开始在标签页中加载
+        
         Returns:
-            符合目标日期的新闻URL列表
+            (页码, 标签页句柄, 开始加载的时间点, 已有的页面源码)
+        """
+        page_source = self._probed_pages.pop(page, None)
+        if page_source is not None:
+            return page, handle, None, page_source
+        return page, handle, self._start_tab_load(driver, handle, page), None
+    
+    @contextmanager
+    def _index_tabs(self, driver: webdriver.Chrome, count: int) -> Iterator[List[str]]:
+        """打开额外的标签页用于并行加载索引页，结束时关闭并切回原标签页
+        
+        Yields:
+            标签页句柄列表（第一个为原标签页）
         """
-        news_urls = []
+        original = driver.current_window_handle
+        handles = [original]
+        try:
+            for _ in range(count - 1):
+                driver.switch_to.new_window('tab')
+                # CDP资源拦截只作用于当前标签页，新标签页需要重新设置
+                apply_resource_blocking(driver, self.block_patterns)
+                handles.append(driver.current_window_handle)
+        except Exception as e:
+            self.logger.warning(f"打开新标签页失败，使用 {len(handles)} 个标签页: {e}")
         
+        self.logger.info(f"使用 {len(handles)} 个标签页并行加载索引页")
         try:
-            # 等待新闻列表加载（减少超时时间）
-            try:
-                WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "article, .media, .list-content__item, .media-artikel"))
-                )
-            except TimeoutException:
-                self.logger.warning("等待新闻列表加载超时，尝试继续处理")
-                # 不直接返回，尝试查找已加载的元素
-                pass
-            
-            # 查找所有新闻项目容器
-            news_items = driver.find_elements(By.CSS_SELECTOR, "article, .media, .list-content__item, .media-artikel")
-            
-            for item in news_items:
+            yield handles
+        finally:
+            for handle in handles[1:]:
                 try:
-                    # 查找新闻链接
-                    link_elem = item.find_element(By.CSS_SELECTOR, "a[href*='/berita/'], a[href*='/news/'], a[href*='detik.com']")
-                    href = link_elem.get_attribute('href')
-                    
-                    if not href or 'detik.com' not in href:
-                        continue
-                    
-                    # 查找时间信息
-                    time_elem = None
-                    time_selectors = [
-                        '.media__date', '.date', '.time', 'time', 
-                        '[class*="date"]', '[class*="time"]',
-                        '.media__subtitle', '.subtitle'
-                    ]
-                    
-                    for selector in time_selectors:
-                        try:
-                            time_elem = item.find_element(By.CSS_SELECTOR, selector)
-                            if time_elem:
-                                break
-                        except:
-                            continue
-                    
-                    if time_elem:
-                         time_text = time_elem.text.strip()
-                         # 尝试获取title属性（包含完整时间信息）
-                         title_text = time_elem.get_attribute("title") or ""
-                         
-                         # 如果time_elem没有title属性，尝试查找子元素的title属性
-                         if not title_text:
-                             try:
-                                 span_elem = time_elem.find_element(By.TAG_NAME, "span")
-                                 title_text = span_elem.get_attribute("title") or ""
-                             except:
-                                 pass
-                         
-                         # 检查是否是目标日期的新闻
-                         if self._parse_time_info(time_text, title_text, target_date):
-                             full_url = urljoin(self.base_url, href)
-                             if full_url not in news_urls:
-                                 news_urls.append(full_url)
-                                 self.logger.debug(f"找到目标日期新闻: {time_text} ({title_text}) - {href}")
-                    else:
-                        # 如果没有找到时间信息，也添加到列表中（后续通过文章页面验证）
-                        full_url = urljoin(self.base_url, href)
-                        if full_url not in news_urls:
-                            news_urls.append(full_url)
-                            self.logger.debug(f"无时间信息的新闻: {href}")
-                            
+                    driver.switch_to.window(handle)
+                    driver.close()
                 except Exception as e:
-                    self.logger.debug(f"处理新闻项目时出错: {e}")
-                    continue
-            
-            self.logger.info(f"提取到 {len(news_urls)} 个符合条件的新闻链接")
-            return news_urls
+                    self.logger.debug(f"关闭标签页时出错: {e}")
+            try:
+                driver.switch_to.window(original)
+            except Exception as e:
+                self.logger.debug(f"切回原标签页时出错: {e}")
+    
+    def _start_tab_load(self, driver: webdriver.Chrome, handle: str, page: int) -> Optional[float]:
+        """在指定标签页开始加载索引页（不等待加载完成）
+        
+        Returns:
+            开始加载的时间点（time.monotonic），失败时返回None
+        """
+        url = f"{self.base_url}/indeks?page={page}"
+        try:
+            driver.switch_to.window(handle)
+            self.rate_limiter.acquire(url)
+            started = time.monotonic()
+            driver.execute_script(NAVIGATE_SCRIPT, url)
+            if self.driver_pool:
+                self.driver_pool.record_page(driver)
+            return started
+        except Exception as e:
+            self.logger.warning(f"标签页开始加载第 {page} 页失败: {e}")
+            return None
+    
+    def _finish_tab_load(self, driver: webdriver.Chrome, handle: str, page: int,
+                         started: Optional[float]) -> Optional[str]:
+        """等待标签页中的索引页就绪并读取源码，失败时在该标签页按常规方式重新加载
+        
+        Returns:
+            页面源码，加载失败时返回None
+        """
+        url = f"{self.base_url}/indeks?page={page}"
+        self.logger.info(f"正在爬取第 {page} 页: {url}")
+        try:
+            driver.switch_to.window(handle)
+            if started is not None:
+                wait_seconds, reason = self.index_page_wait.wait(driver)
+                self.logger.debug(f"页面就绪: {reason}，等待 {wait_seconds:.2f}s")
+                # 脚本导航遇到网络错误时不会像driver.get那样抛出异常，而是停在chrome-error://页面
+                document_url = driver.execute_script("return document.URL;") or ''
+                if self._is_index_page_url(document_url, page):
+                    self.page_load_stats.record_page(driver, url, time.monotonic() - started, wait_seconds)
+                    return driver.page_source
+                self.logger.warning(f"标签页加载第 {page} 页失败 (当前页面 {document_url[:100]})，重新加载")
+        except Exception as e:
+            self.logger.warning(f"标签页加载第 {page} 页失败，重新加载: {e}")
+        
+        try:
+            driver.switch_to.window(handle)
+        except Exception as e:
+            self.logger.error(f"切换标签页失败: {e}")
+            return None
+        return driver.page_source if self._load_index_page(driver, url) else None
+    
+    @staticmethod
+    def _is_index_page_url(document_url: str, page: int) -> bool:
+        """页面地址是否为第page页索引页（/indeks?page=N）"""
+        parsed = urlparse(document_url)
+        if parsed.scheme not in ('http', 'https') or parsed.path.rstrip('/') != '/indeks':
+            return False
+        return parse_qs(parsed.query).get('page', ['1'])[-1] == str(page)
+    
+    def _locate_start_page(self, target_date: datetime, probe) -> int:
+        """确定索引翻页的起始页
+        
+        优先用索引页偏移模型预测起始页，并在预测页附近探测校正；
+        没有预测且目标日期距今不足INDEX_LOCATOR_MIN_DAYS_BACK天时从第1页开始，
+        否则通过探测页面时间范围二分定位。
+        
+        Args:
+            target_date: 目标日期
+            probe: 页面探测函数，输入页码返回(最新时间, 最早时间)或None
             
+        Returns:
+            起始页码
+        """
+        self._probed_pages.clear()
+        if not self.config.get_index_locator_enabled():
+            return 1
+        
+        jakarta_tz = pytz.timezone('Asia/Jakarta')
+        now = datetime.now(jakarta_tz)
+        days_back = (now.date() - target_date.date()).days
+        if days_back <= 0:
+            return 1
+        
+        day_end = jakarta_tz.localize(datetime.combine(target_date.date() + timedelta(days=1), datetime.min.time()))
+        hint = self.page_offset_model.predict(day_end, now)
+        
+        if hint is None:
+            if days_back < self.config.get_index_locator_min_days_back():
+                return 1
+            self.logger.info(f"目标日期为历史日期，二分定位 {target_date.date()} 的起始索引页")
+        else:
+            self.logger.info(f"索引页偏移模型预测 {target_date.date()} 从第 {hint} 页开始，探测校正")
+        
+        return locate_first_page(probe, target_date.date(), max_page=50, hint=hint)
+    
+    def _probe_index_page(self, driver: webdriver.Chrome, page: int) -> Optional[Tuple[datetime, datetime]]:
+        """使用WebDriver读取索引页的最新和最早新闻时间（页面源码留给后续翻页复用）"""
+        url = f"{self.base_url}/indeks?page={page}"
+        if not self._load_index_page(driver, url):
+            return None
+        page_source = driver.page_source
+        self._probed_pages[page] = page_source
+        return self._observe_index_page(page, self._parse_index_html(page_source))
+    
+    def _fetch_index_page(self, url: str) -> str:
+        """下载一个索引页，返回按响应头解码的HTML（不经过响应缓存）"""
+        response = self._http_get(url, use_cache=False)
+        response.raise_for_status()
+        return self.html_parser.decode(response.content, response.headers.get('Content-Type'))
+    
+    def _probe_index_page_with_requests(self, page: int) -> Optional[Tuple[datetime, datetime]]:
+        """使用requests读取索引页的最新和最早新闻时间（页面内容留给后续翻页复用）"""
+        url = f"{self.base_url}/indeks?page={page}"
+        try:
+            content = self.index_retry_policy.call(
+                lambda attempt: self._fetch_index_page(url), f"探测索引页 {url}", wait=self._retry_wait(url)
+            )
         except Exception as e:
-            self.logger.error(f"提取新闻URL时出错: {e}")
-            return []
+            self.logger.warning(f"探测索引页失败: {url} - {e}")
+            return None
+        self._probed_pages[page] = content
+        return self._observe_index_page(page, self._parse_index_html(content))
+    
+    def _parse_index_html(self, html: str) -> BeautifulSoup:
+        """解析索引页HTML（启用部分解析时只包含新闻项目容器）"""
+        return self.html_parser.parse(html, parse_only=self.index_strainer)
+    
+    def _observe_index_page(self, page: int, soup: BeautifulSoup) -> Optional[Tuple[datetime, datetime]]:
+        """提取索引页上新闻时间的范围，并记录到索引页偏移模型
+        
+        Returns:
+            (最新时间, 最早时间)，页面上没有可解析的时间时返回None
+        """
+        texts = [self._extract_item_time_text(item) for item in soup.select(self.INDEX_ITEM_SELECTOR)]
+        times = [news_time for news_time in self.date_parser.parse_many(texts) if news_time]
+        
+        if not times:
+            return None
+        
+        newest, oldest = max(times), min(times)
+        self.page_offset_model.record(page, newest, oldest, len(times))
+        return newest, oldest
     
     def _validate_article_data(self, article_data: Dict) -> bool:
         """验证文章数据的完整性和质量
@@ -737,7 +1103,8 @@ class DetikCrawler:
             
             # 检查标题长度（至少5个字符，最多200个字符）
             title = article_data['title'].strip()
-            if len(title) < 5 or len(title) > 200:
+            min_title, max_title = self.TITLE_LENGTH_RANGE
+            if len(title) < min_title or len(title) > max_title:
                 self.logger.warning(f"标题长度异常: {len(title)} 字符 - {title[:50]}...")
                 return False
             
@@ -749,7 +1116,7 @@ class DetikCrawler:
                     self.logger.warning(f"视频新闻内容过短: {len(content)} 字符 - {content[:50]}...")
                     return False
             else:
-                if len(content) < 50:  # 普通新闻至少50字符
+                if len(content) < self.MIN_CONTENT_LENGTH:  # 普通新闻至少50字符
                     self.logger.warning(f"内容过短: {len(content)} 字符 - {content[:50]}...")
                     return False
             
@@ -760,15 +1127,10 @@ class DetikCrawler:
                 return False
             
             # 检查是否包含常见的错误内容
-            error_indicators = [
-                '404', 'not found', 'error', 'halaman tidak ditemukan',
-                'access denied', 'forbidden', 'server error'
-            ]
-            
             content_lower = content.lower()
             title_lower = title.lower()
             
-            for indicator in error_indicators:
+            for indicator in self.ERROR_INDICATORS:
                 if indicator in content_lower or indicator in title_lower:
                     self.logger.warning(f"检测到错误内容指示器: {indicator}")
                     return False
@@ -797,9 +1159,9 @@ class DetikCrawler:
         if url.startswith('https://20.detik.com'):
             self.logger.info(f"识别到video新闻: {url}")
             try:
-                response = self.session.get(url, timeout=self.request_timeout)
+                response = self._http_get(url, allow_cached=self.use_cached_articles)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = self.html_parser.parse(response.content, response.headers.get('Content-Type'))
                 
                 # 提取标题
                 title = self._extract_title(soup)
@@ -831,49 +1193,124 @@ class DetikCrawler:
                     'url': url
                 }
         
-        # 处理普通新闻
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(url, timeout=self.request_timeout)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 提取标题
-                title = self._extract_title(soup)
-                if not title:
-                    self.logger.warning(f"无法提取标题: {url}")
-                    continue
-                
-                # 提取发布时间
-                publish_time = self._extract_publish_time(soup)
-                
-                # 提取正文内容
-                content = self._extract_content(soup)
-                if not content:
-                    self.logger.warning(f"无法提取内容: {url}")
-                    continue
-                
-                article_data = {
-                    'title': title.strip(),
-                    'publish_time': publish_time.strip() if publish_time else '',
-                    'content': content.strip(),
-                    'url': url
-                }
-                
-                # 验证数据质量
-                if self._validate_article_data(article_data):
-                    return article_data
-                else:
-                    self.logger.warning(f"文章数据验证失败: {url}")
-                    continue
-                
-            except Exception as e:
-                self.logger.warning(f"爬取文章失败 (尝试 {attempt + 1}/{self.max_retries}): {url}, 错误: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # 指数退避
+        # 处理普通新闻：下载和解析分开，解析失败不会重新下载同一页面
+        html = self._fetch_article_html(url)
+        if html is None:
+            return None
+        return self._parse_article(url, html)
+    
+    def _fetch_article_html(self, url: str) -> Optional[str]:
+        """下载文章页面，只有网络层面的失败才会重新下载
         
-        return None
+        Args:
+            url: 新闻文章URL
+            
+        Returns:
+            解码后的页面HTML，最终下载失败时返回None
+        """
+        def fetch(attempt: int) -> str:
+            response = self._http_get(url, allow_cached=self.use_cached_articles)
+            response.raise_for_status()
+            return self.html_parser.decode(response.content, response.headers.get('Content-Type'))
+        
+        try:
+            return self.retry_policy.call(fetch, f"下载文章 {url}", wait=self._retry_wait(url))
+        except Exception:
+            return None
+    
+    def _parse_article(self, url: str, html: str) -> Optional[Dict]:
+        """解析文章页面（Chrome模式的提取规则），解析失败记录后返回None
+        
+        Args:
+            url: 新闻文章URL
+            html: 页面内容
+            
+        Returns:
+            新闻数据字典，包含title、publish_time、content
+        """
+        soup = self.html_parser.parse(html)
+        metadata = self._extract_metadata(soup)
+        
+        # 提取标题
+        title = self._article_field(soup, metadata, 'title', self._extract_title)
+        if not title:
+            self._record_parse_failure(url, "无法提取标题")
+            return None
+        
+        # 提取发布时间
+        publish_time = self._article_field(soup, metadata, 'publish_time', self._extract_publish_time)
+        
+        # 提取正文内容
+        content = self._article_field(soup, metadata, 'content', self._extract_content, self._clean_text)
+        if not content:
+            self._record_parse_failure(url, "无法提取内容")
+            return None
+        
+        article_data = {
+            'title': title.strip(),
+            'publish_time': publish_time.strip() if publish_time else '',
+            'content': content.strip(),
+            'url': url
+        }
+        
+        # 验证数据质量
+        if not self._validate_article_data(article_data):
+            self._record_parse_failure(url, "文章数据验证失败")
+            return None
+        return article_data
+    
+    def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Tuple[str, str]]:
+        """读取文章页<head>中的结构化元数据（未启用时返回空字典）"""
+        if not self.metadata_first:
+            return {}
+        return self.metadata_extractor.extract(soup)
+    
+    def _article_field(self, soup: BeautifulSoup, metadata: Dict[str, Tuple[str, str]], field: str,
+                       extract_from_dom, clean=None) -> Optional[str]:
+        """取文章字段：元数据中的值通过质量检查时直接使用，否则使用DOM选择器提取，并记录字段来源
+        
+        Args:
+            soup: BeautifulSoup对象
+            metadata: _extract_metadata的结果
+            field: 字段名: title/publish_time/content
+            extract_from_dom: 该字段的DOM选择器提取方法
+            clean: 元数据值的清理方法（正文使用与DOM提取相同的清理规则）
+            
+        Returns:
+            字段值，都没有提取到时返回None
+        """
+        value, tier = metadata.get(field, (None, None))
+        if value and clean:
+            value = clean(value)
+        if value and not self._is_acceptable_metadata(field, value):
+            self.logger.debug(f"元数据{field}未通过检查，使用DOM提取: {value[:50]}")
+            value = None
+        if not value:
+            value = extract_from_dom(soup)
+            tier = 'dom' if value else None
+        self.metadata_extractor.stats.record(field, tier)
+        return value
+    
+    def _is_acceptable_metadata(self, field: str, value: str) -> bool:
+        """元数据中的标题和正文是否满足与DOM提取相同的长度要求，且不像错误页面"""
+        if field == 'title':
+            min_title, max_title = self.TITLE_LENGTH_RANGE
+            if not min_title <= len(value) <= max_title:
+                return False
+        elif field == 'content':
+            # 与requests模式的DOM提取一致，正文必须超过最小长度（摘要、单行描述不作为正文）
+            if len(value) <= self.MIN_CONTENT_LENGTH:
+                return False
+        else:
+            return True
+        lowered = value.lower()
+        return not any(indicator in lowered for indicator in self.ERROR_INDICATORS)
+    
+    def _record_parse_failure(self, url: str, reason: str):
+        """记录一次解析失败（结果是确定性的，不再重新下载）"""
+        with self._parse_failures_lock:
+            self.parse_failures[reason] = self.parse_failures.get(reason, 0) + 1
+        self.logger.warning(f"{reason}，不再重新下载: {url}")
     
     def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
         """提取新闻标题
@@ -1037,14 +1474,17 @@ class DetikCrawler:
     
     # ===== 使用requests的方法（Chrome失败时的备用方案）=====
     
-    def _get_news_urls_with_requests(self, target_date: str) -> List[str]:
-        """使用requests获取指定日期的新闻URL列表（保持原有的日期筛选逻辑）"""
+    def _iter_news_urls_with_requests(self, target_date: str) -> Iterator[List[str]]:
+        """使用requests逐页发现指定日期的新闻URL，每页产出新发现的URL列表（从crawl_state记录的进度继续）"""
+        state = self.crawl_state
+        if state.discovery_done:
+            return
+        
         try:
             target_date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-            all_urls = []
-            page = 1
-            consecutive_empty_pages = 0
-            found_target_news = False
+            page = state.resume_page(
+                'requests', lambda: self._locate_start_page(target_date_obj, self._probe_index_page_with_requests)
+            )
             
             self.logger.info(f"开始使用requests爬取 {target_date} 的新闻，从第{page}页开始")
             
@@ -1053,66 +1493,81 @@ class DetikCrawler:
                 self.logger.info(f"正在爬取第 {page} 页: {url}")
                 
                 try:
-                    response = self.session.get(url, timeout=self.request_timeout)
-                    response.raise_for_status()
+                    # 定位阶段已探测过的页面直接复用
+                    content = self._probed_pages.pop(page, None)
+                    if content is None:
+                        content = self.index_retry_policy.call(
+                            lambda attempt: self._fetch_index_page(url), f"爬取第 {page} 页",
+                            wait=self._retry_wait(url)
+                        )
+                        soup = self._parse_index_html(content)
+                        self._observe_index_page(page, soup)
+                    else:
+                        soup = self._parse_index_html(content)
                     
-                    soup = BeautifulSoup(response.content, 'html.parser')
                     page_urls = self._extract_news_urls_with_requests(soup, target_date_obj)
-                    
+                    state.page_done(page)
+                except Exception as e:
+                    # 重试策略已处理临时错误，到这里说明该页无法获取，跳过该页继续翻页
+                    if not self._skip_failed_index_page(page, e):
+                        break
+                else:
                     if not page_urls:
-                        consecutive_empty_pages += 1
+                        state.consecutive_empty_pages += 1
                         self.logger.info(f"第 {page} 页没有找到目标日期的新闻")
                         
                         # 如果已经找到过目标日期的新闻，现在又没有了，说明已经过了目标日期，直接停止
-                        if found_target_news:
+                        if state.found_target_news:
                             self.logger.info(f"已找到目标日期新闻后出现空页，说明已过目标日期，停止爬取")
                             break
                         
                         # 如果从开始就连续20页都没有找到目标日期的新闻，停止爬取
-                        if consecutive_empty_pages >= 20:
-                            self.logger.info(f"连续{consecutive_empty_pages}页没有找到目标日期的新闻，停止爬取")
+                        if state.consecutive_empty_pages >= 20:
+                            self.logger.info(f"连续{state.consecutive_empty_pages}页没有找到目标日期的新闻，停止爬取")
                             break
                     else:
-                        consecutive_empty_pages = 0
-                        found_target_news = True
+                        state.consecutive_empty_pages = 0
+                        state.found_target_news = True
                         # 添加到总列表，去重
-                        new_urls = [url for url in page_urls if url not in all_urls]
-                        all_urls.extend(new_urls)
+                        new_urls = state.add_urls(page_urls)
+                        yield new_urls
                         
                         self.logger.info(f"第 {page} 页找到 {len(new_urls)} 个目标日期的新闻链接")
-                    
-                    page += 1
-                    
-                    # 安全限制：最多爬取50页
-                    if page > 50:
-                        self.logger.info("已达到最大页面数限制（50页），停止爬取")
-                        break
-                    
-                    time.sleep(1)  # 页面间延迟
-                    
-                except Exception as e:
-                    self.logger.error(f"爬取第 {page} 页失败: {e}")
-                    consecutive_empty_pages += 1
-                    if consecutive_empty_pages >= 5:
-                        break
-                    continue
+                
+                page += 1
+                
+                # 安全限制：最多爬取50页
+                if page - state.start_page >= 50:
+                    self.logger.info("已达到最大页面数限制（50页），停止爬取")
+                    break
             
-            self.logger.info(f"requests模式共找到 {len(all_urls)} 个新闻链接")
-            return all_urls
+            state.discovery_done = True
+            self.logger.info(f"requests模式共找到 {len(state.urls)} 个新闻链接")
+            self.page_offset_model.save()
             
         except Exception as e:
             self.logger.error(f"使用requests获取新闻URL列表时出错: {e}")
-            return []
+    
+    def _skip_failed_index_page(self, page: int, error: Exception) -> bool:
+        """记录重试后仍无法获取的索引页并跳过，连续失败达到上限时返回False（停止翻页）"""
+        failures = self.crawl_state.page_failed(page)
+        if failures >= self.index_max_page_failures:
+            self.logger.warning(f"第 {page} 页获取失败，连续 {failures} 个索引页失败，提前停止翻页，"
+                                f"结果可能不完整: {self.crawl_state.summary()}")
+            return False
+        self.logger.error(f"爬取第 {page} 页失败，跳过该页 (连续失败 {failures}/{self.index_max_page_failures}): {error}")
+        return True
+    
+    def _count_index_items(self, soup: BeautifulSoup) -> int:
+        """统计索引页上带文章链接的新闻项数量"""
+        return sum(1 for item in soup.select(self.INDEX_ITEM_SELECTOR) if item.select_one("a[href*='/berita/']"))
     
     def _extract_news_urls_with_requests(self, soup: BeautifulSoup, target_date: datetime) -> List[str]:
-        """从BeautifulSoup对象中提取新闻URL并按时间筛选"""
-        news_urls = []
-        
+        """从BeautifulSoup对象中提取新闻URL并按时间筛选（整页时间批量解析）"""
         try:
-            # 查找所有新闻项目容器
-            news_items = soup.select("article, .media, .list-content__item, .media-artikel")
-            
-            for item in news_items:
+            # 先收集链接和时间文本，再批量解析时间
+            candidates = []
+            for item in soup.select(self.INDEX_ITEM_SELECTOR):
                 try:
                     # 查找新闻链接
                     link_element = item.select_one("a[href*='/berita/']")
@@ -1135,44 +1590,55 @@ class DetikCrawler:
                     if not full_url.startswith('https://news.detik.com/berita'):
                         continue
                     
-                    # 查找时间信息 - 扩展选择器
-                    time_element = item.select_one(".media__date, .list-content__date, [class*='date'], [class*='time'], time, .date, .time, .timestamp")
-                    title_element = item.select_one(".media__title, .list-content__title, h2, h3, h4, a")
-                    
-                    time_text = time_element.get_text(strip=True) if time_element else ""
-                    title_text = title_element.get_text(strip=True) if title_element else ""
-                    
-                    # 如果没有找到时间元素，尝试从整个项目中查找时间信息
-                    if not time_text:
-                        # 查找包含时间格式的所有文本
-                        all_text = item.get_text()
-                        import re
-                        # 查找WIB格式的时间
-                        wib_match = re.search(r'[^.]*\d{1,2}\s+\w+\s+\d{4}\s+\d{1,2}:\d{2}\s+WIB[^.]*', all_text)
-                        if wib_match:
-                            time_text = wib_match.group(0).strip()
-                    
-                    # 调试日志 - 记录提取到的信息（改为INFO级别便于调试）
-                    if time_text or title_text:
-                        self.logger.info(f"🔍 检查新闻项目 - 时间: '{time_text}', 标题: '{title_text[:30]}...'")
-                    
-                    # 使用原有的时间解析逻辑
-                    if self._parse_time_info(time_text, title_text, target_date):
-                        news_urls.append(full_url)
-                        self.logger.info(f"✅ 找到目标日期新闻: {title_text[:50]}...")
-                    elif time_text:
-                        self.logger.info(f"❌ 时间不匹配: '{time_text}' vs 目标日期: {target_date.strftime('%Y-%m-%d')}")
+                    candidates.append((full_url, self._extract_item_time_text(item)))
                     
                 except Exception as e:
                     self.logger.debug(f"处理新闻项目时出错: {e}")
                     continue
             
+            news_times = self.date_parser.parse_many(texts for _, texts in candidates)
+            
+            news_urls = []
+            for (full_url, (time_text, title_text)), news_time in zip(candidates, news_times):
+                if in_date_window(news_time, target_date.date()):
+                    news_urls.append(full_url)
+                    self.logger.debug(f"✅ 找到目标日期新闻: {news_time} {title_text[:50]}")
+                elif time_text:
+                    self.logger.debug(f"❌ 时间不匹配: '{time_text}' -> {news_time} vs 目标日期: {target_date.strftime('%Y-%m-%d')}")
+            
             return news_urls
             
         except Exception as e:
             self.logger.error(f"从页面提取新闻URL时出错: {e}")
             return []
     
+    def _extract_item_time_text(self, item) -> Tuple[str, str]:
+        """提取索引页新闻项目中的时间文本和标题文本
+        
+        Args:
+            item: 新闻项目容器元素
+            
+        Returns:
+            (时间文本, 标题文本)
+        """
+        # 查找时间信息 - 扩展选择器
+        time_element = item.select_one(".media__date, .list-content__date, [class*='date'], [class*='time'], time, .date, .time, .timestamp")
+        title_element = item.select_one(".media__title, .list-content__title, h2, h3, h4, a")
+        
+        time_text = time_element.get_text(strip=True) if time_element else ""
+        title_text = title_element.get_text(strip=True) if title_element else ""
+        
+        # 如果没有找到时间元素，尝试从整个项目中查找时间信息
+        if not time_text:
+            # 查找包含时间格式的所有文本
+            all_text = item.get_text()
+            # 查找WIB格式的时间
+            wib_match = re.search(r'[^.]*\d{1,2}\s+\w+\s+\d{4}\s+\d{1,2}:\d{2}\s+WIB[^.]*', all_text)
+            if wib_match:
+                time_text = wib_match.group(0).strip()
+        
+        return time_text, title_text
+    
     def _crawl_article_with_requests(self, url: str) -> Optional[Dict]:
         """使用requests爬取单篇新闻文章"""
         # 只处理 https://news.detik.com/berita 开头的链接
@@ -1180,44 +1646,51 @@ class DetikCrawler:
             self.logger.info(f"跳过不符合条件的链接: {url}")
             return None
         
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(url, timeout=self.request_timeout)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 提取标题
-                title = self._extract_title_with_requests(soup)
-                if not title:
-                    continue
-                
-                # 提取发布时间
-                publish_time = self._extract_publish_time_with_requests(soup)
-                
-                # 提取正文内容
-                content = self._extract_content_with_requests(soup)
-                if not content:
-                    continue
-                
-                # 生成文章ID
-                article_id = len(url.split('/'))  # 简单的ID生成
-                
-                return {
-                    'id': article_id,
-                    'title': title.strip(),
-                    'publish_time': publish_time.strip() if publish_time else '',
-                    'content': content.strip(),
-                    'url': url,
-                    'word_count': len(content.split())
-                }
-                
-            except Exception as e:
-                self.logger.warning(f"爬取文章失败 (尝试 {attempt + 1}/{self.max_retries}): {url}, 错误: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
+        html = self._fetch_article_html(url)
+        if html is None:
+            return None
+        return self._parse_article_with_requests(url, html)
+    
+    def _parse_article_with_requests(self, url: str, html) -> Optional[Dict]:
+        """解析文章页面HTML，生成新闻数据字典
         
-        return None
+        Args:
+            url: 新闻文章URL
+            html: 页面HTML
+            
+        Returns:
+            新闻数据字典，无法提取标题或内容时返回None
+        """
+        soup = self.html_parser.parse(html)
+        metadata = self._extract_metadata(soup)
+        
+        # 提取标题
+        title = self._article_field(soup, metadata, 'title', self._extract_title_with_requests)
+        if not title:
+            self._record_parse_failure(url, "无法提取标题")
+            return None
+        
+        # 提取发布时间
+        publish_time = self._article_field(soup, metadata, 'publish_time', self._extract_publish_time_with_requests)
+        
+        # 提取正文内容
+        content = self._article_field(soup, metadata, 'content', self._extract_content_with_requests,
+                                      self._clean_text_requests)
+        if not content:
+            self._record_parse_failure(url, "无法提取内容")
+            return None
+        
+        # 生成文章ID
+        article_id = len(url.split('/'))  # 简单的ID生成
+        
+        return {
+            'id': article_id,
+            'title': title.strip(),
+            'publish_time': publish_time.strip() if publish_time else '',
+            'content': content.strip(),
+            'url': url,
+            'word_count': len(content.split())
+        }
     
     def _extract_title_with_requests(self, soup: BeautifulSoup) -> Optional[str]:
         """使用BeautifulSoup提取新闻标题"""
@@ -1275,7 +1748,7 @@ class DetikCrawler:
                 
                 # 获取文本内容
                 text = content_elem.get_text(separator='\n', strip=True)
-                if text and len(text) > 50:
+                if text and len(text) > self.MIN_CONTENT_LENGTH:
                     return self._clean_text_requests(text)
         
         return None
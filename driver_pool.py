@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebDriver池模块
+在常驻进程（Web应用、GUI）中保持若干个已启动的无头Chrome，
+爬取任务租用浏览器而不是每次冷启动，并按页数或内存增长回收；
+进程启动时可在后台预热一个浏览器，第一个爬取任务也不必等待冷启动
+"""
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+from logger import get_logger
+
+
+class PooledDriver:
+    """池中的一个浏览器及其使用统计"""
+    
+    def __init__(self, driver, baseline_heap: int):
+        self.driver = driver
+        self.pages = 0
+        self.baseline_heap = baseline_heap
+        self.created_at = time.time()
+
+
+class DriverPool:
+    """常驻WebDriver池
+    
+    - lease()租用浏览器，用完自动归还；没有空闲浏览器且未达上限时新建
+    - prewarm()在后台预先启动一个浏览器，租用方会等待正在预热的浏览器而不是另起一个
+    - 租用前做健康检查，失效的浏览器直接丢弃并重建
+    - 归还时浏览器已加载超过max_pages页，或最后一个页面的JS堆比启动时增长超过max_heap_growth_mb，则回收
+    - 进程退出时关闭所有浏览器
+    """
+    
+    # 读取JS堆占用（Chrome专有的performance.memory）
+    HEAP_SCRIPT = "return (window.performance && performance.memory) ? performance.memory.usedJSHeapSize : 0;"
+    
+    def __init__(self, size: int = 1, max_pages: int = 200, max_heap_growth_mb: int = 512):
+        """初始化WebDriver池
+        
+        Args:
+            size: 最多同时保持的浏览器数量
+            max_pages: 单个浏览器加载多少页后回收
+            max_heap_growth_mb: JS堆相对启动时增长超过多少MB后回收
+        """
+        self.logger = get_logger()
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_heap_growth = max_heap_growth_mb * 1024 * 1024
+        self.condition = threading.Condition()
+        self.idle: List[PooledDriver] = []
+        self.leased: Dict[int, PooledDriver] = {}
+        self.total = 0
+        self.closed = False
+        atexit.register(self.shutdown)
+    
+    @contextmanager
+    def lease(self, factory: Callable, timeout: Optional[float] = None) -> Iterator:
+        """租用一个浏览器
+        
+        Args:
+            factory: 需要新建浏览器时调用的函数，返回WebDriver实例
+            timeout: 等待空闲浏览器的最长时间（秒），None表示一直等待
+        
+        Yields:
+            WebDriver实例
+        """
+        entry = self._acquire(factory, timeout)
+        try:
+            yield entry.driver
+        finally:
+            self._release(entry)
+    
+    def prewarm(self, factory: Callable) -> Optional[threading.Thread]:
+        """在后台启动一个浏览器放入空闲队列
+        
+        Args:
+            factory: 创建浏览器的函数，返回WebDriver实例
+        
+        Returns:
+            预热线程；池已关闭、已有空闲浏览器或已达上限时返回None
+        """
+        with self.condition:
+            if self.closed or self.idle or self.total >= self.size:
+                return None
+            # 先占位，其他租用方等待预热完成而不是另起一个浏览器
+            self.total += 1
+        
+        def warm():
+            try:
+                entry = self._create(factory)
+            except Exception as e:
+                self.logger.warning(f"WebDriver池预热失败，首次爬取时再启动浏览器: {e}")
+                return
+            with self.condition:
+                if not self.closed:
+                    self.idle.append(entry)
+                    self.condition.notify()
+                    entry = None
+            if entry:
+                self._quit(entry)
+                return
+            self.logger.info("WebDriver池预热完成")
+        
+        thread = threading.Thread(target=warm, name='driver-pool-prewarm', daemon=True)
+        thread.start()
+        return thread
+    
+    def record_page(self, driver):
+        """记录租用中的浏览器加载了一个页面"""
+        with self.condition:
+            entry = self.leased.get(id(driver))
+            if entry:
+                entry.pages += 1
+    
+    def _acquire(self, factory: Callable, timeout: Optional[float]) -> PooledDriver:
+        """取出一个健康的空闲浏览器，必要时新建"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.condition:
+                if self.closed:
+                    raise RuntimeError("WebDriver池已关闭")
+                entry = self.idle.pop() if self.idle else None
+                if entry is None and self.total < self.size:
+                    # 先占位，浏览器在锁外启动
+                    self.total += 1
+                    create = True
+                else:
+                    create = False
+                if entry is None and not create:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("等待空闲浏览器超时")
+                    self.condition.wait(remaining)
+                    continue
+            
+            if create:
+                entry = self._create(factory)
+            elif not self._is_healthy(entry):
+                # 保留名额直接替换，避免其他租用方趁机多建一个浏览器
+                self.logger.warning("池中的浏览器已失效，重新创建")
+                self._close_driver(entry.driver)
+                entry = self._create(factory)
+            else:
+                self.logger.info(f"复用已启动的浏览器 (已加载 {entry.pages} 页)")
+            
+            with self.condition:
+                self.leased[id(entry.driver)] = entry
+            return entry
+    
+    def _create(self, factory: Callable) -> PooledDriver:
+        """新建浏览器（调用前已占用名额，失败时释放）"""
+        try:
+            driver = factory()
+        except Exception:
+            with self.condition:
+                self.total -= 1
+                self.condition.notify()
+            raise
+        entry = PooledDriver(driver, self._heap_size(driver))
+        self.logger.info(f"WebDriver池新建浏览器 ({self.total}/{self.size})")
+        return entry
+    
+    def _release(self, entry: PooledDriver):
+        """归还浏览器，达到回收条件时关闭"""
+        with self.condition:
+            self.leased.pop(id(entry.driver), None)
+        
+        reason = None
+        if self.closed:
+            reason = "WebDriver池已关闭"
+        elif entry.pages >= self.max_pages:
+            reason = f"已加载 {entry.pages} 页"
+        else:
+            # 在离开最后加载的页面之前检查JS堆增长，再回到空白页释放页面占用的内存
+            growth = self._heap_size(entry.driver) - entry.baseline_heap
+            if growth > self.max_heap_growth:
+                reason = f"JS堆增长 {growth / 1024 / 1024:.0f}MB"
+            else:
+                try:
+                    entry.driver.get('about:blank')
+                except Exception as e:
+                    reason = f"浏览器无响应: {e}"
+        
+        if reason:
+            self.logger.info(f"回收浏览器: {reason}")
+            self._quit(entry)
+            return
+        
+        with self.condition:
+            self.idle.append(entry)
+            self.condition.notify()
+    
+    def _is_healthy(self, entry: PooledDriver) -> bool:
+        """浏览器会话是否仍可用"""
+        try:
+            entry.driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+    
+    def _heap_size(self, driver) -> int:
+        """读取当前JS堆占用（字节），不支持时返回0"""
+        try:
+            return int(driver.execute_script(self.HEAP_SCRIPT) or 0)
+        except Exception:
+            return 0
+    
+    def _close_driver(self, driver):
+        """关闭浏览器（不改变名额）"""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.debug(f"关闭浏览器时出错: {e}")
+    
+    def _quit(self, entry: PooledDriver):
+        """关闭浏览器并释放名额"""
+        self._close_driver(entry.driver)
+        with self.condition:
+            self.total = max(0, self.total - 1)
+            self.condition.notify()
+    
+    def shutdown(self):
+        """关闭池中所有空闲浏览器（租用中的浏览器在归还时关闭）"""
+        with self.condition:
+            if self.closed:
+                return
+            self.closed = True
+            idle, self.idle = self.idle, []
+            self.condition.notify_all()
+        
+        for entry in idle:
+            self._quit(entry)
+        if idle:
+            self.logger.info(f"WebDriver池已关闭，共关闭 {len(idle)} 个浏览器")
+
+
+def create_driver_pool(config) -> Optional[DriverPool]:
+    """按配置创建常驻WebDriver池（进程退出时自动关闭）
+    
+    Args:
+        config: 配置管理器实例
+    
+    Returns:
+        WebDriver池，DRIVER_POOL_SIZE不大于0时返回None
+    """
+    pool_size = config.get_driver_pool_size()
+    if pool_size <= 0:
+        return None
+    return DriverPool(
+        size=pool_size,
+        max_pages=config.get_driver_pool_max_pages(),
+        max_heap_growth_mb=config.get_driver_pool_max_heap_mb()
+    )
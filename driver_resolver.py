@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ChromeDriver解析模块
+缓存已验证的ChromeDriver路径及对应的Chrome版本，
+Chrome未升级时直接复用，避免每次启动都调用webdriver-manager
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from typing import Dict, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+from json_store import load_json, save_json
+from logger import get_logger
+
+
+class ChromeDriverResolver:
+    """ChromeDriver路径解析与缓存
+    
+    缓存以Chrome可执行文件的路径、大小和修改时间作为指纹，
+    指纹不变时不启动任何进程；指纹变化时读取Chrome版本，版本变化才重新安装驱动。
+    """
+    
+    # 常见的Chrome可执行文件名和安装位置
+    CHROME_COMMANDS = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+    CHROME_PATHS = {
+        'darwin': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+        'win32': [
+            os.path.expandvars(r'%ProgramFiles%\Google\Chrome\Application\chrome.exe'),
+            os.path.expandvars(r'%ProgramFiles(x86)%\Google\Chrome\Application\chrome.exe'),
+            os.path.expandvars(r'%LocalAppData%\Google\Chrome\Application\chrome.exe'),
+        ],
+    }
+    
+    def __init__(self, cache_path: str):
+        """初始化解析器
+        
+        Args:
+            cache_path: 解析结果缓存文件路径（JSON）
+        """
+        self.logger = get_logger()
+        self.cache_path = cache_path
+    
+    def resolve(self) -> str:
+        """返回可用的ChromeDriver路径（缓存的驱动不可用时重新安装）
+        
+        Returns:
+            ChromeDriver可执行文件路径
+        """
+        chrome_path = self.find_chrome()
+        fingerprint = self._fingerprint(chrome_path)
+        cached = self._load()
+        
+        if cached and self._is_valid_driver(cached.get('driver_path')):
+            if cached.get('chrome_fingerprint') == fingerprint:
+                return cached['driver_path']
+            # Chrome文件有变化时再比较版本号，版本相同的驱动仍然可用
+            version = self.chrome_version(chrome_path)
+            if version and version == cached.get('chrome_version'):
+                cached['chrome_fingerprint'] = fingerprint
+                self._save(cached)
+                return cached['driver_path']
+            self.logger.info(f"Chrome版本变化 ({cached.get('chrome_version')} -> {version})，重新获取ChromeDriver")
+        else:
+            version = self.chrome_version(chrome_path)
+        
+        driver_path = self._install()
+        self._save({
+            'driver_path': driver_path,
+            'chrome_path': chrome_path,
+            'chrome_version': version,
+            'chrome_fingerprint': fingerprint
+        })
+        self.logger.info(f"ChromeDriver已缓存: {driver_path} (Chrome {version or '版本未知'})")
+        return driver_path
+    
+    def invalidate(self):
+        """删除缓存的解析结果，下一次resolve重新安装驱动（如驱动与浏览器版本不匹配）"""
+        try:
+            os.remove(self.cache_path)
+        except OSError:
+            pass
+    
+    def find_chrome(self) -> Optional[str]:
+        """查找Chrome可执行文件"""
+        env_path = os.environ.get('CHROME_BIN')
+        if env_path and os.path.exists(env_path):
+            return env_path
+        for command in self.CHROME_COMMANDS:
+            path = shutil.which(command)
+            if path:
+                return path
+        for path in self.CHROME_PATHS.get(sys.platform, []):
+            if os.path.exists(path):
+                return path
+        return None
+    
+    @staticmethod
+    def chrome_version(chrome_path: Optional[str]) -> Optional[str]:
+        """读取Chrome版本号（需要启动一次chrome --version）"""
+        if not chrome_path or sys.platform == 'win32':
+            return None
+        try:
+            output = subprocess.run([chrome_path, '--version'], capture_output=True, text=True, timeout=10).stdout
+        except Exception:
+            return None
+        parts = [part for part in output.split() if part[:1].isdigit()]
+        return parts[0] if parts else None
+    
+    @staticmethod
+    def _fingerprint(chrome_path: Optional[str]) -> Optional[str]:
+        """Chrome可执行文件的指纹（路径、大小、修改时间）"""
+        if not chrome_path:
+            return None
+        try:
+            stat = os.stat(os.path.realpath(chrome_path))
+        except OSError:
+            return None
+        return f"{os.path.realpath(chrome_path)}:{stat.st_size}:{int(stat.st_mtime)}"
+    
+    @staticmethod
+    def _is_valid_driver(driver_path: Optional[str]) -> bool:
+        """驱动文件存在且可执行"""
+        return bool(driver_path) and os.path.isfile(driver_path) and os.access(driver_path, os.X_OK)
+    
+    def _install(self) -> str:
+        """通过webdriver-manager获取ChromeDriver，并完成一次性的权限处理"""
+        driver_path = ChromeDriverManager().install()
+        
+        # 修复webdriver-manager路径问题
+        if 'THIRD_PARTY_NOTICES.chromedriver' in driver_path:
+            actual_driver_path = os.path.join(os.path.dirname(driver_path), 'chromedriver')
+            if os.path.exists(actual_driver_path):
+                driver_path = actual_driver_path
+        
+        # 设置ChromeDriver权限
+        if sys.platform != 'win32':
+            os.chmod(driver_path, 0o755)
+        
+        # 移除macOS安全属性（只在macOS上需要）
+        if sys.platform == 'darwin':
+            for args in (['-d', 'com.apple.quarantine'], ['-d', 'com.apple.provenance'], ['-c']):
+                subprocess.run(['xattr', *args, driver_path], capture_output=True, check=False)
+        
+        return driver_path
+    
+    def _load(self) -> Optional[Dict]:
+        """读取缓存的解析结果"""
+        try:
+            return load_json(self.cache_path)
+        except Exception as e:
+            self.logger.warning(f"读取ChromeDriver缓存失败: {e}")
+            return None
+    
+    def _save(self, data: Dict):
+        """保存解析结果（原子替换，并发的爬取进程不会读到写了一半的文件）"""
+        try:
+            save_json(self.cache_path, data)
+        except Exception as e:
+            self.logger.warning(f"保存ChromeDriver缓存失败: {e}")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+爬取引擎选择模块
+auto模式下比较静态HTML与Chrome渲染后索引页上的新闻项数量，
+静态HTML已包含全部新闻项时使用HTTP引擎，只有确实需要JavaScript渲染时才启动Chrome，
+决策带有效期缓存到磁盘
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from json_store import load_json, save_json
+from logger import get_logger
+
+
+class EngineSelector:
+    """爬取引擎选择器
+    
+    - 没有Chrome基线或静态HTML中没有新闻项时选择Chrome（同时建立基线）
+    - 静态新闻项数量达到Chrome基线的coverage比例时选择HTTP引擎，否则选择Chrome
+    - 决策在ttl秒内直接复用，不再探测（为建立基线而选择的Chrome除外）
+    """
+    
+    def __init__(self, store_path: str, ttl: float = 6 * 3600, coverage: float = 0.9):
+        """初始化引擎选择器
+        
+        Args:
+            store_path: 决策和Chrome基线的存储文件路径（JSON）
+            ttl: 决策有效期（秒）
+            coverage: 静态新闻项数量至少达到Chrome基线的多少比例才使用HTTP引擎
+        """
+        self.logger = get_logger()
+        self.store_path = store_path
+        self.ttl = ttl
+        self.coverage = coverage
+        self.lock = threading.Lock()
+        self.state = self._load()
+    
+    def _load(self) -> Dict:
+        """从磁盘加载决策和基线"""
+        state = {'engine': None, 'decided_at': 0, 'static_items': None, 'chrome_items': None, 'chrome_measured_at': 0}
+        try:
+            state.update(load_json(self.store_path, {}))
+        except Exception as e:
+            self.logger.warning(f"加载引擎选择记录失败: {e}")
+        return state
+    
+    def _save(self):
+        """将决策和基线写回磁盘（调用方需持有锁）"""
+        try:
+            save_json(self.store_path, self.state)
+        except Exception as e:
+            self.logger.warning(f"保存引擎选择记录失败: {e}")
+    
+    def cached_decision(self) -> Optional[str]:
+        """有效期内的引擎决策，没有或已过期时返回None"""
+        with self.lock:
+            engine = self.state['engine']
+            if engine and time.time() - self.state['decided_at'] < self.ttl:
+                return engine
+            return None
+    
+    def decide(self, static_items: int, http_engine: str) -> str:
+        """根据静态HTML的新闻项数量选择引擎并缓存决策
+        
+        Args:
+            static_items: 静态HTML索引页上的新闻项数量
+            http_engine: 不需要Chrome时使用的HTTP引擎（requests/async）
+        
+        Returns:
+            选择的引擎: chrome/requests/async
+        """
+        with self.lock:
+            chrome_items = self.state['chrome_items']
+            if static_items == 0:
+                engine, reason = 'chrome', "静态HTML中没有新闻项，需要JavaScript渲染"
+            elif not chrome_items:
+                engine, reason = 'chrome', "还没有Chrome基线，本次使用Chrome建立基线"
+            elif static_items >= chrome_items * self.coverage:
+                engine, reason = http_engine, f"静态HTML新闻项 {static_items} 个，Chrome基线 {chrome_items} 个"
+            else:
+                engine, reason = 'chrome', f"静态HTML新闻项 {static_items} 个，少于Chrome基线 {chrome_items} 个"
+            
+            # 为建立基线而选择的Chrome不缓存，基线记录后下次重新比较
+            decided_at = time.time() if chrome_items else 0
+            self.state.update({'engine': engine, 'decided_at': decided_at, 'static_items': static_items})
+            self._save()
+        
+        self.logger.info(f"引擎选择: {engine} ({reason})")
+        return engine
+    
+    def record_chrome_baseline(self, chrome_items: int):
+        """记录Chrome渲染后索引页上的新闻项数量"""
+        if chrome_items <= 0:
+            return
+        with self.lock:
+            self.state.update({'chrome_items': chrome_items, 'chrome_measured_at': time.time()})
+            self._save()
+        self.logger.debug(f"Chrome基线: 索引页 {chrome_items} 个新闻项")
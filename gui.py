@@ -14,6 +14,7 @@ import subprocess
 from datetime import datetime, timedelta
 from config import ConfigManager
 from detik_crawler import DetikCrawler
+from driver_pool import create_driver_pool
 from data_processor import DataProcessor
 from logger import setup_logger
 
@@ -53,6 +54,8 @@ class DetikCrawlerGUI:
         self.logger = setup_logger()
         self.crawler = None
         self.processor = None
+        # 常驻WebDriver池：多次爬取复用同一个浏览器，界面启动时在后台预热
+        self.driver_pool = create_driver_pool(self.config)
         
         # 添加超时和检查相关变量
         self.crawling_start_time = None
@@ -69,6 +72,18 @@ class DetikCrawlerGUI:
         # 设置默认日期（昨天）
         yesterday = datetime.now() - timedelta(days=1)
         self.date_var.set(yesterday.strftime('%Y-%m-%d'))
+        
+        self.prewarm_driver_pool()
+    
+    def prewarm_driver_pool(self):
+        """在后台预热WebDriver池（爬取模式可能使用Chrome时）"""
+        if not self.driver_pool:
+            return
+        try:
+            if DetikCrawler(self.config, driver_pool=self.driver_pool).prewarm_driver_pool():
+                self.logger.info("已开始在后台预热浏览器")
+        except Exception as e:
+            self.logger.warning(f"浏览器预热失败: {e}")
     
     def setup_gui_logging(self):
         """设置GUI日志处理"""
@@ -365,7 +380,7 @@ class DetikCrawlerGUI:
             self.log_message("开始初始化爬虫...")
             
             # 初始化爬虫和处理器
-            self.crawler = DetikCrawler(self.config)
+            self.crawler = DetikCrawler(self.config, driver_pool=self.driver_pool)
             self.processor = DataProcessor(self.config)
             
             self.log_message(f"开始爬取 {target_date} 的新闻数据...")
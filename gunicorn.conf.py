@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+gunicorn配置（gunicorn从工作目录自动加载）
+每个工作进程加载应用后在后台预热WebDriver池；主进程和单纯导入app模块时不启动浏览器
+"""
+
+
+def post_worker_init(worker):
+    """工作进程初始化完成后预热WebDriver池"""
+    from app import prewarm_driver_pool
+    prewarm_driver_pool()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML解析模块
+统一创建BeautifulSoup对象：按配置选择解析后端（lxml优先，未安装时使用html.parser），
+并按响应头显式解码页面，避免BeautifulSoup对bytes做编码探测
+"""
+
+import codecs
+import re
+from typing import Iterable, List, Optional, Union
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from logger import get_logger
+
+# auto模式按顺序选择第一个可用的后端（lxml为C实现，html.parser为纯Python实现）
+PARSER_BACKENDS = ('lxml', 'html.parser')
+
+# Content-Type头和<meta>标签中的字符集声明
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.I)
+
+
+def element_strainer(tags: Iterable[str], classes: Iterable[str]) -> SoupStrainer:
+    """只保留指定标签或带指定class的元素（连同其子树）的SoupStrainer
+    
+    Args:
+        tags: 标签名，如article
+        classes: class名，元素的任一class匹配即保留
+    
+    Returns:
+        用于BeautifulSoup(parse_only=...)的SoupStrainer
+    """
+    tags = frozenset(tags)
+    classes = frozenset(classes)
+    
+    def match(name, attrs) -> bool:
+        if name in tags:
+            return True
+        value = attrs.get('class') if attrs else None
+        if not value:
+            return False
+        # 解析过程中class可能是原始字符串，也可能已拆分为列表
+        names = value.split() if isinstance(value, str) else value
+        return not classes.isdisjoint(names)
+    
+    return SoupStrainer(match)
+
+
+def available_backends() -> List[str]:
+    """当前环境可用的解析后端"""
+    backends = []
+    for backend in PARSER_BACKENDS:
+        try:
+            BeautifulSoup('', backend)
+        except FeatureNotFound:
+            continue
+        backends.append(backend)
+    return backends
+
+
+class HtmlParser:
+    """HTML解析器（选择器语义由BeautifulSoup/soupsieve保证，与后端无关）"""
+    
+    def __init__(self, backend: str = 'auto'):
+        """初始化解析器
+        
+        Args:
+            backend: 解析后端: auto/lxml/html.parser
+        """
+        self.logger = get_logger()
+        available = available_backends()
+        if backend == 'auto':
+            self.backend = available[0]
+        elif backend in available:
+            self.backend = backend
+        else:
+            self.backend = available[0]
+            self.logger.warning(f"HTML解析后端 {backend} 不可用，使用 {self.backend}")
+    
+    def parse(self, markup: Union[str, bytes], content_type: Optional[str] = None,
+              parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """解析HTML
+        
+        Args:
+            markup: 页面HTML，bytes会先按content_type显式解码
+            content_type: 响应的Content-Type头
+            parse_only: 只构建匹配部分的SoupStrainer，None表示构建完整文档树
+        
+        Returns:
+            BeautifulSoup对象
+        """
+        if isinstance(markup, bytes):
+            markup = self.decode(markup, content_type)
+        return BeautifulSoup(markup, self.backend, parse_only=parse_only)
+    
+    @staticmethod
+    def decode(content: bytes, content_type: Optional[str] = None) -> str:
+        """按响应头、<meta>声明、UTF-8的顺序确定字符集并解码页面
+        
+        Args:
+            content: 页面内容
+            content_type: 响应的Content-Type头
+        
+        Returns:
+            解码后的HTML
+        """
+        candidates = []
+        if content_type:
+            match = _HEADER_CHARSET.search(content_type)
+            if match:
+                candidates.append(match.group(1))
+        match = _META_CHARSET.search(content[:4096])
+        if match:
+            candidates.append(match.group(1).decode('ascii', 'ignore'))
+        
+        for charset in candidates:
+            try:
+                codecs.lookup(charset)
+            except LookupError:
+                continue
+            return content.decode(charset, errors='replace')
+        return content.decode('utf-8', errors='replace')
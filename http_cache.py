@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP响应缓存模块
+按规范化URL在磁盘上缓存响应内容和响应头，
+支持ETag/If-Modified-Since条件请求重新验证，按总大小做LRU淘汰
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from json_store import save_json, write_atomic
+from logger import get_logger
+
+
+class ResponseCache:
+    """磁盘HTTP响应缓存
+    
+    每个条目由两个文件组成：<hash>.body保存响应内容，<hash>.json保存元数据。
+    命中时更新元数据文件的修改时间，淘汰时按修改时间从旧到新删除。
+    """
+    
+    # 需要保存的响应头
+    STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Date', 'Cache-Control')
+    
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """初始化响应缓存
+        
+        Args:
+            cache_dir: 缓存目录
+            max_bytes: 缓存总大小上限（字节）
+        """
+        self.logger = get_logger()
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.total_bytes = self._scan_size()
+    
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """规范化URL：小写协议和主机，去掉片段，查询参数排序"""
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        path = parts.path or '/'
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+    
+    def _paths(self, url: str) -> Tuple[str, str]:
+        """返回URL对应的(内容文件, 元数据文件)路径"""
+        key = hashlib.sha1(self.normalize_url(url).encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}.body", f"{base}.json"
+    
+    def _scan_size(self) -> int:
+        """统计缓存目录当前占用的字节数"""
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.body') or name.endswith('.json'):
+                    try:
+                        total += os.path.getsize(os.path.join(root, name))
+                    except OSError:
+                        continue
+        return total
+    
+    def get(self, url: str) -> Optional[Tuple[Dict, bytes]]:
+        """读取缓存条目
+        
+        Returns:
+            (元数据, 响应内容)，未命中时返回None
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        
+        # 更新访问时间，用于LRU淘汰
+        try:
+            os.utime(meta_path, None)
+        except OSError:
+            pass
+        return meta, body
+    
+    def put(self, url: str, status_code: int, headers, body: bytes):
+        """写入缓存条目（只缓存200响应）
+        
+        Args:
+            url: 请求URL
+            status_code: HTTP状态码
+            headers: 响应头（支持get方法的映射）
+            body: 响应内容
+        """
+        if status_code != 200:
+            return
+        
+        meta = {
+            'url': url,
+            'status_code': status_code,
+            'headers': {name: headers.get(name) for name in self.STORED_HEADERS if headers.get(name)},
+            'stored_at': time.time()
+        }
+        body_path, meta_path = self._paths(url)
+        
+        with self.lock:
+            old_size = self._entry_size(body_path, meta_path)
+            try:
+                write_atomic(body_path, body)
+                save_json(meta_path, meta)
+            except OSError as e:
+                self.logger.warning(f"写入响应缓存失败: {url} - {e}")
+                return
+            self.total_bytes += self._entry_size(body_path, meta_path) - old_size
+            
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+    
+    def touch(self, url: str):
+        """条件请求返回304时刷新条目的验证时间"""
+        cached = self.get(url)
+        if not cached:
+            return
+        meta, body = cached
+        meta['stored_at'] = time.time()
+        _, meta_path = self._paths(url)
+        with self.lock:
+            try:
+                save_json(meta_path, meta)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def conditional_headers(meta: Dict) -> Dict[str, str]:
+        """根据缓存元数据生成条件请求头"""
+        headers = {}
+        stored = meta.get('headers', {})
+        if stored.get('ETag'):
+            headers['If-None-Match'] = stored['ETag']
+        if stored.get('Last-Modified'):
+            headers['If-Modified-Since'] = stored['Last-Modified']
+        return headers
+    
+    @staticmethod
+    def build_response(meta: Dict, body: bytes) -> requests.Response:
+        """用缓存条目构造requests.Response，调用方无需区分是否来自缓存"""
+        response = requests.Response()
+        response.status_code = meta.get('status_code', 200)
+        response.url = meta.get('url', '')
+        response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+        response._content = body
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.reason = 'OK'
+        return response
+    
+    def record(self, outcome: str):
+        """记录一次缓存结果（hit/revalidated/miss）"""
+        with self.lock:
+            if outcome == 'hit':
+                self.hits += 1
+            elif outcome == 'revalidated':
+                self.revalidated += 1
+            else:
+                self.misses += 1
+    
+    def summary(self) -> str:
+        """缓存统计摘要"""
+        return (f"命中 {self.hits} 次，304重新验证 {self.revalidated} 次，未命中 {self.misses} 次，"
+                f"占用 {self.total_bytes / 1024 / 1024:.1f}MB")
+    
+    @staticmethod
+    def _entry_size(body_path: str, meta_path: str) -> int:
+        size = 0
+        for path in (body_path, meta_path):
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                continue
+        return size
+    
+    def _evict(self):
+        """按最近访问时间淘汰条目，直到总大小降到上限的90%（调用方需持有锁）"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.json'):
+                    meta_path = os.path.join(root, name)
+                    try:
+                        entries.append((os.path.getmtime(meta_path), meta_path))
+                    except OSError:
+                        continue
+        
+        entries.sort()
+        target = self.max_bytes * 0.9
+        removed = 0
+        for _, meta_path in entries:
+            if self.total_bytes <= target:
+                break
+            body_path = meta_path[:-len('.json')] + '.body'
+            size = self._entry_size(body_path, meta_path)
+            for path in (body_path, meta_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.total_bytes -= size
+            removed += 1
+        
+        self.logger.info(f"响应缓存超过上限，淘汰 {removed} 个条目")
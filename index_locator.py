@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+索引页定位模块
+对历史日期用指数探测+二分查找定位目标日期在/indeks中的起始页，
+探测次数为O(log 页数)，代替从第1页开始的线性扫描
+"""
+
+from datetime import date, datetime
+from typing import Callable, Dict, Optional, Tuple
+from logger import get_logger
+
+# 探测函数：输入页码，返回该页(最新时间, 最早时间)，失败时返回None
+PageProbe = Callable[[int], Optional[Tuple[datetime, datetime]]]
+
+
+def locate_first_page(probe: PageProbe, target_date: date, max_page: int = 50,
+                      hint: Optional[int] = None) -> int:
+    """定位第一个包含目标日期（或更早）新闻的索引页
+    
+    索引页按时间倒序排列，因此“该页最早的新闻不晚于目标日期”
+    对页码是单调的，可以二分查找满足条件的最小页码。
+    如果某页同时包含晚于和不晚于目标日期的新闻，该页就是答案，可以提前结束。
+    
+    Args:
+        probe: 页面探测函数
+        target_date: 目标日期
+        max_page: 允许探测的最大页码
+        hint: 预测的起始页，提供时从该页向两侧指数探测
+    
+    Returns:
+        起始页码；探测失败时返回已知仍在目标日期之前（更新）的最后一页，
+        由调用方从该页继续线性翻页
+    """
+    logger = get_logger()
+    cache: Dict[int, Optional[Tuple[datetime, datetime]]] = {}
+    
+    def bounds_of(page: int) -> Optional[Tuple[datetime, datetime]]:
+        if page not in cache:
+            cache[page] = probe(page)
+            if cache[page]:
+                newest, oldest = cache[page]
+                logger.info(f"探测第 {page} 页: {newest:%Y-%m-%d %H:%M} ~ {oldest:%Y-%m-%d %H:%M}")
+            else:
+                logger.warning(f"探测第 {page} 页失败")
+        return cache[page]
+    
+    def reached(page: int) -> Optional[bool]:
+        """该页是否已翻到目标日期（None表示探测失败）"""
+        bounds = bounds_of(page)
+        if bounds is None:
+            return None
+        return bounds[1].date() <= target_date
+    
+    def is_first(page: int) -> bool:
+        """该页跨越目标日期的结束边界（或是第1页），即为起始页"""
+        bounds = cache.get(page)
+        return bool(bounds) and bounds[1].date() <= target_date and (page == 1 or bounds[0].date() > target_date)
+    
+    def done(page: int) -> int:
+        logger.info(f"定位到目标日期 {target_date} 的起始页: 第 {page} 页 (共探测 {len(cache)} 页)")
+        return page
+    
+    start = min(max(1, hint or 1), max_page)
+    result = reached(start)
+    if result is None:
+        return 1
+    if is_first(start):
+        return done(start)
+    
+    if result:
+        # 起始页已到达目标日期，向前（更小页码）指数探测直到未到达
+        hi, step = start, 1
+        while True:
+            lo = max(0, hi - step)
+            if lo == 0:
+                break
+            result = reached(lo)
+            if result is None:
+                return done(hi)
+            if is_first(lo):
+                return done(lo)
+            if not result:
+                break
+            hi, step = lo, step * 2
+    else:
+        # 起始页尚未到达目标日期，向后指数探测上界
+        lo, step = start, 1
+        while True:
+            if lo >= max_page:
+                logger.warning(f"第 {max_page} 页仍未到达目标日期 {target_date}")
+                return max_page
+            hi = min(lo + step, max_page)
+            result = reached(hi)
+            if result is None:
+                return lo
+            if is_first(hi):
+                return done(hi)
+            if result:
+                break
+            lo, step = hi, step * 2
+    
+    # 二分查找：lo页未到达目标日期（0表示第1页之前），hi页已到达
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        result = reached(mid)
+        if result is None:
+            return max(1, lo)
+        if is_first(mid):
+            return done(mid)
+        if result:
+            hi = mid
+        else:
+            lo = mid
+    
+    return done(hi)
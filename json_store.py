@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON状态文件读写模块
+熔断器、引擎选择、索引页偏移模型、ChromeDriver路径缓存和HTTP响应缓存共用：
+写入时先写同目录下的唯一临时文件再原子替换，多个线程或进程（Web应用、GUI、定时任务）
+同时保存时不会互相覆盖临时文件，读取方也不会读到写了一半的文件
+"""
+
+import json
+import os
+import tempfile
+from typing import Any
+
+
+def load_json(path: str, default: Any = None) -> Any:
+    """读取JSON文件
+    
+    Args:
+        path: 文件路径
+        default: 文件不存在时的返回值
+    
+    Returns:
+        解析后的数据；文件损坏时抛出异常，由调用方记录日志
+    """
+    if not os.path.exists(path):
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(path: str, data: Any):
+    """原子写入JSON文件（失败时抛出异常，由调用方记录日志）
+    
+    Args:
+        path: 文件路径，所在目录不存在时自动创建
+        data: 可JSON序列化的数据
+    """
+    write_atomic(path, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+
+def write_atomic(path: str, data: bytes):
+    """先写同目录下的唯一临时文件再原子替换目标文件（失败时抛出异常，由调用方记录日志）
+    
+    Args:
+        path: 文件路径，所在目录不存在时自动创建
+        data: 文件内容
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=directory, prefix=f"{os.path.basename(path)}.",
+                                     suffix='.tmp', delete=False) as f:
+        tmp_path = f.name
+        try:
+            f.write(data)
+        except Exception:
+            f.close()
+            os.remove(tmp_path)
+            raise
+    try:
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文章结构化元数据提取模块
+一次遍历<head>读取JSON-LD（NewsArticle等）和og:/article:等meta标签，
+为文章的标题、发布时间和正文提供DOM选择器之前的快速提取层，并统计各字段在每一层的命中情况
+（发布时间转换为网站显示的格式，与DOM提取的结果一致）
+"""
+
+import html
+import json
+import threading
+from typing import Dict, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from date_parser import format_display_time
+from logger import get_logger
+
+# 提取层（按优先级），DOM为爬虫原有的选择器级联
+TIERS = ('json-ld', 'meta', 'dom')
+FIELDS = ('title', 'publish_time', 'content')
+
+# 视为文章的JSON-LD类型
+ARTICLE_TYPES = frozenset({'NewsArticle', 'Article', 'ReportageNewsArticle', 'AnalysisNewsArticle', 'BlogPosting'})
+
+# JSON-LD属性对应的字段
+_JSON_LD_FIELDS = (
+    ('headline', 'title'),
+    ('datePublished', 'publish_time'),
+    ('articleBody', 'content'),
+)
+
+# meta标签（property或name）对应的字段，同一字段按列表顺序优先
+_META_FIELDS = {
+    'og:title': ('title', 0),
+    'twitter:title': ('title', 1),
+    'article:published_time': ('publish_time', 0),
+    'publishdate': ('publish_time', 1),
+    'dtk:publishdate': ('publish_time', 2),
+}
+
+
+class MetadataStats:
+    """各字段在每个提取层的命中统计"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Dict[str, Dict[Optional[str], int]] = {field: {} for field in FIELDS}
+    
+    def record(self, field: str, tier: Optional[str]):
+        """记录一个字段的提取结果
+        
+        Args:
+            field: 字段名
+            tier: 命中的提取层，所有层都没有提取到时为None
+        """
+        with self.lock:
+            counts = self.counts[field]
+            counts[tier] = counts.get(tier, 0) + 1
+    
+    def summary(self) -> str:
+        """命中率摘要"""
+        parts = []
+        with self.lock:
+            for field in FIELDS:
+                counts = self.counts[field]
+                total = sum(counts.values())
+                if not total:
+                    continue
+                rates = ' '.join(f"{tier} {counts.get(tier, 0) / total:.0%}" for tier in TIERS)
+                parts.append(f"{field}: {rates} 缺失 {counts.get(None, 0)} ({total} 篇)")
+        return '；'.join(parts) or "没有解析文章"
+
+
+class MetadataExtractor:
+    """文章元数据提取器"""
+    
+    def __init__(self):
+        self.logger = get_logger()
+        self.stats = MetadataStats()
+    
+    def extract(self, soup: BeautifulSoup) -> Dict[str, Tuple[str, str]]:
+        """一次遍历<head>提取结构化元数据
+        
+        Args:
+            soup: 文章页的BeautifulSoup对象
+        
+        Returns:
+            {字段: (值, 提取层)}，只包含找到的字段，JSON-LD优先于meta标签；
+            发布时间为"Minggu, 03 Agu 2025 13:54 WIB"格式，无法识别的时间视为缺失
+        """
+        head = soup.head or soup
+        json_ld: Dict[str, str] = {}
+        meta: Dict[str, Tuple[int, str]] = {}
+        
+        for tag in head.find_all(('meta', 'script')):
+            if tag.name == 'script':
+                if not json_ld and (tag.get('type') or '').lower() == 'application/ld+json':
+                    json_ld = self._parse_json_ld(tag.string or '')
+                continue
+            
+            key = (tag.get('property') or tag.get('name') or '').lower()
+            if key not in _META_FIELDS:
+                continue
+            value = (tag.get('content') or '').strip()
+            field, rank = _META_FIELDS[key]
+            if value and (field not in meta or rank < meta[field][0]):
+                meta[field] = (rank, value)
+        
+        metadata = {}
+        for field in FIELDS:
+            for value, tier in ((json_ld.get(field), 'json-ld'), (meta.get(field, (0, None))[1], 'meta')):
+                if value and field == 'publish_time':
+                    value = format_display_time(value)
+                if value:
+                    metadata[field] = (value, tier)
+                    break
+        return metadata
+    
+    def _parse_json_ld(self, text: str) -> Dict[str, str]:
+        """从一个JSON-LD脚本中取出第一个文章对象的字段"""
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            self.logger.debug(f"JSON-LD解析失败: {e}")
+            return {}
+        
+        # 支持单个对象、对象列表和@graph
+        nodes = data if isinstance(data, list) else [data]
+        for node in list(nodes):
+            if isinstance(node, dict) and isinstance(node.get('@graph'), list):
+                nodes.extend(node['@graph'])
+        
+        for node in nodes:
+            if not isinstance(node, dict):
+                continue
+            types = node.get('@type')
+            types = types if isinstance(types, list) else [types]
+            if ARTICLE_TYPES.isdisjoint(t for t in types if isinstance(t, str)):
+                continue
+            
+            fields = {}
+            for key, field in _JSON_LD_FIELDS:
+                value = node.get(key)
+                if isinstance(value, str) and value.strip():
+                    fields[field] = html.unescape(value).strip()
+            return fields
+        return {}
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+索引页偏移模型模块
+记录每次翻页观察到的(时间, 页码, 最新/最早新闻时间)，
+据此预测某个日期在当前时刻从/indeks的第几页开始
+"""
+
+import statistics
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from json_store import load_json, save_json
+from logger import get_logger
+
+
+class PageOffsetModel:
+    """基于历史观测的索引页偏移模型
+    
+    每页新闻覆盖的时间跨度取最近观测的中位数；第1页最新新闻距观测时刻的时长（第1页偏移）
+    由每条观测按页码和跨度折算后取中位数。目标日期结束时刻距今的时长减去第1页偏移，
+    再除以每页跨度即为预测页码。
+    """
+    
+    def __init__(self, store_path: str, max_observations: int = 500):
+        """初始化模型
+        
+        Args:
+            store_path: 观测数据文件路径（JSON）
+            max_observations: 保留的最大观测条数
+        """
+        self.logger = get_logger()
+        self.store_path = store_path
+        self.max_observations = max_observations
+        self.observations: List[Dict] = []
+        self.lock = threading.Lock()
+        self._load()
+    
+    def _load(self):
+        """从磁盘加载观测数据"""
+        try:
+            self.observations = load_json(self.store_path, {}).get('observations', [])
+        except Exception as e:
+            self.logger.warning(f"加载索引页偏移数据失败: {e}")
+            self.observations = []
+    
+    def save(self):
+        """将观测数据写回磁盘（先写临时文件再原子替换）"""
+        with self.lock:
+            data = {'observations': self.observations[-self.max_observations:]}
+        try:
+            save_json(self.store_path, data)
+        except Exception as e:
+            self.logger.warning(f"保存索引页偏移数据失败: {e}")
+    
+    def record(self, page: int, newest: datetime, oldest: datetime, item_count: int):
+        """记录一次索引页观测
+        
+        Args:
+            page: 页码
+            newest: 该页最新新闻时间（带时区）
+            oldest: 该页最早新闻时间（带时区）
+            item_count: 该页可解析时间的新闻数量
+        """
+        with self.lock:
+            self.observations.append({
+                'observed_at': time.time(),
+                'page': page,
+                'newest': newest.timestamp(),
+                'oldest': oldest.timestamp(),
+                'count': item_count
+            })
+            if len(self.observations) > self.max_observations:
+                self.observations = self.observations[-self.max_observations:]
+    
+    def seconds_per_page(self) -> Optional[float]:
+        """估计每个索引页覆盖的时间跨度（秒）"""
+        with self.lock:
+            recent = self.observations[-100:]
+        
+        spans = []
+        for obs in recent:
+            count = obs.get('count', 0)
+            span = obs['newest'] - obs['oldest']
+            if count > 1 and span > 0:
+                # 页内跨度只包含count-1个间隔，换算为整页
+                spans.append(span / (count - 1) * count)
+        
+        if not spans:
+            return None
+        return statistics.median(spans)
+    
+    def page_one_offset(self, seconds_per_page: float) -> float:
+        """估计第1页最新新闻距当前时刻的时长（秒）
+        
+        每条观测的(观测时刻 - 该页最新新闻时间)减去前面各页覆盖的时长，即为观测时第1页的偏移。
+        
+        Args:
+            seconds_per_page: 每页覆盖的时间跨度（秒）
+        
+        Returns:
+            偏移时长，没有观测时为0
+        """
+        with self.lock:
+            recent = self.observations[-100:]
+        
+        offsets = [obs['observed_at'] - obs['newest'] - (obs['page'] - 1) * seconds_per_page
+                   for obs in recent if 'observed_at' in obs and 'page' in obs]
+        if not offsets:
+            return 0.0
+        return max(0.0, statistics.median(offsets))
+    
+    def predict(self, day_end: datetime, now: datetime) -> Optional[int]:
+        """预测目标日期最后一篇新闻所在的索引页
+        
+        Args:
+            day_end: 目标日期结束时刻（次日零点，带时区）
+            now: 当前时刻（带时区）
+        
+        Returns:
+            预测页码，没有足够观测时返回None
+        """
+        seconds_per_page = self.seconds_per_page()
+        if not seconds_per_page:
+            return None
+        
+        age = (now - day_end).total_seconds() - self.page_one_offset(seconds_per_page)
+        if age <= 0:
+            return 1
+        return 1 + int(age // seconds_per_page)
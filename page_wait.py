@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+页面等待模块
+用显式条件等待代替隐式等待和固定的sleep：先等文档可用，再等索引项数量达标或DOM停止变化，
+每一步有独立的时间预算，并返回实际等待的时长
+"""
+
+import time
+from typing import Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# 不等待加载完成的导航：先给旧文档打上标记，新文档替换旧文档后标记自然消失
+NAVIGATE_SCRIPT = "window.__staleIndexPage = true; window.location.href = arguments[0];"
+
+# body已出现且不是导航前的旧文档
+DOCUMENT_READY_SCRIPT = "return !!document.body && !window.__staleIndexPage;"
+
+# 一次往返读取文档状态：索引项数量和DOM节点总数（body不存在时返回null）
+PAGE_STATE_SCRIPT = """
+if (!document.body) { return null; }
+return [document.querySelectorAll(arguments[0]).length, document.getElementsByTagName('*').length];
+"""
+
+
+class _ItemsOrStable:
+    """等待条件：索引项数量达到下限，或DOM节点数连续若干次轮询不变"""
+    
+    def __init__(self, item_selector: str, min_items: int, stable_polls: int):
+        self.item_selector = item_selector
+        self.min_items = min_items
+        self.stable_polls = stable_polls
+        self.last_nodes = None
+        self.unchanged = 0
+        self.items = 0
+    
+    def __call__(self, driver) -> Optional[str]:
+        state = driver.execute_script(PAGE_STATE_SCRIPT, self.item_selector)
+        if not state:
+            return None
+        self.items, nodes = state
+        if self.items >= self.min_items:
+            return f"{self.items} 个索引项"
+        
+        self.unchanged = self.unchanged + 1 if nodes == self.last_nodes else 0
+        self.last_nodes = nodes
+        if self.unchanged >= self.stable_polls:
+            return f"DOM已稳定 ({self.items} 个索引项)"
+        return None
+
+
+class IndexPageWait:
+    """索引页显式等待
+    
+    - 第一步：等待body出现，超时抛出TimeoutException（由调用方重试）
+    - 第二步：等待索引项数量达到min_items或DOM稳定，超时不算失败，直接解析已加载的内容
+    """
+    
+    def __init__(self, item_selector: str, ready_timeout: float = 45, items_timeout: float = 10,
+                 min_items: int = 10, poll_interval: float = 0.25, stable_polls: int = 2):
+        """初始化等待策略
+        
+        Args:
+            item_selector: 索引项的CSS选择器
+            ready_timeout: 等待文档可用的时间预算（秒）
+            items_timeout: 等待索引项或DOM稳定的时间预算（秒）
+            min_items: 出现多少个索引项即认为页面可解析
+            poll_interval: 轮询间隔（秒）
+            stable_polls: DOM节点数连续多少次轮询不变视为稳定
+        """
+        self.item_selector = item_selector
+        self.ready_timeout = ready_timeout
+        self.items_timeout = items_timeout
+        self.min_items = min_items
+        self.poll_interval = poll_interval
+        self.stable_polls = stable_polls
+    
+    def wait(self, driver) -> Tuple[float, str]:
+        """等待当前页面可以解析
+        
+        Args:
+            driver: WebDriver实例（页面已开始加载）
+        
+        Returns:
+            (实际等待的秒数, 结束等待的原因)
+        """
+        start = time.monotonic()
+        WebDriverWait(driver, self.ready_timeout, poll_frequency=self.poll_interval).until(
+            lambda d: d.execute_script(DOCUMENT_READY_SCRIPT), "等待页面body超时"
+        )
+        
+        condition = _ItemsOrStable(self.item_selector, self.min_items, self.stable_polls)
+        try:
+            reason = WebDriverWait(driver, self.items_timeout, poll_frequency=self.poll_interval).until(condition)
+        except TimeoutException:
+            reason = f"等待超时 ({condition.items} 个索引项)"
+        return time.monotonic() - start, reason
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML解析后端基准测试
+对索引页和文章页分别用每个可用的解析后端解析并执行提取逻辑，输出每页耗时
+（索引页同时测试完整解析和只解析新闻项目容器的部分解析）
+
+用法:
+    python parser_benchmark.py                      # 下载索引页首页及其第一篇文章
+    python parser_benchmark.py page1.html page2.html --repeat 20
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+
+from config import ConfigManager
+from detik_crawler import DetikCrawler
+from html_parser import HtmlParser, available_backends, element_strainer
+
+
+def load_pages(crawler: DetikCrawler, paths):
+    """读取本地HTML文件，未指定时下载索引页首页和其中的第一篇文章"""
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                pages.append((path, HtmlParser.decode(f.read())))
+        return pages
+    
+    index_html = crawler._fetch_index_page(f"{crawler.base_url}/indeks")
+    pages = [('indeks', index_html)]
+    soup = crawler._parse_index_html(index_html)
+    link = soup.select_one("a[href*='/berita/']")
+    if link and link.get('href'):
+        article_html = crawler._fetch_article_html(link['href'])
+        if article_html:
+            pages.append((link['href'], article_html))
+    return pages
+
+
+def extract(crawler: DetikCrawler, soup):
+    """执行与爬取时相同的提取逻辑（有新闻列表按索引页处理，否则按文章页处理）"""
+    if crawler._count_index_items(soup):
+        crawler._extract_news_urls_with_requests(soup, datetime.now())
+    else:
+        crawler._extract_title(soup)
+        crawler._extract_content(soup)
+        crawler._extract_title_with_requests(soup)
+        crawler._extract_content_with_requests(soup)
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="HTML解析后端基准测试")
+    parser.add_argument('files', nargs='*', help='本地HTML文件（默认在线下载）')
+    parser.add_argument('--repeat', '-n', type=int, default=10, help='每页重复次数 (默认: 10)')
+    args = parser.parse_args()
+    
+    crawler = DetikCrawler(ConfigManager())
+    try:
+        pages = load_pages(crawler, args.files)
+    except Exception as e:
+        print(f"获取测试页面失败: {e}")
+        sys.exit(1)
+    
+    print(f"{'后端':<12} {'模式':<6} {'解析(ms/页)':>12} {'解析+提取(ms/页)':>18}  页面")
+    for backend in available_backends():
+        html_parser = HtmlParser(backend)
+        for name, html in pages:
+            # 索引页额外测试只解析新闻项目容器的部分解析
+            modes = [('完整', None)]
+            if crawler._count_index_items(html_parser.parse(html)):
+                modes.append(('部分', element_strainer(crawler.INDEX_ITEM_TAGS, crawler.INDEX_ITEM_CLASSES)))
+            
+            for mode, strainer in modes:
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    html_parser.parse(html, parse_only=strainer)
+                parse_ms = (time.perf_counter() - start) / args.repeat * 1000
+                
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    extract(crawler, html_parser.parse(html, parse_only=strainer))
+                total_ms = (time.perf_counter() - start) / args.repeat * 1000
+                
+                print(f"{backend:<12} {mode:<6} {parse_ms:>12.1f} {total_ms:>18.1f}  {name[:60]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+限速模块
+按主机维护令牌桶，统一控制所有抓取路径的请求速率
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """令牌桶
+    
+    令牌按rate个/秒持续补充，最多积累burst个。
+    令牌不足时允许透支并返回需要等待的时间，
+    因此并发调用者会按到达顺序依次排队。
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        """初始化令牌桶
+        
+        Args:
+            rate: 每秒补充的令牌数
+            burst: 令牌桶容量（允许的突发请求数）
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self):
+        """按流逝时间补充令牌（调用方需持有锁）"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def reserve(self) -> float:
+        """预约一个令牌
+        
+        Returns:
+            获得令牌前需要等待的秒数
+        """
+        with self.lock:
+            self._refill()
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+    
+    def penalize(self, seconds: float):
+        """扣除相当于seconds秒的令牌，使后续请求整体推迟（用于退避）"""
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+class HostRateLimiter:
+    """按主机划分的限速器，线程与协程均可使用"""
+    
+    def __init__(self, rate: float, burst: int):
+        """初始化限速器
+        
+        Args:
+            rate: 每个主机每秒允许的请求数
+            burst: 每个主机允许的突发请求数
+        """
+        self.rate = rate
+        self.burst = burst
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+    
+    def _bucket(self, url: str) -> TokenBucket:
+        """获取URL所属主机的令牌桶"""
+        host = urlparse(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self.buckets[host] = bucket
+            return bucket
+    
+    def reserve(self, url: str) -> float:
+        """为URL预约一个请求配额，返回需要等待的秒数"""
+        if self.rate <= 0:
+            return 0.0
+        return self._bucket(url).reserve()
+    
+    def acquire(self, url: str):
+        """阻塞直到可以向URL所属主机发起请求"""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, url: str):
+        """acquire的协程版本"""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def backoff(self, url: str, seconds: float):
+        """让URL所属主机的后续请求整体推迟seconds秒"""
+        if self.rate <= 0 or seconds <= 0:
+            return
+        self._bucket(url).penalize(seconds)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+重试策略模块
+统一各抓取路径的重试：指数退避加全抖动、每次爬取的重试预算，
+并区分临时错误（超时、连接失败、5xx/429）和永久错误（404、解析失败）
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import requests
+from selenium.common.exceptions import WebDriverException
+from logger import get_logger
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp为可选依赖
+    aiohttp = None
+
+T = TypeVar('T')
+
+
+class PermanentError(Exception):
+    """不应重试的错误（如页面解析失败）"""
+
+
+class RetryPolicy:
+    """重试策略
+    
+    第n次重试前等待 [0, min(max_delay, base_delay * 2^n)] 之间的随机时长（全抖动），
+    同一次爬取中所有调用共享重试预算，预算耗尽后失败直接返回给调用方。
+    """
+    
+    # 视为临时错误的HTTP状态码
+    TRANSIENT_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+    
+    # 视为临时错误的异常类型（WebDriverException包含Selenium的超时和浏览器崩溃）
+    TRANSIENT_EXCEPTIONS = (
+        requests.Timeout,
+        requests.ConnectionError,
+        requests.exceptions.ChunkedEncodingError,
+        asyncio.TimeoutError,
+        TimeoutError,
+        ConnectionError,
+        WebDriverException,
+    ) + ((aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) if aiohttp else ())
+    
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 budget: int = 30):
+        """初始化重试策略
+        
+        Args:
+            max_attempts: 默认的最大尝试次数（含第一次）
+            base_delay: 退避基准时长（秒）
+            max_delay: 单次退避的最大时长（秒）
+            budget: 每次爬取允许的重试总次数
+        """
+        self.logger = get_logger()
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retries_used = 0
+        self.lock = threading.Lock()
+    
+    def reset(self):
+        """开始新的一次爬取时重置重试预算"""
+        with self.lock:
+            self.retries_used = 0
+    
+    @classmethod
+    def is_transient(cls, error: Exception) -> bool:
+        """判断错误是否值得重试"""
+        if isinstance(error, PermanentError):
+            return False
+        
+        # requests.HTTPError带response，aiohttp.ClientResponseError带status
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+        if status is None:
+            status = getattr(error, 'status', None)
+        if isinstance(status, int):
+            return status in cls.TRANSIENT_STATUS_CODES
+        
+        return isinstance(error, cls.TRANSIENT_EXCEPTIONS)
+    
+    def backoff_delay(self, attempt: int) -> float:
+        """第attempt次失败后的退避时长（全抖动）"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+    
+    def _take_budget(self) -> bool:
+        """占用一次重试预算，预算耗尽时返回False"""
+        with self.lock:
+            if self.retries_used >= self.budget:
+                return False
+            self.retries_used += 1
+            return True
+    
+    def _should_retry(self, error: Exception, attempt: int, attempts: int, description: str,
+                      transient: Optional[Callable[[Exception], bool]]) -> bool:
+        """失败后判断是否继续重试，并记录日志"""
+        retryable = transient(error) if transient else self.is_transient(error)
+        if not retryable:
+            self.logger.warning(f"{description} 失败（不可重试）: {error}")
+            return False
+        if attempt >= attempts - 1:
+            self.logger.warning(f"{description} 失败，已达到最大尝试次数 {attempts}: {error}")
+            return False
+        if not self._take_budget():
+            self.logger.warning(f"{description} 失败，本次爬取的重试预算({self.budget}次)已用完: {error}")
+            return False
+        return True
+    
+    def call(self, operation: Callable[[int], T], description: str, max_attempts: Optional[int] = None,
+             wait: Optional[Callable[[float], None]] = None,
+             transient: Optional[Callable[[Exception], bool]] = None) -> T:
+        """按策略执行操作，失败时重试
+        
+        Args:
+            operation: 要执行的操作，参数为当前尝试序号（从0开始）
+            description: 操作描述（用于日志）
+            max_attempts: 最大尝试次数，默认使用策略配置
+            wait: 退避等待函数，默认time.sleep
+            transient: 自定义的可重试判断，默认使用is_transient
+        
+        Returns:
+            操作的返回值；最终失败时抛出最后一次的异常
+        """
+        attempts = max_attempts or self.max_attempts
+        for attempt in range(attempts):
+            try:
+                return operation(attempt)
+            except Exception as e:
+                if not self._should_retry(e, attempt, attempts, description, transient):
+                    raise
+                delay = self.backoff_delay(attempt)
+                self.logger.info(f"{description} 失败 (第{attempt + 1}/{attempts}次): {e}，{delay:.1f}秒后重试")
+                (wait or time.sleep)(delay)
+    
+    async def call_async(self, operation: Callable[[int], Awaitable[T]], description: str,
+                         max_attempts: Optional[int] = None,
+                         wait: Optional[Callable[[float], None]] = None,
+                         transient: Optional[Callable[[Exception], bool]] = None) -> T:
+        """call的协程版本（wait为None时使用asyncio.sleep）"""
+        attempts = max_attempts or self.max_attempts
+        for attempt in range(attempts):
+            try:
+                return await operation(attempt)
+            except Exception as e:
+                if not self._should_retry(e, attempt, attempts, description, transient):
+                    raise
+                delay = self.backoff_delay(attempt)
+                self.logger.info(f"{description} 失败 (第{attempt + 1}/{attempts}次): {e}，{delay:.1f}秒后重试")
+                if wait:
+                    wait(delay)
+                else:
+                    await asyncio.sleep(delay)
+    
+    def summary(self) -> str:
+        """重试统计摘要"""
+        return f"已用重试 {self.retries_used}/{self.budget} 次"
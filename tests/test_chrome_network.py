@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Chrome网络统计测试
+使用替身浏览器返回构造的performance日志，检查传输字节数、拦截请求数和相对基准样本的节省量
+"""
+
+import json
+
+from chrome_network import PageLoadStats, read_network_log
+
+
+def log_entry(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+class FakeDriver:
+    """替身浏览器：get_log返回并清空待读取的日志，脚本返回同源资源的传输字节数"""
+
+    def __init__(self):
+        self.entries = []
+        self.script_result = [1000, 3]
+
+    def load(self, finished_sizes, blocked=0):
+        self.entries += [log_entry('Network.loadingFinished', encodedDataLength=size) for size in finished_sizes]
+        self.entries += [log_entry('Network.loadingFailed', blockedReason='inspector')] * blocked
+
+    def get_log(self, kind):
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_script(self, script):
+        return self.script_result
+
+
+def test_read_network_log_sums_transfer_and_counts_blocked():
+    driver = FakeDriver()
+    driver.load([2048, 4096], blocked=3)
+    driver.entries.append(log_entry('Network.loadingFailed', errorText='net::ERR_FAILED'))
+
+    assert read_network_log(driver) == (6144, 3)
+    assert read_network_log(driver) == (None, 0)
+
+
+def test_page_saving_measured_against_unblocked_sample():
+    stats = PageLoadStats()
+    driver = FakeDriver()
+
+    driver.load([100 * 1024, 400 * 1024])
+    stats.record_baseline(driver, 'https://example.com/indeks', 3.0)
+    driver.load([100 * 1024], blocked=20)
+    stats.record_page(driver, 'https://example.com/indeks?page=2', 1.0)
+
+    assert stats.transferred_bytes == 100 * 1024
+    assert stats.blocked_requests == 20
+    assert stats.saved_bytes == 400 * 1024
+    assert stats.saved_seconds == 2.0
+    assert '节省 400KB' in stats.summary()
+
+
+def test_without_sample_no_saving_and_script_fallback():
+    stats = PageLoadStats()
+    driver = FakeDriver()
+
+    stats.record_page(driver, 'https://example.com/indeks', 1.0)
+    assert stats.transferred_bytes == 1000
+    assert stats.saved_bytes == 0
+    assert '节省' not in stats.summary()
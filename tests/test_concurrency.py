@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+自适应并发控制测试
+使用本地HTTP服务模拟限流（429）和响应变慢，检查并发上限在拥塞时下降、恢复后回升
+"""
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from concurrency import AdaptiveConcurrencyController
+
+
+class ThrottlingServer(ThreadingHTTPServer):
+    """本地替身服务：throttling为True时返回429，否则延迟delay秒后返回200"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), ThrottlingHandler)
+        self.throttling = False
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """按服务端当前状态响应"""
+
+    def do_GET(self):
+        if self.server.throttling:
+            status = 429
+        else:
+            status = 200
+            time.sleep(self.server.delay)
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThrottlingServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def run_requests(controller: AdaptiveConcurrencyController, url: str, count: int, workers: int = 16):
+    """像爬虫一样经由控制器发出count个请求，返回观察到的最大在途请求数"""
+    session = requests.Session()
+    peak = {'in_flight': 0}
+
+    def fetch(_):
+        controller.acquire()
+        peak['in_flight'] = max(peak['in_flight'], controller.in_flight)
+        start = time.monotonic()
+        try:
+            response = session.get(url, timeout=5)
+        except requests.RequestException:
+            controller.release(timed_out=True)
+            return
+        controller.release(latency=time.monotonic() - start, status_code=response.status_code)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(fetch, range(count)))
+    session.close()
+    return peak['in_flight']
+
+
+def make_controller(**kwargs) -> AdaptiveConcurrencyController:
+    options = dict(initial_limit=8, min_limit=1, max_limit=16, window_size=20, decrease_cooldown=0.0)
+    options.update(kwargs)
+    return AdaptiveConcurrencyController(**options)
+
+
+def test_limit_drops_on_429_and_recovers(server):
+    controller = make_controller()
+
+    server.throttling = True
+    run_requests(controller, server.url, 20)
+    throttled_limit = controller.current_limit
+    assert throttled_limit < 8
+
+    # 恢复后保持稳定的响应延迟，避免本机延迟抖动被误判为拥塞
+    server.throttling = False
+    server.delay = 0.01
+    run_requests(controller, server.url, 300)
+    assert controller.current_limit > throttled_limit
+    assert controller.current_limit >= 8
+
+
+def test_limit_drops_when_latency_rises(server):
+    controller = make_controller(initial_limit=4, latency_tolerance=2.0)
+
+    server.delay = 0.005
+    run_requests(controller, server.url, 60, workers=4)
+    limit_before = controller.current_limit
+    assert controller.baseline_p95 is not None
+
+    server.delay = 0.2
+    run_requests(controller, server.url, 40, workers=4)
+    assert controller.current_limit < limit_before
+
+
+def test_in_flight_never_exceeds_limit(server):
+    controller = make_controller(initial_limit=3, max_limit=3)
+
+    server.delay = 0.02
+    peak = run_requests(controller, server.url, 30)
+    assert peak <= 3
+    assert controller.in_flight == 0
+
+
+def test_disabled_controller_keeps_max_limit(server):
+    controller = make_controller(enabled=False)
+
+    server.throttling = True
+    run_requests(controller, server.url, 20)
+    assert controller.current_limit == 16
+
+
+def release_with_latencies(controller: AdaptiveConcurrencyController, latencies):
+    """不经过网络，按给定延迟依次完成请求"""
+    for latency in latencies:
+        controller.acquire()
+        controller.release(latency=latency, status_code=200)
+
+
+def test_jitter_at_near_zero_latency_is_not_congestion():
+    controller = make_controller(initial_limit=4, max_limit=4)
+    rng = random.Random(1)
+
+    # 本机级别的延迟：多数约1ms，偶尔出现10ms的抖动
+    release_with_latencies(controller, (0.01 if rng.random() < 0.1 else 0.001 for _ in range(2000)))
+    assert controller.current_limit == 4
+
+
+def test_baseline_follows_gradual_latency_change():
+    controller = make_controller(initial_limit=4, max_limit=4)
+
+    # 延迟在2000个请求内从0.1s缓慢升到0.3s，不是拥塞
+    release_with_latencies(controller, (0.1 + 0.2 * i / 2000 for i in range(2000)))
+    assert controller.current_limit == 4
+    assert controller.baseline_p95 > 0.25
+
+
+def test_async_waiter_wakes_on_release():
+    controller = make_controller(initial_limit=1, max_limit=1)
+
+    async def scenario():
+        await controller.acquire_async()
+        waiter = asyncio.ensure_future(controller.acquire_async())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        controller.release(latency=0.01, status_code=200)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert controller.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_async_waiter_does_not_take_a_slot():
+    controller = make_controller(initial_limit=1, max_limit=1)
+
+    async def scenario():
+        await controller.acquire_async()
+        waiter = asyncio.ensure_future(controller.acquire_async())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert controller.async_waiters == []
+        controller.release(latency=0.01, status_code=200)
+        assert controller.in_flight == 0
+        await asyncio.wait_for(controller.acquire_async(), timeout=1)
+
+    asyncio.run(scenario())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebDriver池测试
+使用替身浏览器（不启动Chrome），检查预热的浏览器被第一个租用方复用、预热期间不会另起浏览器，
+以及按页数和JS堆增长回收浏览器、替换失效浏览器时不超过池大小
+"""
+
+import threading
+import time
+
+import pytest
+
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    """替身浏览器：记录加载的页面和是否已关闭，JS堆占用在回到空白页时清零（与Chrome一致）"""
+
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+        self.heap = 0
+
+    def get(self, url):
+        self.pages.append(url)
+        if url == 'about:blank':
+            self.heap = 0
+
+    def execute_script(self, script):
+        if self.closed:
+            raise RuntimeError("浏览器已关闭")
+        return self.heap if 'memory' in script else 1
+
+    def quit(self):
+        self.closed = True
+
+
+class FakeFactory:
+    """统计创建次数的替身工厂，gate未打开时阻塞以模拟Chrome冷启动"""
+
+    def __init__(self, fail=False):
+        self.created = []
+        self.fail = fail
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def __call__(self):
+        self.gate.wait(5)
+        if self.fail:
+            raise RuntimeError("Chrome启动失败")
+        driver = FakeDriver()
+        self.created.append(driver)
+        return driver
+
+
+@pytest.fixture
+def pool():
+    pool = DriverPool(size=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_first_lease_reuses_prewarmed_driver(pool):
+    factory = FakeFactory()
+    pool.prewarm(factory).join(5)
+    assert len(pool.idle) == 1
+
+    with pool.lease(factory, timeout=1) as driver:
+        assert driver is factory.created[0]
+    assert len(factory.created) == 1
+
+
+def test_lease_waits_for_prewarm_in_progress(pool):
+    factory = FakeFactory()
+    factory.gate.clear()
+    thread = pool.prewarm(factory)
+
+    leased = []
+    lease_thread = threading.Thread(target=lambda: leased.append(pool._acquire(factory, timeout=5)))
+    lease_thread.start()
+    factory.gate.set()
+    thread.join(5)
+    lease_thread.join(5)
+
+    assert len(factory.created) == 1
+    assert leased[0].driver is factory.created[0]
+    pool._release(leased[0])
+
+
+def test_prewarm_skipped_when_pool_is_full(pool):
+    factory = FakeFactory()
+    pool.prewarm(factory).join(5)
+    assert pool.prewarm(factory) is None
+    assert len(factory.created) == 1
+
+
+def test_failed_prewarm_frees_the_slot(pool):
+    pool.prewarm(FakeFactory(fail=True)).join(5)
+    assert pool.total == 0
+
+    factory = FakeFactory()
+    with pool.lease(factory, timeout=1) as driver:
+        assert driver is factory.created[0]
+
+
+def test_prewarmed_driver_closed_when_pool_shuts_down_first(pool):
+    factory = FakeFactory()
+    factory.gate.clear()
+    thread = pool.prewarm(factory)
+    pool.shutdown()
+    factory.gate.set()
+    thread.join(5)
+
+    assert factory.created[0].closed
+    assert pool.total == 0
+
+
+def test_driver_recycled_after_page_limit():
+    pool = DriverPool(size=1, max_pages=2)
+    factory = FakeFactory()
+    with pool.lease(factory, timeout=1) as driver:
+        pool.record_page(driver)
+    assert not driver.closed
+
+    with pool.lease(factory, timeout=1) as driver:
+        pool.record_page(driver)
+    assert driver.closed
+    assert pool.total == 0
+
+    with pool.lease(factory, timeout=1) as driver:
+        assert driver is factory.created[1]
+    pool.shutdown()
+
+
+def test_driver_recycled_after_heap_growth():
+    pool = DriverPool(size=1, max_heap_growth_mb=1)
+    factory = FakeFactory()
+    with pool.lease(factory, timeout=1) as driver:
+        driver.heap = 512 * 1024
+    assert not driver.closed
+
+    with pool.lease(factory, timeout=1) as driver:
+        driver.heap = 2 * 1024 * 1024
+    assert driver.closed
+    assert pool.total == 0
+    pool.shutdown()
+
+
+def test_unhealthy_driver_replaced_without_exceeding_size(pool):
+    factory = FakeFactory()
+    with pool.lease(factory, timeout=1) as driver:
+        pass
+    driver.closed = True
+
+    factory.gate.clear()
+    leased = []
+    replacer = threading.Thread(target=lambda: leased.append(pool._acquire(factory, timeout=5)))
+    replacer.start()
+    while pool.idle:
+        time.sleep(0.01)
+    # 替换进行中时名额仍被占用，其他租用方只能等待
+    with pytest.raises(TimeoutError):
+        pool._acquire(factory, timeout=0.2)
+    factory.gate.set()
+    replacer.join(5)
+
+    assert len(factory.created) == 2
+    assert pool.total == 1
+    pool._release(leased[0])
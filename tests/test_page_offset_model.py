@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+索引页偏移模型测试
+模拟每5分钟一篇新闻、每页20篇、第1页最新新闻已是2小时前的索引，检查预测页码计入第1页偏移
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from page_offset_model import PageOffsetModel
+
+ITEM_INTERVAL = 300
+PAGE_SIZE = 20
+PAGE_ONE_OFFSET = 7200
+
+
+def observe(model: PageOffsetModel, now: datetime, pages):
+    """按模拟的索引记录若干页的观测"""
+    for page in pages:
+        newest = now - timedelta(seconds=PAGE_ONE_OFFSET + (page - 1) * PAGE_SIZE * ITEM_INTERVAL)
+        oldest = newest - timedelta(seconds=(PAGE_SIZE - 1) * ITEM_INTERVAL)
+        model.record(page, newest, oldest, PAGE_SIZE)
+
+
+def test_prediction_accounts_for_page_one_offset(tmp_path):
+    model = PageOffsetModel(str(tmp_path / 'offsets.json'))
+    now = datetime.fromtimestamp(time.time(), timezone.utc)
+    observe(model, now, [1, 2, 5, 9])
+
+    assert model.seconds_per_page() == PAGE_SIZE * ITEM_INTERVAL
+    assert abs(model.page_one_offset(PAGE_SIZE * ITEM_INTERVAL) - PAGE_ONE_OFFSET) < 5
+
+    # 目标时刻位于第4页的时间范围内
+    day_end = now - timedelta(seconds=PAGE_ONE_OFFSET + 3 * PAGE_SIZE * ITEM_INTERVAL + 600)
+    assert model.predict(day_end, now) == 4
+
+    # 比第1页最新新闻还新的时刻在第1页
+    assert model.predict(now - timedelta(seconds=PAGE_ONE_OFFSET / 2), now) == 1
+
+
+def test_offset_survives_reload(tmp_path):
+    path = str(tmp_path / 'offsets.json')
+    model = PageOffsetModel(path)
+    now = datetime.fromtimestamp(time.time(), timezone.utc)
+    observe(model, now, [3, 4])
+    model.save()
+
+    reloaded = PageOffsetModel(path)
+    assert abs(reloaded.page_one_offset(PAGE_SIZE * ITEM_INTERVAL) - PAGE_ONE_OFFSET) < 5
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP传输层模块
+构建连接池大小与并发数匹配、保持长连接并协商压缩的requests会话，
+并统计连接复用情况和传输/解压字节数
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+class TransportStats:
+    """传输统计：请求数、新建连接数、线上字节数与解压后字节数"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.new_connections = 0
+    
+    def record_connection(self):
+        """记录一次新建连接（包括长连接断开后的重连）"""
+        with self.lock:
+            self.new_connections += 1
+    
+    def record(self, wire_bytes: int, decoded_bytes: int):
+        """记录一次响应的字节数
+        
+        Args:
+            wire_bytes: 线上传输的字节数（压缩后）
+            decoded_bytes: 解压后的字节数
+        """
+        with self.lock:
+            self.requests += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+    
+    def summary(self) -> str:
+        """传输统计摘要"""
+        with self.lock:
+            reused = max(0, self.requests - self.new_connections)
+            reuse_rate = reused / self.requests * 100 if self.requests else 0.0
+            ratio = self.decoded_bytes / self.wire_bytes if self.wire_bytes else 0.0
+            return (f"请求 {self.requests} 次，新建连接 {self.new_connections} 个，连接复用率 {reuse_rate:.0f}%，"
+                    f"传输 {self.wire_bytes / 1024:.0f}KB，解压后 {self.decoded_bytes / 1024:.0f}KB "
+                    f"(压缩比 {ratio:.1f}x)")
+
+
+def _counting_pool_class(pool_cls, stats: TransportStats):
+    """派生在建立socket时计数的urllib3连接池类"""
+    
+    class CountingConnection(pool_cls.ConnectionCls):
+        def connect(self):
+            stats.record_connection()
+            super().connect()
+    
+    class CountingConnectionPool(pool_cls):
+        ConnectionCls = CountingConnection
+    
+    return CountingConnectionPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """统计新建连接数的HTTPAdapter"""
+    
+    def __init__(self, stats: TransportStats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # pool_classes_by_scheme默认指向urllib3的模块级字典，替换为副本避免影响其他会话
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(pool_cls, self.stats)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class HttpTransport:
+    """带连接池调优和统计的requests会话封装"""
+    
+    def __init__(self, pool_size: int, keep_alive: bool = True, compression: bool = True,
+                 headers: Optional[Dict[str, str]] = None):
+        """初始化传输层
+        
+        Args:
+            pool_size: 每个主机的连接池大小，应不小于同时发请求的线程数
+            keep_alive: 是否在请求之间保持连接
+            compression: 是否协商gzip/deflate（以及可用时的brotli）压缩
+            headers: 会话默认请求头
+        """
+        self.pool_size = max(1, pool_size)
+        self.stats = TransportStats()
+        
+        self.adapter = _CountingAdapter(self.stats, pool_connections=10, pool_maxsize=self.pool_size, max_retries=0)
+        self.session = requests.Session()
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        
+        if headers:
+            self.session.headers.update(headers)
+        # ACCEPT_ENCODING只包含当前环境能解码的算法（安装brotli后包含br）
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING if compression else 'identity'
+        self.session.headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """发起GET请求，读取完整响应并记录传输统计"""
+        response = self.session.get(url, **kwargs)
+        decoded = len(response.content)
+        try:
+            wire = response.raw.tell()
+        except Exception:
+            wire = decoded
+        self.stats.record(wire or decoded, decoded)
+        return response